@@ -0,0 +1,169 @@
+import os
+import time
+import random
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Status HTTP yang layak diulang: rate limit dan gangguan sementara di sisi Apify
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_BACKOFF = 60
+CACHE_MAX_ENTRIES = 1000
+
+class ApifyAPIClient:
+    """
+    Klien HTTP bersama untuk Apify API.
+    
+    Semua pemanggilan memakai satu requests.Session dengan pool koneksi keep-alive sehingga
+    polling banyak run tidak melakukan handshake TLS berulang. Konfigurasi dari environment
+    dibaca sekali lalu di-cache. Timeout, gagal koneksi dan status 429/5xx diulang dengan
+    exponential backoff plus jitter agar banyak worker tidak mengulang secara serempak.
+    """
+    
+    def __init__(self, pool_size=None):
+        self.pool_size = pool_size or int(os.getenv('APIFY_POOL_SIZE', '20'))
+        self._config = None
+        self._session = None
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._cache_locks = {}
+    
+    @property
+    def config(self):
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = self.load_config()
+        return self._config
+    
+    @staticmethod
+    def load_config():
+        """Baca dan validasi konfigurasi Apify dari environment variable"""
+        config = {
+            'api_token': os.getenv('APIFY_API_TOKEN'),
+            'base_url': os.getenv('APIFY_BASE_URL', 'https://api.apify.com/v2'),
+            'actors': {
+                'twitter': os.getenv('APIFY_TWITTER_ACTOR', 'kaitoeasyapi/twitter-x-data-tweet-scraper-pay-per-result-cheapest'),
+                'facebook': os.getenv('APIFY_FACEBOOK_ACTOR', 'apify/facebook-scraper'),
+                'instagram': os.getenv('APIFY_INSTAGRAM_ACTOR', 'apify/instagram-scraper'),
+                'tiktok': os.getenv('APIFY_TIKTOK_ACTOR', 'clockworks/free-tiktok-scraper')
+            },
+            'timeout': int(os.getenv('APIFY_TIMEOUT', '30')),  # Default 30 detik
+            'max_retries': int(os.getenv('APIFY_MAX_RETRIES', '3')),  # Default 3 percobaan
+            'retry_delay': int(os.getenv('APIFY_RETRY_DELAY', '5')),  # Dasar backoff 5 detik
+            'page_size': int(os.getenv('APIFY_PAGE_SIZE', '1000')),  # Item dataset per halaman
+            'progress_cache_ttl': int(os.getenv('APIFY_PROGRESS_CACHE_TTL', '5'))  # Cache progress per run (detik)
+        }
+        
+        if not config['api_token']:
+            raise Exception("APIFY_API_TOKEN tidak dikonfigurasi. Silakan set environment variable APIFY_API_TOKEN.")
+        
+        return config
+    
+    def reload_config(self):
+        """Buang cache konfigurasi; dibaca ulang pada pemanggilan berikutnya"""
+        with self._lock:
+            self._config = None
+    
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    # Retry ditangani sendiri agar bisa memakai backoff + jitter
+                    adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+    
+    def request(self, method, path, timeout=None, retry_statuses=RETRY_STATUS_CODES, **kwargs):
+        """
+        Kirim request ke Apify dan return response terakhir. Timeout/ConnectionError dilempar
+        ulang setelah percobaan habis sehingga pemanggil tetap bisa memberi pesan yang sesuai.
+        """
+        config = self.config
+        url = path if path.startswith('http') else f"{config['base_url']}/{path.lstrip('/')}"
+        headers = {'Authorization': f"Bearer {config['api_token']}"}
+        headers.update(kwargs.pop('headers', None) or {})
+        attempts = max(1, config['max_retries'])
+        
+        for attempt in range(attempts):
+            try:
+                response = self.session.request(method, url, headers=headers, timeout=timeout or config['timeout'], **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if attempt == attempts - 1:
+                    raise
+                logger.warning(f"Apify {method} {path} gagal (percobaan {attempt + 1}/{attempts}): {str(e)}")
+                self._backoff(attempt, config)
+                continue
+            
+            if response.status_code in retry_statuses and attempt < attempts - 1:
+                logger.warning(f"Apify {method} {path} HTTP {response.status_code} (percobaan {attempt + 1}/{attempts})")
+                self._backoff(attempt, config, response.headers.get('Retry-After'))
+                continue
+            return response
+    
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+    
+    def post(self, path, **kwargs):
+        return self.request('POST', path, **kwargs)
+    
+    def get_cached(self, key, loader, ttl):
+        """
+        Ambil nilai dari cache TTL in-process atau panggil loader() sekali. Pemanggil paralel
+        untuk key yang sama (mis. beberapa tab browser) menunggu satu panggilan upstream yang
+        sama. loader mengembalikan (value, ttl_override); ttl_override None memakai ttl,
+        0 berarti hasil tidak di-cache.
+        """
+        with self._lock:
+            key_lock = self._cache_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            
+            value, ttl_override = loader()
+            ttl = ttl if ttl_override is None else ttl_override
+            if ttl > 0:
+                self._cache[key] = (time.monotonic() + ttl, value)
+        
+        if len(self._cache) > CACHE_MAX_ENTRIES:
+            self._prune_cache()
+        return value
+    
+    def close(self):
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+    
+    def _prune_cache(self):
+        now = time.monotonic()
+        with self._lock:
+            for key in [key for key, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                self._cache.pop(key, None)
+                key_lock = self._cache_locks.get(key)
+                if key_lock is not None and not key_lock.locked():
+                    self._cache_locks.pop(key, None)
+    
+    @staticmethod
+    def _backoff(attempt, config, retry_after=None):
+        # Exponential backoff dengan "equal jitter": setengah tetap, setengah acak
+        delay = min(MAX_BACKOFF, config['retry_delay'] * (2 ** attempt))
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if retry_after:
+            try:
+                delay = max(delay, min(MAX_BACKOFF, float(retry_after)))
+            except ValueError:
+                pass
+        time.sleep(delay)
+
+# Instance global klien Apify
+apify_api = ApifyAPIClient()
@@ -54,6 +54,12 @@ pass
 from models import db
 from flask_migrate import Migrate
 from scheduler import cleanup_scheduler
+from prediction_cache import prediction_cache
+from near_duplicate import near_duplicate_index
+from background_jobs import background_job_runner
+from ingestion import run_upload_ingestion_job, resume_ingestion_jobs
+from scraping_jobs import SCRAPING_JOB_NAME, run_scraping_job, resume_scraping_jobs
+from model_loader import model_loader
 from security_middleware import SecurityMiddleware
 
 db.init_app(app)
@@ -76,6 +82,18 @@ limiter = Limiter(
 # Initialize scheduler
 cleanup_scheduler.init_app(app)
 
+# Initialize prediction cache
+prediction_cache.init_app(app)
+
+# Initialize near-duplicate index
+near_duplicate_index.init_app(app)
+
+# Initialize background jobs (thread pool, or Celery worker: celery -A app.celery worker)
+background_job_runner.init_app(app)
+background_job_runner.register('upload_ingestion', run_upload_ingestion_job)
+background_job_runner.register(SCRAPING_JOB_NAME, run_scraping_job)
+celery = background_job_runner.celery
+
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
@@ -89,26 +107,6 @@ os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 with app.app_context():
     db.create_all()
 
-# Initialize model variables
-word2vec_model = None
-naive_bayes_models = {}
-
-# Function to load models within app context
-def load_models():
-    global word2vec_model, naive_bayes_models
-    with app.app_context():
-        pass
-        try:
-            from utils import load_word2vec_model, load_naive_bayes_models
-            word2vec_model = load_word2vec_model()
-            naive_bayes_models = load_naive_bayes_models()
-            pass
-        except Exception as e:
-            pass
-            # Set empty models if loading fails
-            word2vec_model = None
-            naive_bayes_models = {}
-
 # Models already imported above
 
 # Register template filters with error handling
@@ -152,10 +150,12 @@ def load_user(user_id):
     from models import User
     return User.query.get(int(user_id))
 
-# Load models and initialize routes
-load_models()
+# Initialize routes first; models are loaded in the background and
+# classification endpoints answer 503 until they are ready
 from routes import init_routes
-init_routes(app, word2vec_model, naive_bayes_models)
+init_routes(app, None, {})
+model_loader.init_app(app)
+model_loader.start()
 
 # Register OTP blueprint
 app.register_blueprint(otp_bp, url_prefix='/otp')
@@ -168,9 +168,30 @@ if __name__ == '__main__':
     cleanup_scheduler.start_scheduler()
     logger.info("Automatic data cleanup scheduler started")
     
+    # Use debug mode from environment variable
+    debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    
+    # Scraping jobs polled by the in-process thread pool are lost on restart; schedule them again.
+    # With the reloader only the serving child (WERKZEUG_RUN_MAIN) resumes jobs, not the watcher parent
+    if background_job_runner.backend == 'thread' and (not debug_mode or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'):
+        with app.app_context():
+            try:
+                resumed = resume_scraping_jobs()
+                if resumed:
+                    logger.info(f"Resumed {resumed} unfinished scraping jobs")
+            except Exception as e:
+                logger.warning(f"Could not resume scraping jobs: {e}")
+            
+            # Same for upload ingestion; jobs whose owner died mid-way cannot be re-run and are failed
+            try:
+                resubmitted, failed = resume_ingestion_jobs()
+                if resubmitted or failed:
+                    logger.info(f"Resubmitted {resubmitted} pending ingestion jobs, failed {failed} interrupted ones")
+            except Exception as e:
+                db.session.rollback()
+                logger.warning(f"Could not resume ingestion jobs: {e}")
+    
     try:
-        # Use debug mode from environment variable
-        debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
         app.run(debug=debug_mode, host='0.0.0.0', port=5000)
     except KeyboardInterrupt:
         logger.info("Shutting down application...")
@@ -0,0 +1,183 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class BackgroundJobRunner:
+    """
+    Menjalankan job panjang (mis. ingestion file upload) di luar request web.
+    
+    Backend 'thread' memakai ThreadPoolExecutor di proses web (cukup untuk satu node),
+    'celery' mengirim job ke worker Celery lewat broker Redis, dan 'sync' menjalankan
+    job langsung di request (debugging/test). Job diidentifikasi dengan nama handler dan
+    id baris job di database (ditambah argumen opsional yang bisa diserialisasi JSON, mis.
+    generasi polling); handler sendiri yang menyimpan status dan progress.
+    
+    Job yang menunggu layanan eksternal (mis. polling run Apify) tidak tidur di worker:
+    handler menjadwalkan ulang dirinya dengan submit(..., delay=detik) sehingga slot pool
+    hanya terpakai selama satu kali pengecekan.
+    """
+    
+    TASK_NAME = 'waskita.run_background_job'
+    BACKENDS = ('thread', 'celery', 'sync')
+    
+    def __init__(self, app=None):
+        self.app = app
+        self.backend = 'thread'
+        self.max_workers = 2
+        self.celery = None
+        self._celery_task = None
+        self._handlers = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        self._delayed = []
+        self._delayed_sequence = itertools.count()
+        self._delayed_condition = threading.Condition()
+        self._delayed_thread = None
+        self._stopping = False
+        self._sync_local = threading.local()
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.max_workers = app.config.get('BACKGROUND_JOB_WORKERS', 2)
+        
+        backend = app.config.get('BACKGROUND_JOB_BACKEND', 'thread')
+        if backend not in self.BACKENDS:
+            logger.warning(f"BACKGROUND_JOB_BACKEND '{backend}' tidak dikenal, memakai thread")
+            backend = 'thread'
+        
+        if backend == 'celery':
+            try:
+                self._init_celery(app)
+                logger.info("Background job memakai backend Celery")
+            except Exception as e:
+                # Tetap jalan dengan thread pool di proses web
+                logger.warning(f"Celery tidak tersedia untuk background job, memakai thread pool: {str(e)}")
+                backend = 'thread'
+        
+        self.backend = backend
+    
+    def register(self, name, handler):
+        """Daftarkan handler job; handler menerima job_id dan berjalan di dalam app context"""
+        self._handlers[name] = handler
+        return handler
+    
+    def submit(self, name, job_id, *args, delay=None):
+        """Jadwalkan job (opsional setelah delay detik), return nama backend yang dipakai"""
+        if name not in self._handlers:
+            raise ValueError(f'Handler background job tidak dikenal: {name}')
+        
+        if self.backend == 'celery':
+            if delay:
+                self._celery_task.apply_async(args=(name, job_id, *args), countdown=delay)
+            else:
+                self._celery_task.delay(name, job_id, *args)
+        elif self.backend == 'sync':
+            self._run_sync(delay, name, job_id, args)
+        elif delay:
+            self._schedule_delayed(delay, name, job_id, args)
+        else:
+            self._get_executor().submit(self.run, name, job_id, *args)
+        return self.backend
+    
+    def run(self, name, job_id, *args):
+        """Jalankan handler di app context (dipanggil oleh thread pool atau worker Celery)"""
+        with self.app.app_context():
+            try:
+                return self._handlers[name](job_id, *args)
+            except Exception as e:
+                logger.error(f"Background job {name}#{job_id} gagal: {str(e)}")
+    
+    def shutdown(self, wait=True):
+        with self._delayed_condition:
+            # Job tertunda di thread pool hilang; handler yang persisten bisa di-resume saat start
+            self._stopping = True
+            self._delayed = []
+            self._delayed_condition.notify_all()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='background-job')
+            return self._executor
+    
+    def _schedule_delayed(self, delay, name, job_id, args=()):
+        """Simpan job tertunda di heap; satu thread timer menyerahkannya ke pool saat jatuh tempo"""
+        with self._delayed_condition:
+            self._stopping = False
+            heapq.heappush(self._delayed, (time.monotonic() + delay, next(self._delayed_sequence), name, job_id, args))
+            if self._delayed_thread is None or not self._delayed_thread.is_alive():
+                self._delayed_thread = threading.Thread(target=self._run_delayed, name='background-job-timer', daemon=True)
+                self._delayed_thread.start()
+            self._delayed_condition.notify()
+    
+    def _run_delayed(self):
+        while True:
+            with self._delayed_condition:
+                while not self._stopping and (not self._delayed or self._delayed[0][0] > time.monotonic()):
+                    timeout = self._delayed[0][0] - time.monotonic() if self._delayed else None
+                    self._delayed_condition.wait(timeout)
+                if self._stopping:
+                    return
+                _, _, name, job_id, args = heapq.heappop(self._delayed)
+            self._get_executor().submit(self.run, name, job_id, *args)
+    
+    def _run_sync(self, delay, name, job_id, args=()):
+        """
+        Jalankan job di thread pemanggil. Job yang disubmit dari dalam handler (mis. polling
+        berikutnya) masuk antrean dan dijalankan setelah handler selesai, bukan secara rekursif,
+        sehingga polling panjang tidak menumpuk stack.
+        """
+        queue = getattr(self._sync_local, 'queue', None)
+        if queue is not None:
+            queue.append((delay, name, job_id, args))
+            return
+        
+        queue = self._sync_local.queue = deque([(delay, name, job_id, args)])
+        try:
+            while queue:
+                delay, name, job_id, args = queue.popleft()
+                if delay:
+                    time.sleep(delay)
+                self.run(name, job_id, *args)
+        finally:
+            self._sync_local.queue = None
+    
+    def _init_celery(self, app):
+        from celery import Celery
+        
+        broker_url = app.config.get('CELERY_BROKER_URL')
+        if not broker_url:
+            raise Exception('CELERY_BROKER_URL belum diatur')
+        
+        celery = Celery(app.import_name, broker=broker_url)
+        celery.conf.update(
+            task_ignore_result=True,
+            # Job panjang: ambil satu per worker dan ack setelah selesai agar tidak hilang saat worker mati
+            task_acks_late=True,
+            worker_prefetch_multiplier=1
+        )
+        
+        runner = self
+        
+        @celery.task(name=self.TASK_NAME)
+        def run_background_job(name, job_id, *args):
+            runner.run(name, job_id, *args)
+        
+        self.celery = celery
+        self._celery_task = run_background_job
+
+# Instance global background job runner
+background_job_runner = BackgroundJobRunner()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark normalisasi hasil Apify (process_apify_results) dengan item sintetis per platform
+dari fake_apify_server (berjalan offline)
+
+Contoh:
+    python benchmark_apify_results.py --items 100000
+    python benchmark_apify_results.py --items 100000 --output sebelum.json
+    python benchmark_apify_results.py --items 100000 --compare sebelum.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import process_apify_results, iter_processed_apify_results
+from fake_apify_server import PLATFORMS, build_item
+from benchmark_pipeline import get_peak_rss_mb
+
+def build_items(platform, count):
+    """Item sintetis dengan skema actor platform (sama dengan yang dikirim fake Apify API)"""
+    run = {'id': f'bench-{platform}', 'platform': platform, 'keyword': 'benchmark', 'started_at': datetime(2026, 1, 1)}
+    return [build_item(run, index) for index in range(count)]
+
+def run_platform(platform, count, repeat):
+    """Waktu terbaik dari beberapa ulangan untuk list (process_apify_results) dan generator"""
+    items = build_items(platform, count)
+    stats = {}
+    for name, func in (('list', lambda: process_apify_results(items, platform)),
+                       ('stream', lambda: sum(1 for _ in iter_processed_apify_results(iter(items), platform)))):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        stats[name] = {
+            'items': count,
+            'seconds': round(best, 4),
+            'items_per_sec': round(count / best, 1) if best > 0 else None
+        }
+    record = process_apify_results(items[:1], platform)[0]
+    return {'platform': platform, 'stages': stats, 'columns': len(record), 'record_bytes': len(json.dumps(record, default=str))}
+
+def print_report(results, baseline=None):
+    baseline_by_platform = {result['platform']: result for result in (baseline or [])}
+    print(f"\n  {'platform':<12}{'tahap':<10}{'item':>10}{'item/detik':>14}{'kolom':>8}{'vs acuan':>10}")
+    for result in results:
+        before = baseline_by_platform.get(result['platform'], {}).get('stages', {})
+        for stage, stats in result['stages'].items():
+            speedup = ''
+            if stage in before and before[stage].get('items_per_sec') and stats.get('items_per_sec'):
+                speedup = f"{stats['items_per_sec'] / before[stage]['items_per_sec']:.2f}x"
+            print(f"  {result['platform']:<12}{stage:<10}{stats['items']:>10,}{stats['items_per_sec'] or 0:>14,.0f}"
+                  f"{result['columns']:>8}{speedup:>10}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Benchmark normalisasi hasil Apify')
+    parser.add_argument('--items', type=int, default=100000, help='Jumlah item per platform')
+    parser.add_argument('--platforms', default=','.join(PLATFORMS), help='Platform, pisahkan dengan koma')
+    parser.add_argument('--repeat', type=int, default=3, help='Ulangan per tahap (diambil yang tercepat)')
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    parser.add_argument('--compare', help='File JSON hasil sebelumnya sebagai acuan')
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("WASKITA - Benchmark Normalisasi Hasil Apify")
+    print("=" * 50)
+    
+    results = []
+    for platform in [platform.strip() for platform in args.platforms.split(',') if platform.strip()]:
+        print(f"Menjalankan {args.items:,} item {platform}...", flush=True)
+        results.append(run_platform(platform, args.items, args.repeat))
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+    
+    print_report(results, baseline)
+    print(f"\nPeak RSS: {get_peak_rss_mb()} MB")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'results': results}, f, indent=2)
+        print(f"\n✓ Hasil disimpan ke {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark jalur clean -> vectorize -> classify dengan korpus media sosial sintetis
+dan model Word2Vec/Naive Bayes kecil yang dilatih di tempat (berjalan offline)
+
+Contoh:
+    python benchmark_pipeline.py --sizes 1000,10000,100000
+    python benchmark_pipeline.py --sizes 1000,1000000 --output sebelum.json
+    python benchmark_pipeline.py --sizes 1000,1000000 --compare sebelum.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import (generate_sample_data, clean_text, clean_texts, preprocess_for_word2vec,
+                   vectorize_text, vectorize_texts, classify_content, classify_contents)
+
+PLATFORMS = ['twitter', 'facebook', 'instagram', 'tiktok']
+NEUTRAL_KEYWORDS = ['teknologi', 'pendidikan', 'kuliner', 'pemilu', 'sepakbola', 'ekonomi']
+RADICAL_KEYWORDS = ['jihad', 'khilafah', 'kafir', 'bom', 'thogut', 'perang suci']
+TRAINING_ROWS = 5000
+CHUNK_SIZE = 200
+
+def build_corpus(size, seed=42):
+    """
+    Korpus sintetis berlabel dari generate_sample_data (noisy). Label 'Radikal' jika
+    konten dibuat dengan kata kunci radikal.
+    """
+    keywords = [(keyword, 'Non-Radikal') for keyword in NEUTRAL_KEYWORDS] + \
+               [(keyword, 'Radikal') for keyword in RADICAL_KEYWORDS]
+    texts = []
+    labels = []
+    chunk_index = 0
+    while len(texts) < size:
+        platform = PLATFORMS[chunk_index % len(PLATFORMS)]
+        keyword, label = keywords[chunk_index % len(keywords)]
+        count = min(CHUNK_SIZE, size - len(texts))
+        posts = generate_sample_data(platform, keyword, num_posts=count, seed=seed + chunk_index, noisy=True)
+        texts.extend(post['content'] for post in posts)
+        labels.extend([label] * len(posts))
+        chunk_index += 1
+    return texts, labels
+
+def train_tiny_models(texts, labels, vector_size=100, seed=42):
+    """Word2Vec kecil + 3 model Gaussian Naive Bayes dengan smoothing berbeda"""
+    from gensim.models import Word2Vec
+    from sklearn.naive_bayes import GaussianNB
+    
+    sentences = [preprocess_for_word2vec(text) for text in texts]
+    word2vec_model = Word2Vec(sentences, vector_size=vector_size, min_count=1, epochs=5, seed=seed, workers=1)
+    
+    vectors = vectorize_texts(texts, word2vec_model, vector_size)
+    naive_bayes_models = {}
+    for index, var_smoothing in enumerate((1e-9, 1e-6, 1e-3), start=1):
+        naive_bayes_models[f'model{index}'] = GaussianNB(var_smoothing=var_smoothing).fit(vectors, labels)
+    return word2vec_model, naive_bayes_models
+
+def get_peak_rss_mb():
+    """Peak RSS proses saat ini dalam MB (None jika tidak didukung OS)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    if sys.platform == 'darwin':
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+def time_per_row(func, items):
+    """Jalankan func per item, return (hasil, statistik latensi)"""
+    results = []
+    latencies = np.empty(len(items), dtype=np.float64)
+    started = time.perf_counter()
+    for index, item in enumerate(items):
+        item_started = time.perf_counter()
+        results.append(func(item))
+        latencies[index] = time.perf_counter() - item_started
+    elapsed = time.perf_counter() - started
+    return results, summarize(len(items), elapsed, latencies)
+
+def time_batch(func, items):
+    """Jalankan func sekali untuk seluruh batch"""
+    started = time.perf_counter()
+    result = func(items)
+    elapsed = time.perf_counter() - started
+    return result, summarize(len(items), elapsed)
+
+def summarize(rows, elapsed, latencies=None):
+    stats = {
+        'rows': rows,
+        'seconds': round(elapsed, 4),
+        'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else None
+    }
+    if latencies is not None and len(latencies):
+        stats['p50_ms'] = round(float(np.percentile(latencies, 50)) * 1000, 4)
+        stats['p99_ms'] = round(float(np.percentile(latencies, 99)) * 1000, 4)
+    return stats
+
+def run_size(size, per_row_limit, vector_size, seed):
+    """Benchmark satu ukuran korpus di proses ini"""
+    corpus_started = time.perf_counter()
+    texts, labels = build_corpus(size, seed)
+    corpus_seconds = time.perf_counter() - corpus_started
+    
+    training_rows = min(size, TRAINING_ROWS)
+    word2vec_model, naive_bayes_models = train_tiny_models(texts[:training_rows], labels[:training_rows], vector_size, seed)
+    
+    # Tahap per baris (latensi p50/p99) memakai maksimal per_row_limit baris
+    sample = texts[:min(size, per_row_limit)]
+    stages = {}
+    cleaned_sample, stages['clean_text'] = time_per_row(clean_text, sample)
+    _, stages['preprocess_for_word2vec'] = time_per_row(preprocess_for_word2vec, cleaned_sample)
+    vectors_sample, stages['vectorize_text'] = time_per_row(
+        lambda text: vectorize_text(text, word2vec_model, vector_size), cleaned_sample)
+    _, stages['classify_content'] = time_per_row(
+        lambda vector: classify_content(vector, naive_bayes_models['model1']), vectors_sample)
+    
+    # Tahap batch memakai seluruh korpus
+    cleaned, stages['clean_texts'] = time_batch(clean_texts, texts)
+    vectors, stages['vectorize_texts'] = time_batch(
+        lambda items: vectorize_texts(items, word2vec_model, vector_size), cleaned)
+    _, stages['classify_contents'] = time_batch(
+        lambda matrix: classify_contents(matrix, naive_bayes_models), vectors)
+    
+    return {
+        'size': size,
+        'corpus_seconds': round(corpus_seconds, 2),
+        'vocab_size': len(word2vec_model.wv),
+        'stages': stages,
+        'peak_rss_mb': get_peak_rss_mb()
+    }
+
+def run_isolated(size, args):
+    """Jalankan satu ukuran di subprocess agar peak RSS tidak tercampur antar ukuran"""
+    command = [sys.executable, os.path.abspath(__file__), '--single', str(size),
+               '--per-row-limit', str(args.per_row_limit), '--vector-size', str(args.vector_size),
+               '--seed', str(args.seed)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def print_report(results, baseline=None):
+    baseline_by_size = {result['size']: result for result in (baseline or [])}
+    for result in results:
+        print(f"\nKorpus {result['size']:,} baris (vocab {result['vocab_size']}, peak RSS {result['peak_rss_mb']} MB)")
+        print(f"  {'tahap':<26}{'baris':>10}{'baris/detik':>14}{'p50 ms':>10}{'p99 ms':>10}{'vs acuan':>10}")
+        before = baseline_by_size.get(result['size'], {}).get('stages', {})
+        for stage, stats in result['stages'].items():
+            speedup = ''
+            if stage in before and before[stage].get('rows_per_sec') and stats.get('rows_per_sec'):
+                speedup = f"{stats['rows_per_sec'] / before[stage]['rows_per_sec']:.2f}x"
+            print(f"  {stage:<26}{stats['rows']:>10,}{stats['rows_per_sec'] or 0:>14,.0f}"
+                  f"{stats.get('p50_ms', ''):>10}{stats.get('p99_ms', ''):>10}{speedup:>10}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Benchmark clean -> vectorize -> classify')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Ukuran korpus, pisahkan dengan koma (mis. 1000,1000000)')
+    parser.add_argument('--per-row-limit', type=int, default=20000, help='Maksimal baris untuk tahap per baris (latensi)')
+    parser.add_argument('--vector-size', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    parser.add_argument('--compare', help='File JSON hasil sebelumnya sebagai acuan')
+    parser.add_argument('--single', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.single:
+        print(json.dumps(run_size(args.single, args.per_row_limit, args.vector_size, args.seed)))
+        return
+    
+    print("=" * 50)
+    print("WASKITA - Benchmark Pipeline Klasifikasi")
+    print("=" * 50)
+    
+    results = []
+    for size in [int(value) for value in args.sizes.split(',') if value.strip()]:
+        print(f"Menjalankan korpus {size:,} baris...", flush=True)
+        results.append(run_isolated(size, args))
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+    
+    print_report(results, baseline)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'results': results}, f, indent=2)
+        print(f"\n✓ Hasil disimpan ke {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Script untuk memastikan clean_text, clean_texts dan preprocess_for_word2vec
+menghasilkan keluaran yang sama persis dengan golden corpus
+
+Contoh:
+    python check_text_cleaning.py check
+    python check_text_cleaning.py generate   # rekam ulang golden corpus dari implementasi saat ini
+"""
+
+import os
+import sys
+import json
+import random
+import string
+import argparse
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import clean_text, clean_texts, preprocess_for_word2vec
+
+DEFAULT_GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'text_cleaning_golden.json')
+
+# Kasus khusus: URL, mention, hashtag, emoji, whitespace unicode, huruf yang berubah saat lowercase
+HANDWRITTEN_CASES = [
+    "",
+    "   ",
+    "Saya suka makan nasi goreng",
+    "RT @user_1: Ini berita terbaru https://t.co/AbC123 tentang #Pemilu2024 😀😀 sangat... menarik!!",
+    "Cek http://example.com/path?q=1&x=%2F%zz lalu www.example.com",
+    "@http://contoh.id/abc",
+    "@xhttp://a.b/c d",
+    "#@foo bar #a@b @ab#cd",
+    "http://x.com#tag @#tag",
+    "Halo👋dunia🇮🇩 ✂ potong ⓐⒶ Ⓘ",
+    "Tab\tbaris\nbaru\r\nnbsp ideografik　pemisah\x1c",
+    "a , b ; c",
+    "İstanbul ẞ Ω K ﬀ ΣΑΣ ς",
+    "中文 한국어 العربية",
+    "Harga Rp.100.000,- (diskon 50%)!!!",
+    "email@domain.com dan #hashtag_123 serta @mention_456",
+    "JIHAD!!! bom... ANCAMAN???",
+    "https://a.b/c!d*e(f),g http://",
+    "____ ---- ''''",
+    "12345",
+]
+
+FUZZ_ALPHABET = list(string.printable) + [
+    ' ', '　', '\x1c', ' ', '😀', '🇮🇩', '✂', 'Ⓐ', 'ⓐ', 'Ⓘ', 'İ', 'é', 'É', '中', 'ß', 'ẞ',
+    'Ω', 'Ω', 'K', 'http://', 'https://', '@', '#', '%2F', '%zz', 'www.', '://', '̇', 'ﬀ', 'Σ', 'ς'
+]
+
+def build_corpus(fuzz_count=1000, seed=42):
+    """Gabungan kasus tulisan tangan dan string acak deterministik"""
+    rnd = random.Random(seed)
+    corpus = list(HANDWRITTEN_CASES)
+    for _ in range(fuzz_count):
+        corpus.append(''.join(rnd.choice(FUZZ_ALPHABET) for _ in range(rnd.randint(0, 40))))
+    return corpus
+
+def generate_golden(path):
+    """Rekam keluaran implementasi saat ini sebagai golden corpus"""
+    records = []
+    for text in build_corpus():
+        cleaned = clean_text(text)
+        records.append({
+            'input': text,
+            'cleaned': cleaned,
+            'tokens': preprocess_for_word2vec(text)
+        })
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False, indent=0)
+    return len(records)
+
+def check_golden(path):
+    """Bandingkan implementasi saat ini dengan golden corpus, return daftar selisih"""
+    with open(path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    
+    mismatches = []
+    batch_cleaned = clean_texts(record['input'] for record in records)
+    
+    for record, cleaned_batch in zip(records, batch_cleaned):
+        text = record['input']
+        cleaned = clean_text(text)
+        
+        if cleaned != record['cleaned']:
+            mismatches.append(('clean_text', text, record['cleaned'], cleaned))
+        if cleaned_batch != record['cleaned']:
+            mismatches.append(('clean_texts', text, record['cleaned'], cleaned_batch))
+        
+        # Tokenisasi teks mentah dan teks yang sudah bersih harus sama dengan pembersihan penuh
+        tokens = preprocess_for_word2vec(text)
+        if tokens != record['tokens']:
+            mismatches.append(('preprocess_for_word2vec', text, record['tokens'], tokens))
+        expected_clean_tokens = [word for word in clean_text(record['cleaned']).split() if len(word) > 1]
+        clean_tokens = preprocess_for_word2vec(record['cleaned'])
+        if clean_tokens != expected_clean_tokens:
+            mismatches.append(('preprocess_for_word2vec(cleaned)', record['cleaned'], expected_clean_tokens, clean_tokens))
+    
+    # Input bukan string
+    for value, expected in ((None, ''), (float('nan'), ''), (0, ''), (12345, '12345'), (2.5, '25'), (True, 'true')):
+        if clean_text(value) != expected:
+            mismatches.append(('clean_text', repr(value), expected, clean_text(value)))
+    
+    return len(records), mismatches
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Cek golden corpus pembersihan teks')
+    parser.add_argument('command', nargs='?', choices=['check', 'generate'], default='check')
+    parser.add_argument('--golden', default=DEFAULT_GOLDEN_PATH, help='Path file golden corpus')
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("WASKITA - Golden Corpus Pembersihan Teks")
+    print("=" * 50)
+    
+    if args.command == 'generate':
+        total = generate_golden(args.golden)
+        print(f"✓ {total} kasus direkam ke {args.golden}")
+        return
+    
+    total, mismatches = check_golden(args.golden)
+    for function_name, text, expected, actual in mismatches[:20]:
+        print(f"✗ {function_name}({text!r}): diharapkan {expected!r}, didapat {actual!r}")
+    
+    if mismatches:
+        print(f"\n✗ {len(mismatches)} selisih dari {total} kasus")
+        sys.exit(1)
+    
+    print(f"✓ Semua {total} kasus sesuai golden corpus")
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,8 @@ class Config:
     
     # File upload settings
     ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
+    # Rows per chunk when streaming uploaded files into raw_data
+    UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', '50000'))
     
     # Pagination
     POSTS_PER_PAGE = 20
@@ -41,6 +43,12 @@ class Config:
     # Model paths - relative to app directory for containerization compatibility
     WORD2VEC_MODEL_PATH = os.getenv('WORD2VEC_MODEL_PATH', 
         os.path.join(os.path.dirname(__file__), 'models', 'embeddings', 'wiki_word2vec_csv_updated.model'))
+    # Open exported KeyedVectors with mmap='r' so workers share embedding pages
+    WORD2VEC_MMAP = os.getenv('WORD2VEC_MMAP', 'True').lower() == 'true'
+    WORD2VEC_KEYED_VECTORS_PATH = os.getenv('WORD2VEC_KEYED_VECTORS_PATH',
+        os.path.splitext(WORD2VEC_MODEL_PATH)[0] + '.kv')
+    # Optional inference-only embeddings exported by export_embeddings.py (float16/int8)
+    WORD2VEC_COMPACT_PATH = os.getenv('WORD2VEC_COMPACT_PATH', '')
     NAIVE_BAYES_MODEL1_PATH = os.getenv('NAIVE_BAYES_MODEL1_PATH', 
         os.path.join(os.path.dirname(__file__), 'models', 'navesbayes', 'naive_bayes_model1.pkl'))
     NAIVE_BAYES_MODEL2_PATH = os.getenv('NAIVE_BAYES_MODEL2_PATH', 
@@ -48,6 +56,43 @@ class Config:
     NAIVE_BAYES_MODEL3_PATH = os.getenv('NAIVE_BAYES_MODEL3_PATH', 
         os.path.join(os.path.dirname(__file__), 'models', 'navesbayes', 'naive_bayes_model3.pkl'))
     
+    # Load models in a background thread so startup does not block on deserialization
+    MODEL_BACKGROUND_LOADING = os.getenv('MODEL_BACKGROUND_LOADING', 'True').lower() == 'true'
+    MODEL_LOADING_RETRY_AFTER = int(os.getenv('MODEL_LOADING_RETRY_AFTER', '10'))
+    # Poll model file versions (size/mtime) and hot reload changed models; 0 disables
+    MODEL_WATCH_INTERVAL = int(os.getenv('MODEL_WATCH_INTERVAL', '60'))
+    
+    # Prediction cache for manual text classification (Redis shared across workers if available)
+    PREDICTION_CACHE_ENABLED = os.getenv('PREDICTION_CACHE_ENABLED', 'True').lower() == 'true'
+    PREDICTION_CACHE_SIZE = int(os.getenv('PREDICTION_CACHE_SIZE', '10000'))
+    PREDICTION_CACHE_TTL = int(os.getenv('PREDICTION_CACHE_TTL', '3600'))
+    PREDICTION_CACHE_REDIS_URL = os.getenv('PREDICTION_CACHE_REDIS_URL', os.getenv('REDIS_URL', ''))
+    
+    # Near-duplicate clustering of cleaned content (MinHash LSH side table)
+    NEAR_DUPLICATE_ENABLED = os.getenv('NEAR_DUPLICATE_ENABLED', 'True').lower() == 'true'
+    NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.8'))
+    # Classify one representative per cluster in bulk classification and copy its result
+    NEAR_DUPLICATE_CLASSIFY_REPRESENTATIVES = os.getenv('NEAR_DUPLICATE_CLASSIFY_REPRESENTATIVES', 'False').lower() == 'true'
+    
+    # Background jobs (upload ingestion, Apify scraping): thread pool in the web process, Celery workers, or sync
+    BACKGROUND_JOB_BACKEND = os.getenv('BACKGROUND_JOB_BACKEND', 'thread')
+    BACKGROUND_JOB_WORKERS = int(os.getenv('BACKGROUND_JOB_WORKERS', '2'))
+    CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', os.getenv('REDIS_URL', ''))
+    # Running ingestion jobs without progress for this long are treated as abandoned at startup
+    INGESTION_JOB_STALE_SECONDS = int(os.getenv('INGESTION_JOB_STALE_SECONDS', '900'))
+    
+    # Background Apify scraping: seconds between run status polls and maximum run duration
+    SCRAPING_POLL_INTERVAL = int(os.getenv('SCRAPING_POLL_INTERVAL', '5'))
+    SCRAPING_MAX_WAIT = int(os.getenv('SCRAPING_MAX_WAIT', '1800'))
+    # Scheduled scrapes: maximum pending/running Apify jobs per platform (SCRAPING_TWITTER_CONCURRENCY etc. override)
+    SCRAPING_PLATFORM_CONCURRENCY = {
+        platform: int(os.getenv(f'SCRAPING_{platform.upper()}_CONCURRENCY', os.getenv('SCRAPING_PLATFORM_CONCURRENCY', '2')))
+        for platform in ('twitter', 'facebook', 'instagram', 'tiktok')
+    }
+    # Keep each run's raw Apify items (gzip) so results can be re-mapped without scraping again
+    SCRAPING_STORE_RAW_ITEMS = os.getenv('SCRAPING_STORE_RAW_ITEMS', 'True').lower() == 'true'
+    SCRAPING_RAW_ITEMS_RETENTION_DAYS = int(os.getenv('SCRAPING_RAW_ITEMS_RETENTION_DAYS', '30'))
+    
     @staticmethod
     def init_app(app):
         pass
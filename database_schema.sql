@@ -50,6 +50,7 @@ CREATE TABLE raw_data (
     id SERIAL PRIMARY KEY,
     username VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
+    content_hash VARCHAR(40), -- SHA-1 of trimmed content for duplicate detection
     url TEXT,
     platform VARCHAR(50) NOT NULL,
     source_type VARCHAR(20) DEFAULT 'upload',
@@ -68,6 +69,7 @@ CREATE TABLE raw_data_scraper (
     id SERIAL PRIMARY KEY,
     username VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
+    content_hash VARCHAR(40), -- SHA-1 of trimmed content for duplicate detection
     url TEXT,
     platform VARCHAR(50) NOT NULL,
     keyword VARCHAR(255) NOT NULL,
@@ -93,6 +95,7 @@ CREATE TABLE clean_data_upload (
     username VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
     cleaned_content TEXT NOT NULL,
+    cleaned_content_hash VARCHAR(40), -- SHA-1 of cleaned_content for duplicate detection
     url TEXT,
     platform VARCHAR(50) NOT NULL,
     dataset_id INTEGER REFERENCES datasets(id),
@@ -107,6 +110,7 @@ CREATE TABLE clean_data_scraper (
     username VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
     cleaned_content TEXT NOT NULL,
+    cleaned_content_hash VARCHAR(40), -- SHA-1 of cleaned_content for duplicate detection
     url TEXT,
     platform VARCHAR(50) NOT NULL,
     keyword VARCHAR(255) NOT NULL,
@@ -138,6 +142,8 @@ CREATE TABLE classification_results (
     probability_radikal FLOAT NOT NULL,
     probability_non_radikal FLOAT NOT NULL,
     classified_by INTEGER NOT NULL REFERENCES users(id),
+    model_version VARCHAR(64), -- Version of the Naive Bayes model file that produced this result
+    embedding_version VARCHAR(64), -- Version of the Word2Vec embeddings used
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     is_corrected BOOLEAN DEFAULT FALSE, -- Whether the result has been manually corrected
@@ -146,6 +152,132 @@ CREATE TABLE classification_results (
     corrected_at TIMESTAMP -- When the correction was made
 );
 
+-- Document Vectors Table (cached Word2Vec document vectors per clean row)
+CREATE TABLE document_vectors (
+    id SERIAL PRIMARY KEY,
+    data_type VARCHAR(20) NOT NULL, -- 'upload' or 'scraper'
+    data_id INTEGER NOT NULL, -- ID from clean_data_upload or clean_data_scraper
+    embedding_version VARCHAR(64) NOT NULL, -- Word2Vec model version that produced the vector
+    content_hash VARCHAR(40) NOT NULL, -- SHA-1 of cleaned_content
+    vector BYTEA NOT NULL, -- float32 document vector
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_document_vectors_data_type_id UNIQUE (data_type, data_id)
+);
+
+-- Near Duplicate Signatures Table (MinHash signature and cluster per clean row)
+CREATE TABLE near_duplicate_signatures (
+    id SERIAL PRIMARY KEY,
+    data_type VARCHAR(20) NOT NULL, -- 'upload' or 'scraper'
+    data_id INTEGER NOT NULL, -- ID from clean_data_upload or clean_data_scraper
+    content_hash VARCHAR(40) NOT NULL, -- SHA-1 of cleaned_content
+    signature BYTEA NOT NULL, -- MinHash signature (uint32 per permutation)
+    cluster_id INTEGER, -- Signature ID of the cluster representative
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_near_duplicate_signatures_data_type_id UNIQUE (data_type, data_id)
+);
+
+-- Near Duplicate Bands Table (LSH band hashes used to find candidate near-duplicates)
+CREATE TABLE near_duplicate_bands (
+    id SERIAL PRIMARY KEY,
+    signature_id INTEGER NOT NULL REFERENCES near_duplicate_signatures(id) ON DELETE CASCADE,
+    band_index SMALLINT NOT NULL,
+    band_hash BIGINT NOT NULL
+);
+
+-- Create Ingestion Jobs table (background upload ingestion progress)
+CREATE TABLE ingestion_jobs (
+    id SERIAL PRIMARY KEY,
+    job_type VARCHAR(20) NOT NULL DEFAULT 'upload',
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed')),
+    backend VARCHAR(20),
+    filename VARCHAR(255),
+    dataset_id INTEGER REFERENCES datasets(id) ON DELETE SET NULL,
+    dataset_name VARCHAR(255),
+    params JSON,
+    total_rows INTEGER DEFAULT 0,
+    rows_read INTEGER DEFAULT 0,
+    rows_inserted INTEGER DEFAULT 0,
+    rows_skipped INTEGER DEFAULT 0,
+    error_message TEXT,
+    created_by INTEGER NOT NULL REFERENCES users(id),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    worker_id VARCHAR(255),
+    last_progress_at TIMESTAMP
+);
+
+-- Create Scheduled Scrapes table (recurring scrape definitions run by scheduler.py)
+CREATE TABLE scheduled_scrapes (
+    id SERIAL PRIMARY KEY,
+    platform VARCHAR(50) NOT NULL,
+    keyword VARCHAR(255) NOT NULL,
+    interval_minutes INTEGER NOT NULL,
+    max_results INTEGER DEFAULT 100,
+    dataset_id INTEGER NOT NULL REFERENCES datasets(id) ON DELETE CASCADE,
+    auto_clean BOOLEAN DEFAULT FALSE,
+    auto_classify BOOLEAN DEFAULT FALSE, -- Implies cleaning first
+    is_active BOOLEAN DEFAULT TRUE,
+    next_run_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_run_at TIMESTAMP,
+    created_by INTEGER NOT NULL REFERENCES users(id),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create Scraping Jobs table (background Apify scraping runs)
+CREATE TABLE scraping_jobs (
+    id SERIAL PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed')),
+    backend VARCHAR(20),
+    platform VARCHAR(50) NOT NULL,
+    keyword VARCHAR(255) NOT NULL,
+    date_from VARCHAR(20),
+    date_to VARCHAR(20),
+    max_results INTEGER DEFAULT 25,
+    params JSON,
+    dataset_id INTEGER REFERENCES datasets(id) ON DELETE SET NULL,
+    dataset_name VARCHAR(255),
+    run_id VARCHAR(100),
+    apify_status VARCHAR(20),
+    poll_count INTEGER DEFAULT 0,
+    items_count INTEGER DEFAULT 0,
+    temp_id VARCHAR(36),
+    raw_items BYTEA, -- Gzip JSON Lines of the raw Apify items, for re-mapping
+    raw_items_size INTEGER, -- Compressed bytes
+    scheduled_scrape_id INTEGER REFERENCES scheduled_scrapes(id) ON DELETE SET NULL,
+    records_added INTEGER, -- Scheduled runs: rows saved, cleaned and classified
+    cleaned_count INTEGER,
+    classified_count INTEGER,
+    timings JSON, -- Seconds per stage (apify_run, fetch, save, clean, classify)
+    since_item_id VARCHAR(100), -- Watermark snapshot the run was narrowed to
+    since_item_at TIMESTAMP,
+    newest_item_id VARCHAR(100), -- Newest item of this run, becomes the watermark once mapped
+    newest_item_at TIMESTAMP,
+    covered_from TIMESTAMP, -- Start of the range this run fetched completely
+    error_message TEXT,
+    created_by INTEGER NOT NULL REFERENCES users(id),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    last_polled_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- Create Scraping Watermarks table (newest post already saved per platform + keyword + dataset)
+CREATE TABLE scraping_watermarks (
+    id SERIAL PRIMARY KEY,
+    platform VARCHAR(50) NOT NULL,
+    keyword VARCHAR(255) NOT NULL, -- Normalized: stripped and lower case
+    dataset_id INTEGER NOT NULL REFERENCES datasets(id) ON DELETE CASCADE,
+    last_item_id VARCHAR(100),
+    last_item_at TIMESTAMP NOT NULL,
+    covered_from TIMESTAMP, -- Start of the range fully saved up to last_item_at
+    last_run_id VARCHAR(100),
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_scraping_watermarks_platform_keyword_dataset UNIQUE (platform, keyword, dataset_id)
+);
+
 -- Create indexes for better performance
 CREATE INDEX idx_users_username ON users(username);
 CREATE INDEX idx_users_email ON users(email);
@@ -157,23 +289,28 @@ CREATE INDEX idx_raw_data_uploaded_by ON raw_data(uploaded_by);
 CREATE INDEX idx_raw_data_platform ON raw_data(platform);
 CREATE INDEX idx_raw_data_status ON raw_data(status);
 CREATE INDEX idx_raw_data_created_at ON raw_data(created_at);
+CREATE INDEX idx_raw_data_dataset_content_hash ON raw_data(dataset_id, content_hash);
 
 CREATE INDEX idx_raw_data_scraper_scraped_by ON raw_data_scraper(scraped_by);
 CREATE INDEX idx_raw_data_scraper_platform ON raw_data_scraper(platform);
 CREATE INDEX idx_raw_data_scraper_status ON raw_data_scraper(status);
 CREATE INDEX idx_raw_data_scraper_created_at ON raw_data_scraper(created_at);
+CREATE INDEX idx_raw_data_scraper_dataset_content_hash ON raw_data_scraper(dataset_id, content_hash);
 
 CREATE INDEX idx_clean_data_upload_raw_data_id ON clean_data_upload(raw_data_id);
 CREATE INDEX idx_clean_data_upload_cleaned_by ON clean_data_upload(cleaned_by);
 CREATE INDEX idx_clean_data_upload_platform ON clean_data_upload(platform);
 CREATE INDEX idx_clean_data_upload_dataset_id ON clean_data_upload(dataset_id);
 CREATE INDEX idx_clean_data_upload_created_at ON clean_data_upload(created_at);
+CREATE INDEX idx_clean_data_upload_cleaned_content_hash ON clean_data_upload(cleaned_content_hash);
+CREATE INDEX idx_clean_data_upload_dataset_cleaned_content_hash ON clean_data_upload(dataset_id, cleaned_content_hash);
 
 CREATE INDEX idx_clean_data_scraper_raw_data_scraper_id ON clean_data_scraper(raw_data_scraper_id);
 CREATE INDEX idx_clean_data_scraper_cleaned_by ON clean_data_scraper(cleaned_by);
 CREATE INDEX idx_clean_data_scraper_platform ON clean_data_scraper(platform);
 CREATE INDEX idx_clean_data_scraper_dataset_id ON clean_data_scraper(dataset_id);
 CREATE INDEX idx_clean_data_scraper_created_at ON clean_data_scraper(created_at);
+CREATE INDEX idx_clean_data_scraper_cleaned_content_hash ON clean_data_scraper(cleaned_content_hash);
 
 CREATE INDEX idx_classification_results_classified_by ON classification_results(classified_by);
 CREATE INDEX idx_classification_results_prediction ON classification_results(prediction);
@@ -183,6 +320,18 @@ CREATE INDEX idx_classification_results_data_id ON classification_results(data_i
 CREATE INDEX idx_classification_results_model_name ON classification_results(model_name);
 CREATE INDEX idx_classification_results_data_type_id ON classification_results(data_type, data_id);
 
+CREATE INDEX idx_document_vectors_embedding_version ON document_vectors(embedding_version);
+
+CREATE INDEX idx_near_duplicate_signatures_cluster_id ON near_duplicate_signatures(cluster_id);
+CREATE INDEX idx_near_duplicate_bands_band ON near_duplicate_bands(band_index, band_hash);
+CREATE INDEX idx_near_duplicate_bands_signature_id ON near_duplicate_bands(signature_id);
+
+CREATE INDEX idx_ingestion_jobs_created_by_created_at ON ingestion_jobs(created_by, created_at);
+CREATE INDEX idx_scraping_jobs_created_by_created_at ON scraping_jobs(created_by, created_at);
+CREATE INDEX idx_scraping_jobs_status ON scraping_jobs(status);
+CREATE INDEX idx_scraping_jobs_scheduled_scrape_id ON scraping_jobs(scheduled_scrape_id);
+CREATE INDEX idx_scheduled_scrapes_active_next_run_at ON scheduled_scrapes(is_active, next_run_at);
+
 -- Create full-text search indexes
 CREATE INDEX idx_clean_data_upload_content_fts ON clean_data_upload USING gin(to_tsvector('indonesian', content));
 CREATE INDEX idx_clean_data_scraper_content_fts ON clean_data_scraper USING gin(to_tsvector('indonesian', content));
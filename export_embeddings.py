@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Script untuk mengekspor model Word2Vec ke format embedding ringkas (float16/int8)
+dan membandingkan hasil klasifikasi 3 model Naive Bayes terhadap jalur float32
+
+Contoh:
+    python export_embeddings.py export --quantization float16
+    python export_embeddings.py check --limit 5000
+"""
+
+import os
+import sys
+import argparse
+import numpy as np
+from flask import Flask
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv('.env')
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from models import db, CleanDataUpload, CleanDataScraper
+from utils import (export_compact_embeddings, load_compact_embeddings, load_naive_bayes_models,
+                   vectorize_texts, classify_contents)
+
+def create_app():
+    """Create Flask application"""
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    
+    # Initialize database
+    db.init_app(app)
+    
+    return app
+
+def default_output_dir(model_path, quantization):
+    """Folder output default di samping file model"""
+    return f"{os.path.splitext(model_path)[0]}.{quantization}"
+
+def load_sample_texts(texts_file=None, limit=5000):
+    """Ambil teks uji dari file (satu teks per baris) atau dari tabel clean data"""
+    if texts_file:
+        with open(texts_file, 'r', encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()][:limit]
+    
+    texts = [row.cleaned_content for row in CleanDataUpload.query.with_entities(
+        CleanDataUpload.cleaned_content).limit(limit)]
+    remaining = limit - len(texts)
+    if remaining > 0:
+        texts.extend(row.cleaned_content for row in CleanDataScraper.query.with_entities(
+            CleanDataScraper.cleaned_content).limit(remaining))
+    return texts
+
+def check_agreement(reference_model, compact_vectors, naive_bayes_models, texts):
+    """
+    Bandingkan prediksi 3 model Naive Bayes antara embedding float32 dan embedding ringkas
+    """
+    reference_matrix = vectorize_texts(texts, reference_model)
+    compact_matrix = vectorize_texts(texts, compact_vectors)
+    
+    reference_results = classify_contents(reference_matrix, naive_bayes_models)
+    compact_results = classify_contents(compact_matrix, naive_bayes_models)
+    
+    report = {
+        'total_texts': len(texts),
+        'max_abs_vector_diff': float(np.abs(reference_matrix - compact_matrix).max()) if len(texts) else 0.0,
+        'models': {}
+    }
+    
+    for model_name, (reference_predictions, reference_probabilities) in reference_results.items():
+        compact_predictions, compact_probabilities = compact_results[model_name]
+        agreed = sum(1 for a, b in zip(reference_predictions, compact_predictions) if a == b)
+        report['models'][model_name] = {
+            'agreement_rate': agreed / len(texts) if texts else 1.0,
+            'disagreements': len(texts) - agreed,
+            'max_abs_probability_diff': float(np.abs(reference_probabilities - compact_probabilities).max()) if len(texts) else 0.0
+        }
+    
+    return report
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Export dan cek embedding Word2Vec ringkas')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    export_parser = subparsers.add_parser('export', help='Ekspor model Word2Vec ke format ringkas')
+    export_parser.add_argument('--model', default=Config.WORD2VEC_MODEL_PATH, help='Path model Word2Vec sumber')
+    export_parser.add_argument('--output', help='Folder output (default: <model>.<quantization>)')
+    export_parser.add_argument('--quantization', choices=['float16', 'int8'], default='float16')
+    
+    check_parser = subparsers.add_parser('check', help='Bandingkan prediksi float32 vs format ringkas')
+    check_parser.add_argument('--model', default=Config.WORD2VEC_MODEL_PATH, help='Path model Word2Vec float32')
+    check_parser.add_argument('--compact', help='Folder embedding ringkas (default: WORD2VEC_COMPACT_PATH atau <model>.float16)')
+    check_parser.add_argument('--texts', help='File teks uji, satu teks per baris (default: ambil dari database)')
+    check_parser.add_argument('--limit', type=int, default=5000, help='Jumlah maksimal teks uji')
+    
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("WASKITA - Embedding Word2Vec Ringkas")
+    print("=" * 50)
+    
+    if args.command == 'export':
+        output_dir = args.output or default_output_dir(args.model, args.quantization)
+        meta = export_compact_embeddings(args.model, output_dir, args.quantization)
+        
+        size_bytes = sum(os.path.getsize(os.path.join(output_dir, name)) for name in os.listdir(output_dir))
+        print(f"✓ Ekspor selesai: {output_dir}")
+        print(f"  Quantization: {meta['quantization']}")
+        print(f"  Vocabulary: {meta['vocab_size']} kata x {meta['vector_size']} dimensi")
+        print(f"  Ukuran: {size_bytes / (1024 * 1024):.1f} MB (model sumber {os.path.getsize(args.model) / (1024 * 1024):.1f} MB)")
+        print(f"\nAktifkan dengan WORD2VEC_COMPACT_PATH={output_dir}")
+        return
+    
+    compact_dir = args.compact or Config.WORD2VEC_COMPACT_PATH or default_output_dir(args.model, 'float16')
+    
+    app = create_app()
+    with app.app_context():
+        from gensim.models import Word2Vec
+        
+        reference_model = Word2Vec.load(args.model)
+        compact_vectors = load_compact_embeddings(compact_dir)
+        naive_bayes_models = load_naive_bayes_models()
+        
+        if not naive_bayes_models:
+            print("✗ Model Naive Bayes tidak ditemukan. Periksa NAIVE_BAYES_MODEL*_PATH.")
+            return
+        
+        texts = load_sample_texts(args.texts, args.limit)
+        report = check_agreement(reference_model, compact_vectors, naive_bayes_models, texts)
+    
+    print(f"Embedding ringkas: {compact_dir}")
+    print(f"Jumlah teks uji: {report['total_texts']}")
+    print(f"Selisih vektor maksimal: {report['max_abs_vector_diff']:.6f}")
+    for model_name, stats in report['models'].items():
+        print(f"  {model_name}: kesesuaian {stats['agreement_rate'] * 100:.2f}% "
+              f"({stats['disagreements']} beda), selisih probabilitas maks {stats['max_abs_probability_diff']:.6f}")
+    print("=" * 50)
+
+if __name__ == '__main__':
+    main()
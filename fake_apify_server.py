@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Server pengganti Apify API untuk load test dan integration test tanpa akun Apify berbayar.
+
+Mengimplementasikan endpoint yang dipakai utils.py: POST acts/{actor}/runs, GET actor-runs/{id},
+GET actor-runs/{id}/dataset dan GET actor-runs/{id}/dataset/items (offset/limit). Item sintetis
+mengikuti skema actor tiap platform (Twitter author.userName, TikTok authorMeta, dst.) dan dibuat
+deterministik per halaman sehingga run besar tidak memakan memori. Latensi, run gagal dan respons
+rate limit (429 + Retry-After) dapat diatur.
+
+Aplikasi memakai server ini lewat APIFY_BASE_URL, contoh:
+    python fake_apify_server.py --port 8765 --latency 0.05 --rate-limit-rate 0.02
+    APIFY_BASE_URL=http://127.0.0.1:8765/v2 APIFY_API_TOKEN=fake python app.py
+
+Atau di dalam script/test:
+    with FakeApifyServer(run_duration=1) as server:
+        os.environ['APIFY_BASE_URL'] = server.base_url
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PLATFORMS = ('twitter', 'facebook', 'instagram', 'tiktok')
+DEFAULT_ITEMS = 25
+CONTENT_TEMPLATES = [
+    'Diskusi hangat soal {keyword} di grup warga hari ini',
+    'Update terbaru mengenai {keyword}, pantau terus ya',
+    'Pendapat saya tentang {keyword}: perlu kajian lebih dalam',
+    'Thread lengkap kronologi {keyword} yang lagi ramai',
+    'Jangan mudah percaya hoaks seputar {keyword}',
+    'Video liputan langsung {keyword} dari lokasi',
+    'Seruan jihad dan perang terkait {keyword} beredar luas',
+    'Kajian ustadz tentang {keyword} dan khilafah'
+]
+USERNAMES = ['warga_net', 'info_terkini', 'kabar_daerah', 'suara_rakyat', 'media_lokal', 'jurnalis_warga', 'akun_anonim', 'pemerhati_sosial']
+
+class FakeApifyServer:
+    """
+    Fake Apify API berbasis ThreadingHTTPServer yang berjalan di thread daemon.
+    
+    Setiap run berstatus READY lalu RUNNING dan selesai (SUCCEEDED/FAILED) setelah run_duration
+    detik. failure_rate adalah peluang run berakhir FAILED, rate_limit_rate peluang setiap request
+    dijawab 429. Jumlah item per run mengikuti maxItems/resultsLimit/resultsPerPage pada input actor
+    (dibatasi max_items_per_run). Statistik request tersedia di stats().
+    """
+    
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, failure_rate=0.0, rate_limit_rate=0.0,
+                 run_duration=2.0, max_items_per_run=None, retry_after=1, seed=None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.run_duration = run_duration
+        self.max_items_per_run = max_items_per_run
+        self.retry_after = retry_after
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._runs = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+    
+    @property
+    def base_url(self):
+        return f'http://{self.host}:{self.port}/v2'
+    
+    def start(self):
+        handler = type('FakeApifyHandler', (_FakeApifyHandler,), {'fake': self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-apify', daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    def stats(self):
+        """Jumlah request per endpoint/status dan jumlah run per status akhir"""
+        with self._lock:
+            counters = dict(self._counters)
+            runs = list(self._runs.values())
+        statuses = {}
+        for run in runs:
+            status = self._run_status(run)
+            statuses[status] = statuses.get(status, 0) + 1
+        return {'requests': counters, 'runs': len(runs), 'run_statuses': statuses}
+    
+    def count(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+    
+    def chance(self, rate):
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+    
+    def create_run(self, actor_id, input_data):
+        platform = detect_platform(actor_id)
+        item_count = DEFAULT_ITEMS
+        for field in ('maxItems', 'resultsLimit', 'resultsPerPage', 'searchLimit'):
+            if isinstance(input_data.get(field), int) and input_data[field] > 0:
+                item_count = input_data[field]
+                break
+        if self.max_items_per_run is not None:
+            item_count = min(item_count, self.max_items_per_run)
+        
+        keyword = (input_data.get('searchTerms') or [None])[0] or input_data.get('search') or \
+            (input_data.get('hashtags') or [None])[0] or 'waskita'
+        keyword = re.sub(r'\s+(since|until):\S+', '', str(keyword)).strip()
+        
+        with self._lock:
+            run_id = f'fake{len(self._runs) + 1:06d}'
+            run = {
+                'id': run_id,
+                'actId': actor_id,
+                'platform': platform,
+                'keyword': keyword,
+                'item_count': item_count,
+                'will_fail': self._random.random() < self.failure_rate,
+                'started_at': datetime.utcnow(),
+                'started': time.monotonic()
+            }
+            self._runs[run_id] = run
+        return run
+    
+    def get_run(self, run_id):
+        with self._lock:
+            return self._runs.get(run_id)
+    
+    def run_data(self, run):
+        status = self._run_status(run)
+        finished = status in ('SUCCEEDED', 'FAILED')
+        runtime = min(time.monotonic() - run['started'], self.run_duration)
+        return {
+            'id': run['id'],
+            'actId': run['actId'],
+            'status': status,
+            'statusMessage': 'Fake actor crashed' if status == 'FAILED' else None,
+            'startedAt': _isoformat(run['started_at']),
+            'finishedAt': _isoformat(run['started_at'] + timedelta(seconds=self.run_duration)) if finished else None,
+            'defaultDatasetId': f"ds-{run['id']}",
+            'stats': {'runTimeSecs': round(runtime, 3)}
+        }
+    
+    def available_items(self, run):
+        """Item yang sudah "terscrape": bertambah linear selama run berjalan"""
+        status = self._run_status(run)
+        if status == 'SUCCEEDED':
+            return run['item_count']
+        if status == 'FAILED' or self.run_duration <= 0:
+            return 0
+        progress = (time.monotonic() - run['started']) / self.run_duration
+        return min(run['item_count'], int(run['item_count'] * progress))
+    
+    def _run_status(self, run):
+        elapsed = time.monotonic() - run['started']
+        if elapsed >= self.run_duration:
+            return 'FAILED' if run['will_fail'] else 'SUCCEEDED'
+        return 'RUNNING' if elapsed >= min(0.5, self.run_duration / 4) else 'READY'
+
+def detect_platform(actor_id):
+    """Tebak platform dari actor ID (konfigurasi APIFY_*_ACTOR atau nama actor)"""
+    normalized = actor_id.replace('~', '/').lower()
+    for platform in PLATFORMS:
+        configured = os.getenv(f'APIFY_{platform.upper()}_ACTOR')
+        if configured and configured.lower() == normalized:
+            return platform
+    if 'tweet' in normalized or 'twitter' in normalized:
+        return 'twitter'
+    for platform in PLATFORMS:
+        if platform in normalized:
+            return platform
+    return 'twitter'
+
+def build_item(run, index):
+    """Item sintetis ke-index dari run (urut terbaru dulu) sesuai skema actor platform"""
+    rng = random.Random(f"{run['id']}:{index}")
+    platform = run['platform']
+    keyword = run['keyword']
+    post_id = f"{int(run['started_at'].timestamp())}{index:06d}"
+    created_at = run['started_at'] - timedelta(seconds=30 * index + rng.randint(0, 29))
+    username = rng.choice(USERNAMES)
+    text = f"{rng.choice(CONTENT_TEMPLATES).format(keyword=keyword)} #{post_id[-6:]}"
+    
+    if platform == 'twitter':
+        return {
+            'type': 'tweet',
+            'id': post_id,
+            'url': f'https://x.com/{username}/status/{post_id}',
+            'text': text,
+            'createdAt': created_at.strftime('%a %b %d %H:%M:%S +0000 %Y'),
+            'lang': 'in',
+            'source': rng.choice(['Twitter for Android', 'Twitter for iPhone', 'Twitter Web App']),
+            'retweetCount': rng.randint(0, 500),
+            'replyCount': rng.randint(0, 100),
+            'likeCount': rng.randint(0, 2000),
+            'quoteCount': rng.randint(0, 50),
+            'viewCount': rng.randint(100, 50000),
+            'bookmarkCount': rng.randint(0, 30),
+            'isReply': False,
+            'isQuote': False,
+            'author': {
+                'userName': username,
+                'name': username.replace('_', ' ').title(),
+                'profilePicture': f'https://pbs.twimg.com/profile_images/{username}.jpg'
+            }
+        }
+    elif platform == 'facebook':
+        return {
+            'postId': post_id,
+            'url': f'https://www.facebook.com/{username}/posts/{post_id}',
+            'text': text,
+            'time': _isoformat(created_at),
+            'timestamp': int(created_at.timestamp()),
+            'authorName': username.replace('_', ' ').title(),
+            'likes': rng.randint(0, 300),
+            'comments': rng.randint(0, 80),
+            'shares': rng.randint(0, 40)
+        }
+    elif platform == 'instagram':
+        short_code = f'C{post_id[-10:]}'
+        return {
+            'id': post_id,
+            'type': rng.choice(['Image', 'Video', 'Sidecar']),
+            'shortCode': short_code,
+            'url': f'https://www.instagram.com/p/{short_code}/',
+            'caption': text,
+            'hashtags': [keyword.lstrip('#')],
+            'timestamp': _isoformat(created_at),
+            'ownerUsername': username,
+            'likesCount': rng.randint(0, 1500),
+            'commentsCount': rng.randint(0, 150),
+            'videoViewCount': rng.randint(0, 20000)
+        }
+    return {
+        'id': post_id,
+        'text': text,
+        'createTime': int(created_at.timestamp()),
+        'createTimeISO': _isoformat(created_at),
+        'webVideoUrl': f'https://www.tiktok.com/@{username}/video/{post_id}',
+        'authorMeta': {'name': username, 'uniqueId': username, 'nickName': username.replace('_', ' ').title()},
+        'diggCount': rng.randint(0, 5000),
+        'shareCount': rng.randint(0, 300),
+        'commentCount': rng.randint(0, 400),
+        'playCount': rng.randint(1000, 100000)
+    }
+
+def _isoformat(value):
+    return value.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+class _FakeApifyHandler(BaseHTTPRequestHandler):
+    fake = None
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_POST(self):
+        self._handle('POST')
+    
+    def do_GET(self):
+        self._handle('GET')
+    
+    def _handle(self, method):
+        fake = self.fake
+        url = urlparse(self.path)
+        path = url.path[len('/v2'):] if url.path.startswith('/v2/') else url.path
+        parts = [part for part in path.split('/') if part]
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0)) if method == 'POST' else b''
+        
+        if fake.latency:
+            time.sleep(fake.latency * random.uniform(0.5, 1.5))
+        
+        if not self.headers.get('Authorization', '').startswith('Bearer '):
+            return self._error(401, 'token-not-provided', 'Authentication token was not provided')
+        if fake.chance(fake.rate_limit_rate):
+            fake.count('429')
+            return self._error(429, 'rate-limit-exceeded', 'You have exceeded the rate limit', {'Retry-After': str(fake.retry_after)})
+        
+        if method == 'POST' and len(parts) == 3 and parts[0] == 'acts' and parts[2] == 'runs':
+            fake.count('start_run')
+            try:
+                input_data = json.loads(body or b'{}')
+            except ValueError:
+                return self._error(400, 'invalid-input', 'Input is not valid JSON')
+            run = fake.create_run(parts[1], input_data)
+            return self._send(201, {'data': fake.run_data(run)})
+        
+        if method != 'GET' or len(parts) < 2 or parts[0] != 'actor-runs':
+            return self._error(404, 'page-not-found', f'{method} {url.path} is not supported by the fake Apify server')
+        
+        run = fake.get_run(parts[1])
+        if run is None:
+            return self._error(404, 'record-not-found', 'Actor run was not found')
+        
+        if len(parts) == 2:
+            fake.count('run_status')
+            return self._send(200, {'data': fake.run_data(run)})
+        if parts[2:] == ['dataset']:
+            fake.count('dataset_info')
+            return self._send(200, {'data': {'id': f"ds-{run['id']}", 'itemCount': fake.available_items(run)}})
+        if parts[2:] == ['dataset', 'items']:
+            fake.count('dataset_items')
+            query = parse_qs(url.query)
+            total = fake.available_items(run)
+            offset = max(0, int(query.get('offset', ['0'])[0]))
+            limit = int(query.get('limit', [str(total)])[0])
+            items = [build_item(run, index) for index in range(offset, min(total, offset + limit))]
+            return self._send(200, items, {
+                'X-Apify-Pagination-Total': str(total),
+                'X-Apify-Pagination-Offset': str(offset),
+                'X-Apify-Pagination-Limit': str(limit)
+            })
+        return self._error(404, 'page-not-found', f'GET {url.path} is not supported by the fake Apify server')
+    
+    def _error(self, status, error_type, message, headers=None):
+        self._send(status, {'error': {'type': error_type, 'message': message}}, headers)
+    
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Fake Apify API server untuk load/integration test')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='Latensi rata-rata per request (detik)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Peluang run berakhir FAILED (0-1)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Peluang request dijawab 429 (0-1)')
+    parser.add_argument('--run-duration', type=float, default=5.0, help='Lama run sampai selesai (detik)')
+    parser.add_argument('--max-items', type=int, help='Batas item per run')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+    
+    server = FakeApifyServer(args.host, args.port, args.latency, args.failure_rate, args.rate_limit_rate,
+                             args.run_duration, args.max_items, seed=args.seed).start()
+    print(f"Fake Apify API berjalan di {server.base_url}")
+    print(f"Jalankan aplikasi dengan APIFY_BASE_URL={server.base_url} dan APIFY_API_TOKEN apa saja")
+    try:
+        while True:
+            time.sleep(10)
+            print(json.dumps(server.stats()), flush=True)
+    except KeyboardInterrupt:
+        server.stop()
+        sys.exit(0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,505 @@
+import io
+import os
+import re
+import csv
+import json
+import time
+import codecs
+import shutil
+import socket
+import logging
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 50000
+DEFAULT_PREVIEW_ROWS = 5
+ENCODING_SAMPLE_SIZE = 64 * 1024
+# Encoding yang dicoba berurutan jika sampel lolos tetapi isi file berikutnya gagal didecode
+FALLBACK_ENCODINGS = ('utf-8', 'cp1252', 'latin1')
+STAGING_DIRNAME = 'staging'
+STAGING_MAX_AGE = 24 * 3600  # sama dengan umur session login
+
+# Urutan sama dengan deteksi platform lama: pola pertama yang cocok menang
+PLATFORM_URL_PATTERNS = (
+    ('twitter', ('twitter.com', 'x.com')),
+    ('facebook', ('facebook.com',)),
+    ('tiktok', ('tiktok.com',)),
+    ('instagram', ('instagram.com',)),
+)
+
+RAW_DATA_COLUMNS = ('username', 'content', 'content_hash', 'url', 'platform', 'source_type', 'status',
+                    'file_size', 'original_filename', 'dataset_id', 'dataset_name', 'uploaded_by',
+                    'created_at', 'updated_at')
+
+def is_csv_upload(filename):
+    return filename.lower().endswith('.csv')
+
+def detect_csv_encoding(filepath, sample_size=ENCODING_SAMPLE_SIZE):
+    """
+    Deteksi encoding CSV dari sampel byte awal file tanpa mem-parse file.
+    BOM diutamakan, lalu UTF-8 (strict), cp1252, dan terakhir latin1 yang selalu berhasil.
+    """
+    with open(filepath, 'rb') as f:
+        sample = f.read(sample_size)
+    
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    
+    # Karakter multibyte yang terpotong di ujung sampel tidak dianggap error
+    is_complete = len(sample) < sample_size
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=is_complete)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'latin1'
+
+def iter_upload_chunks(filepath, filename, chunk_size=DEFAULT_CHUNK_SIZE, encoding=None, on_bad_lines='error'):
+    """
+    Baca file upload per chunk DataFrame sehingga memori tetap datar berapa pun ukuran file.
+    CSV dibaca dengan chunksize (semua kolom sebagai string), .xlsx dengan openpyxl read-only.
+    File .xls (format lama) tidak didukung openpyxl sehingga dibaca utuh lalu dipotong.
+    File tanpa baris data tetap menghasilkan satu chunk kosong berisi nama kolom.
+    """
+    if is_csv_upload(filename):
+        with pd.read_csv(filepath, chunksize=chunk_size, dtype=str, encoding=encoding,
+                         on_bad_lines=on_bad_lines) as reader:
+            for chunk in reader:
+                chunk.columns = [str(column) for column in chunk.columns]
+                yield chunk
+        return
+    
+    if filename.lower().endswith('.xlsx'):
+        yield from _iter_xlsx_chunks(filepath, chunk_size)
+        return
+    
+    df = pd.read_excel(filepath)
+    df.columns = [str(column) for column in df.columns]
+    for start in range(0, max(len(df), 1), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+def _excel_columns(header):
+    """Nama kolom seperti pandas: header kosong -> 'Unnamed: i', nama ganda -> 'nama.1'"""
+    columns = []
+    seen = {}
+    for index, value in enumerate(header):
+        name = str(value) if value is not None else f'Unnamed: {index}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+def _iter_xlsx_chunks(filepath, chunk_size):
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        
+        columns = _excel_columns(header)
+        width = len(columns)
+        batch = []
+        has_rows = False
+        for row in rows:
+            has_rows = True
+            # Baris mode read-only bisa lebih pendek/panjang dari header
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            batch.append(row[:width])
+            if len(batch) >= chunk_size:
+                yield pd.DataFrame(batch, columns=columns)
+                batch = []
+        if batch or not has_rows:
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+def get_staging_dir(upload_folder, upload_id):
+    """Direktori staging untuk upload_id (UUID hex) di bawah UPLOAD_FOLDER"""
+    if not upload_id or not re.fullmatch(r'[0-9a-f]{32}', upload_id):
+        raise ValueError('Upload id tidak valid')
+    return os.path.join(os.path.abspath(upload_folder), STAGING_DIRNAME, upload_id)
+
+def stage_upload(filepath, filename, staging_dir, chunk_size=DEFAULT_CHUNK_SIZE, preview_rows=DEFAULT_PREVIEW_ROWS):
+    """
+    Parse file upload satu kali dan simpan hasilnya per chunk (DataFrame pickle) di staging_dir
+    sehingga langkah mapping kolom tidak perlu membaca ulang file. Return (columns, preview,
+    row_count) dengan preview berisi preview_rows baris pertama dari chunk pertama.
+    
+    Encoding CSV dideteksi dari sampel byte. Jika isi file setelah sampel gagal didecode,
+    staging diulang dengan encoding cadangan; jika parse gagal, baris rusak dilewati.
+    """
+    if not is_csv_upload(filename):
+        return _write_staging(iter_upload_chunks(filepath, filename, chunk_size), staging_dir,
+                              preview_rows, filename, None)
+    
+    detected_encoding = detect_csv_encoding(filepath)
+    encodings = [detected_encoding] + [encoding for encoding in FALLBACK_ENCODINGS[1:] if encoding != detected_encoding]
+    last_error = None
+    for encoding in encodings:
+        for on_bad_lines in ('error', 'skip'):
+            try:
+                result = _write_staging(
+                    iter_upload_chunks(filepath, filename, chunk_size, encoding=encoding, on_bad_lines=on_bad_lines),
+                    staging_dir, preview_rows, filename, encoding
+                )
+                logger.info(f"Staged CSV {filename} with encoding {encoding} (bad lines: {on_bad_lines})")
+                return result
+            except (UnicodeDecodeError, UnicodeError) as e:
+                last_error = e
+                logger.warning(f"Failed to read CSV with encoding {encoding}: {str(e)}")
+                break
+            except pd.errors.ParserError as e:
+                last_error = e
+                logger.warning(f"Failed to parse CSV with encoding {encoding}: {str(e)}")
+    
+    raise Exception(f"Could not read CSV file with any encoding. Last error: {str(last_error)}")
+
+def _write_staging(chunks, staging_dir, preview_rows, filename, encoding):
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+    
+    columns = None
+    preview = None
+    row_count = 0
+    chunk_count = 0
+    try:
+        for chunk in chunks:
+            if columns is None:
+                columns = list(chunk.columns)
+                preview = chunk.head(preview_rows)
+            chunk.to_pickle(os.path.join(staging_dir, f'{chunk_count:05d}.pkl'))
+            chunk_count += 1
+            row_count += len(chunk)
+        
+        # meta.json ditulis terakhir: staging tanpa meta dianggap tidak lengkap
+        with open(os.path.join(staging_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'filename': filename,
+                'encoding': encoding,
+                'columns': columns or [],
+                'row_count': row_count,
+                'chunk_count': chunk_count
+            }, f)
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    
+    return columns or [], preview if preview is not None else pd.DataFrame(), row_count
+
+def read_staged_upload(staging_dir):
+    """Metadata upload yang sudah di-staging, None jika tidak ada atau belum lengkap"""
+    try:
+        with open(os.path.join(staging_dir, 'meta.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def iter_staged_chunks(staging_dir):
+    """Baca ulang chunk hasil stage_upload tanpa mem-parse file asli"""
+    staged_upload = read_staged_upload(staging_dir)
+    if not staged_upload:
+        return
+    for chunk_index in range(staged_upload['chunk_count']):
+        yield pd.read_pickle(os.path.join(staging_dir, f'{chunk_index:05d}.pkl'))
+
+def remove_staged_upload(staging_dir):
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+def cleanup_stale_staging(upload_folder, max_age=STAGING_MAX_AGE):
+    """Hapus staging upload yang ditinggalkan (mapping kolom tidak pernah dijalankan)"""
+    staging_root = os.path.join(os.path.abspath(upload_folder), STAGING_DIRNAME)
+    if not os.path.isdir(staging_root):
+        return 0
+    
+    removed = 0
+    cutoff = time.time() - max_age
+    for name in os.listdir(staging_root):
+        path = os.path.join(staging_root, name)
+        try:
+            if os.path.isdir(path) and os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+def detect_platforms(urls):
+    """Deteksi platform dari URL secara vektor, default 'manual'"""
+    conditions = []
+    for _, patterns in PLATFORM_URL_PATTERNS:
+        condition = np.zeros(len(urls), dtype=bool)
+        for pattern in patterns:
+            condition |= urls.str.contains(pattern, regex=False).to_numpy(dtype=bool)
+        conditions.append(condition)
+    platforms = [platform for platform, _ in PLATFORM_URL_PATTERNS]
+    return pd.Series(np.select(conditions, platforms, default='manual'), index=urls.index)
+
+def normalize_upload_chunk(chunk, content_column, username_column=None, url_column=None):
+    """
+    Ubah chunk mentah menjadi kolom content, content_hash, username, url dan platform
+    dengan operasi vektor pandas. Baris dengan content kosong dibuang, username kosong
+    menjadi 'unknown'.
+    """
+    from models import compute_content_hash
+    
+    content = chunk[content_column]
+    content = content[content.notna()].astype(str).str.strip()
+    content = content[content != '']
+    index = content.index
+    
+    if username_column and username_column in chunk.columns:
+        username = chunk.loc[index, username_column]
+        username = username.where(username.notna(), '').astype(str).str.strip()
+        username = username.mask(username == '', 'unknown')
+    else:
+        username = pd.Series('unknown', index=index, dtype=object)
+    
+    if url_column and url_column in chunk.columns:
+        url = chunk.loc[index, url_column]
+        url = url.where(url.notna(), '').astype(str)
+    else:
+        url = pd.Series('', index=index, dtype=object)
+    
+    return pd.DataFrame({
+        'content': content,
+        'content_hash': [compute_content_hash(text) for text in content],
+        'username': username,
+        'url': url,
+        'platform': detect_platforms(url)
+    }, index=index)
+
+def bulk_insert_raw_data(frame, **fields):
+    """
+    Simpan hasil normalize_upload_chunk ke tabel raw_data tanpa objek ORM. PostgreSQL
+    memakai COPY, database lain executemany. Berjalan di transaksi session aktif;
+    commit dilakukan oleh pemanggil. fields berisi nilai yang sama untuk semua baris
+    (file_size, original_filename, dataset_id, dataset_name, uploaded_by).
+    """
+    from models import db, RawData
+    
+    if frame.empty:
+        return 0
+    
+    now = datetime.utcnow()
+    common = {column: None for column in RAW_DATA_COLUMNS}
+    common.update(source_type='upload', status='raw', created_at=now, updated_at=now)
+    common.update(fields)
+    row_columns = list(frame.columns)
+    constant_columns = [column for column in RAW_DATA_COLUMNS if column not in row_columns]
+    columns = row_columns + constant_columns
+    
+    connection = db.session.connection()
+    if connection.dialect.name == 'postgresql':
+        cursor = connection.connection.cursor()
+        if hasattr(cursor, 'copy_expert'):
+            buffer = io.StringIO()
+            frame.assign(**{column: common[column] for column in constant_columns}).to_csv(
+                buffer, index=False, header=False, quoting=csv.QUOTE_ALL
+            )
+            buffer.seek(0)
+            cursor.copy_expert(
+                f"COPY raw_data ({', '.join(columns)}) FROM STDIN "
+                f"WITH (FORMAT csv, FORCE_NULL (file_size, original_filename, dataset_id, dataset_name))",
+                buffer
+            )
+            return len(frame)
+    
+    constant = tuple(common[column] for column in constant_columns)
+    rows = [values + constant for values in frame.itertuples(index=False, name=None)]
+    placeholder = {'qmark': '?', 'format': '%s', 'pyformat': '%s'}.get(connection.dialect.paramstyle)
+    if placeholder is None:
+        db.session.execute(RawData.__table__.insert(), [dict(zip(columns, values)) for values in rows])
+        return len(rows)
+    
+    # executemany langsung ke driver: tanpa overhead kompilasi parameter per baris SQLAlchemy
+    connection.exec_driver_sql(
+        f"INSERT INTO raw_data ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})",
+        rows
+    )
+    return len(rows)
+
+def ingest_upload_chunks(chunks, content_column, username_column=None, url_column=None, on_chunk=None, **fields):
+    """
+    Streaming ingest chunk upload (mis. dari iter_staged_chunks) ke raw_data: normalisasi
+    vektor lalu bulk insert per chunk. on_chunk(rows_read, rows_inserted) dipanggil setelah
+    setiap chunk (mis. untuk commit dan update progress job). Return jumlah baris yang
+    disimpan. Commit oleh pemanggil.
+    """
+    records_added = 0
+    for chunk in chunks:
+        frame = normalize_upload_chunk(chunk, content_column, username_column, url_column)
+        inserted = bulk_insert_raw_data(frame, **fields)
+        records_added += inserted
+        if on_chunk is not None:
+            on_chunk(len(chunk), inserted)
+    
+    logger.info(f"Ingested {records_added} rows from {fields.get('original_filename')}")
+    return records_added
+
+def get_worker_id():
+    """Identitas proses yang menjalankan job (hostname:pid)"""
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+def is_worker_alive(worker_id):
+    """
+    True/False jika worker_id milik host ini (dicek lewat pid), None jika tidak bisa
+    diketahui (host lain atau format tidak dikenal).
+    """
+    hostname, _, pid = (worker_id or '').rpartition(':')
+    if hostname != socket.gethostname() or not pid.isdigit():
+        return None
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return None
+    return True
+
+def run_upload_ingestion_job(job_id):
+    """
+    Handler background job ingestion upload. Chunk hasil staging di-commit satu per satu
+    agar rows_read/rows_inserted/rows_skipped terlihat oleh endpoint progress; statistik
+    dan log aktivitas diperbarui setelah semua chunk tersimpan.
+    """
+    from flask import current_app
+    from models import db, IngestionJob, Dataset, RawData, RawDataScraper
+    from utils import generate_activity_log
+    from scheduler import cleanup_scheduler
+    
+    # Klaim job secara atomik agar job tidak dijalankan dua kali (mis. redelivery Celery)
+    now = datetime.utcnow()
+    claimed = IngestionJob.query.filter_by(id=job_id, status='pending').update(
+        {'status': 'running', 'started_at': now, 'worker_id': get_worker_id(), 'last_progress_at': now},
+        synchronize_session=False
+    )
+    db.session.commit()
+    if not claimed:
+        logger.warning(f"Ingestion job {job_id} tidak ditemukan atau sudah diproses")
+        return None
+    
+    job = db.session.get(IngestionJob, job_id)
+    params = job.params or {}
+    staging_dir = None
+    try:
+        staging_dir = get_staging_dir(current_app.config['UPLOAD_FOLDER'], params.get('upload_id'))
+        if not read_staged_upload(staging_dir):
+            raise Exception('File upload tidak ditemukan. Silakan upload ulang file.')
+        
+        def on_chunk(rows_read, rows_inserted):
+            job.rows_read += rows_read
+            job.rows_inserted += rows_inserted
+            job.rows_skipped += rows_read - rows_inserted
+            job.last_progress_at = datetime.utcnow()
+            db.session.commit()
+        
+        ingest_upload_chunks(
+            iter_staged_chunks(staging_dir), params['content_column'],
+            params.get('username_column'), params.get('url_column'),
+            on_chunk=on_chunk,
+            file_size=params.get('file_size'),
+            original_filename=params.get('original_filename'),
+            dataset_id=job.dataset_id,
+            dataset_name=job.dataset_name,
+            uploaded_by=job.created_by
+        )
+        
+        dataset = db.session.get(Dataset, job.dataset_id) if job.dataset_id else None
+        if dataset:
+            dataset.total_records = RawData.query.filter_by(dataset_id=dataset.id).count() + RawDataScraper.query.filter_by(dataset_id=dataset.id).count()
+        job.status = 'completed'
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        job = db.session.get(IngestionJob, job_id)
+        job.status = 'failed'
+        job.error_message = str(e)
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+        logger.error(f"Ingestion job {job_id} gagal: {str(e)}")
+        return job.to_dict()
+    finally:
+        if staging_dir:
+            remove_staged_upload(staging_dir)
+    
+    cleanup_scheduler.update_statistics()
+    generate_activity_log(
+        action='upload_data',
+        description=f'Berhasil mengupload {job.rows_inserted} data dari file {job.filename}',
+        user_id=job.created_by,
+        details={
+            'filename': job.filename,
+            'records_count': job.rows_inserted,
+            'dataset_name': job.dataset_name,
+            'file_size': params.get('file_size')
+        },
+        icon='fa-upload',
+        color='success'
+    )
+    return job.to_dict()
+
+def resume_ingestion_jobs():
+    """
+    Pulihkan job ingestion setelah proses web dengan backend thread di-restart: job pending
+    dijadwalkan ulang (klaim pending -> running mencegah dijalankan dua kali), job running
+    (sebagian chunk mungkin sudah tersimpan) ditandai gagal hanya jika pemiliknya sudah mati
+    atau heartbeat last_progress_at lebih lama dari INGESTION_JOB_STALE_SECONDS, sehingga job
+    yang masih dikerjakan proses lain tidak terganggu. Return (jumlah dijadwalkan ulang,
+    jumlah ditandai gagal).
+    """
+    from flask import current_app
+    from models import db, IngestionJob
+    from background_jobs import background_job_runner
+    
+    pending_ids = [job_id for (job_id,) in db.session.query(IngestionJob.id).filter_by(status='pending').all()]
+    for job_id in pending_ids:
+        try:
+            background_job_runner.submit('upload_ingestion', job_id)
+        except Exception as e:
+            logger.error(f"Gagal melanjutkan ingestion job {job_id}: {str(e)}")
+    
+    stale_before = datetime.utcnow() - timedelta(seconds=current_app.config.get('INGESTION_JOB_STALE_SECONDS', 900))
+    failed_count = 0
+    for job in IngestionJob.query.filter_by(status='running').all():
+        alive = is_worker_alive(job.worker_id)
+        last_progress_at = job.last_progress_at or job.started_at
+        if alive or (alive is None and last_progress_at and last_progress_at > stale_before):
+            continue
+        
+        # Klaim ulang dengan kondisi heartbeat yang sama agar progress yang baru masuk tidak ditimpa
+        heartbeat = (IngestionJob.last_progress_at.is_(None) if job.last_progress_at is None
+                     else IngestionJob.last_progress_at == job.last_progress_at)
+        failed = IngestionJob.query.filter(
+            IngestionJob.id == job.id, IngestionJob.status == 'running', heartbeat
+        ).update({
+            'status': 'failed',
+            'error_message': (f'Proses upload terhenti karena server di-restart setelah {job.rows_inserted} data tersimpan. '
+                              'Silakan upload ulang file.'),
+            'finished_at': datetime.utcnow()
+        }, synchronize_session=False)
+        db.session.commit()
+        if not failed:
+            continue
+        
+        failed_count += 1
+        try:
+            remove_staged_upload(get_staging_dir(current_app.config['UPLOAD_FOLDER'], (job.params or {}).get('upload_id')))
+        except ValueError:
+            pass
+    return len(pending_ids), failed_count
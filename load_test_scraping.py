@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Load test scraping: menjalankan banyak scraping bersamaan lewat route /start_scraping dan
+memantau status job sampai selesai, dengan Apify diganti fake_apify_server (tanpa akun Apify).
+
+Script memakai database dari konfigurasi aplikasi (DATABASE_URL) dan membuat dataset baru untuk
+setiap scraping, jadi jalankan terhadap database test. Login memakai user admin pertama atau --user.
+
+Contoh:
+    python load_test_scraping.py --concurrency 20 --max-results 500
+    python load_test_scraping.py --concurrency 50 --latency 0.1 --rate-limit-rate 0.05 --failure-rate 0.1
+    python load_test_scraping.py --concurrency 20 --map --output sebelum.json
+    python load_test_scraping.py --concurrency 20 --map --compare sebelum.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_apify_server import FakeApifyServer, PLATFORMS
+from benchmark_pipeline import get_peak_rss_mb
+
+def create_app_client_factory(args):
+    """Import aplikasi setelah APIFY_BASE_URL diarahkan ke fake server, return (app, fungsi pembuat client)"""
+    os.environ['WTF_CSRF_ENABLED'] = 'False'
+    os.environ['SCRAPING_POLL_INTERVAL'] = str(args.poll_interval)
+    
+    from app import app
+    from apify_api import apify_api
+    from models import User
+    
+    apify_api.reload_config()
+    app.config['RATELIMIT_ENABLED'] = False
+    app.config['SCRAPING_POLL_INTERVAL'] = args.poll_interval
+    app.config['SESSION_COOKIE_SECURE'] = False
+    
+    with app.app_context():
+        if args.user:
+            user = User.query.filter_by(username=args.user).first()
+        else:
+            user = User.query.filter_by(role='admin').order_by(User.id).first()
+        if not user:
+            raise Exception('User untuk load test tidak ditemukan. Buat user admin atau gunakan --user.')
+        user_id = str(user.id)
+    
+    def make_client():
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = user_id
+            session['_fresh'] = True
+        return client
+    
+    return app, make_client
+
+def run_scrape(make_client, index, args):
+    """Satu scraping: start, polling status, opsional mapping kolom; return metrik per scraping"""
+    client = make_client()
+    platform = args.platforms[index % len(args.platforms)]
+    result = {'index': index, 'platform': platform, 'status': 'error'}
+    
+    started = time.perf_counter()
+    response = client.post('/start_scraping', json={
+        'platform': platform,
+        'keywords': f'{args.keyword} {index}',
+        'start_date': args.start_date,
+        'end_date': args.end_date,
+        'max_results': args.max_results
+    })
+    result['start_ms'] = round((time.perf_counter() - started) * 1000, 2)
+    data = response.get_json(silent=True) or {}
+    if not data.get('success'):
+        result['status'] = (data.get('job') or {}).get('status') or 'error'
+        result['message'] = data.get('message') or f'HTTP {response.status_code}'
+        result['total_seconds'] = round(time.perf_counter() - started, 3)
+        return result
+    
+    job_id = data['job_id']
+    status_url = data['status_url']
+    deadline = time.monotonic() + args.timeout
+    polls = 0
+    while True:
+        polls += 1
+        data = client.get(status_url).get_json(silent=True) or {}
+        job = data.get('job') or {}
+        if job.get('status') in ('completed', 'failed') or time.monotonic() > deadline:
+            break
+        time.sleep(args.poll_interval)
+    
+    result.update({
+        'job_id': job_id,
+        'status': job.get('status') or 'timeout',
+        'polls': polls,
+        'items': job.get('items_count') or 0
+    })
+    if time.monotonic() > deadline and job.get('status') not in ('completed', 'failed'):
+        result['status'] = 'timeout'
+    if job.get('status') == 'failed':
+        result['message'] = job.get('error_message')
+    result['scrape_seconds'] = round(time.perf_counter() - started, 3)
+    
+    if args.map and result['status'] == 'completed' and data.get('requires_mapping'):
+        mapping_started = time.perf_counter()
+        columns = data.get('columns') or []
+        response = client.post('/process_scraping_column_mapping', json={
+            'scraping_job_id': job_id,
+            'content_column': 'content' if 'content' in columns else columns[0],
+            'username_column': 'username' if 'username' in columns else '',
+            'url_column': 'url' if 'url' in columns else ''
+        })
+        mapped = response.get_json(silent=True) or {}
+        result['mapping_seconds'] = round(time.perf_counter() - mapping_started, 3)
+        if not mapped.get('success'):
+            result['status'] = 'mapping_failed'
+            result['message'] = mapped.get('message') or f'HTTP {response.status_code}'
+    
+    result['total_seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+def summarize(results, elapsed, server_stats):
+    statuses = {}
+    for result in results:
+        statuses[result['status']] = statuses.get(result['status'], 0) + 1
+    
+    def percentiles(key):
+        values = [result[key] for result in results if key in result]
+        if not values:
+            return None
+        return {
+            'p50': round(float(np.percentile(values, 50)), 3),
+            'p99': round(float(np.percentile(values, 99)), 3),
+            'max': round(max(values), 3)
+        }
+    
+    return {
+        'scrapes': len(results),
+        'seconds': round(elapsed, 3),
+        'scrapes_per_min': round(len(results) / elapsed * 60, 1) if elapsed > 0 else None,
+        'items': sum(result.get('items', 0) for result in results),
+        'statuses': statuses,
+        'start_ms': percentiles('start_ms'),
+        'scrape_seconds': percentiles('scrape_seconds'),
+        'mapping_seconds': percentiles('mapping_seconds'),
+        'total_seconds': percentiles('total_seconds'),
+        'errors': sorted({result['message'] for result in results if result.get('message')})[:10],
+        'fake_apify': server_stats,
+        'peak_rss_mb': get_peak_rss_mb()
+    }
+
+def print_report(summary, baseline=None):
+    print(f"\n{summary['scrapes']} scraping dalam {summary['seconds']} detik "
+          f"({summary['scrapes_per_min']} scraping/menit, {summary['items']:,} item)")
+    print(f"Status: {summary['statuses']}")
+    print(f"  {'metrik':<18}{'p50':>10}{'p99':>10}{'max':>10}{'p50 acuan':>12}")
+    for key in ('start_ms', 'scrape_seconds', 'mapping_seconds', 'total_seconds'):
+        stats = summary[key]
+        if not stats:
+            continue
+        before = ((baseline or {}).get(key) or {}).get('p50', '')
+        print(f"  {key:<18}{stats['p50']:>10}{stats['p99']:>10}{stats['max']:>10}{before:>12}")
+    print(f"Fake Apify: {summary['fake_apify']}")
+    print(f"Peak RSS: {summary['peak_rss_mb']} MB")
+    for message in summary['errors']:
+        print(f"  ! {message}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Load test scraping lewat /start_scraping dengan fake Apify API')
+    parser.add_argument('--concurrency', type=int, default=10, help='Jumlah scraping bersamaan')
+    parser.add_argument('--scrapes', type=int, help='Total scraping (default sama dengan --concurrency)')
+    parser.add_argument('--platforms', default=','.join(PLATFORMS), help='Platform, pisahkan dengan koma')
+    parser.add_argument('--keyword', default='load test')
+    parser.add_argument('--start-date', default='2026-01-01')
+    parser.add_argument('--end-date', default='2026-01-31')
+    parser.add_argument('--max-results', type=int, default=100)
+    parser.add_argument('--map', action='store_true', help='Simpan hasil lewat /process_scraping_column_mapping')
+    parser.add_argument('--poll-interval', type=int, default=1, help='SCRAPING_POLL_INTERVAL dan jeda polling status (detik)')
+    parser.add_argument('--timeout', type=int, default=300, help='Batas waktu per scraping (detik)')
+    parser.add_argument('--latency', type=float, default=0.02, help='Latensi fake Apify per request (detik)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Peluang run Apify FAILED (0-1)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Peluang request Apify dijawab 429 (0-1)')
+    parser.add_argument('--run-duration', type=float, default=3.0, help='Lama run Apify (detik)')
+    parser.add_argument('--user', help='Username untuk login (default admin pertama)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    parser.add_argument('--compare', help='File JSON hasil sebelumnya sebagai acuan')
+    args = parser.parse_args()
+    args.platforms = [platform.strip() for platform in args.platforms.split(',') if platform.strip()]
+    
+    print("=" * 50)
+    print("WASKITA - Load Test Scraping")
+    print("=" * 50)
+    
+    server = FakeApifyServer(latency=args.latency, failure_rate=args.failure_rate, rate_limit_rate=args.rate_limit_rate,
+                             run_duration=args.run_duration, retry_after=1, seed=args.seed).start()
+    os.environ['APIFY_BASE_URL'] = server.base_url
+    os.environ['APIFY_API_TOKEN'] = 'fake-token'
+    os.environ.setdefault('APIFY_RETRY_DELAY', '1')
+    print(f"Fake Apify API: {server.base_url}")
+    
+    try:
+        app, make_client = create_app_client_factory(args)
+        total = args.scrapes or args.concurrency
+        print(f"Menjalankan {total} scraping ({args.concurrency} bersamaan)...", flush=True)
+        
+        done = [0]
+        done_lock = threading.Lock()
+        
+        def task(index):
+            result = run_scrape(make_client, index, args)
+            with done_lock:
+                done[0] += 1
+                if done[0] % max(1, total // 10) == 0:
+                    print(f"  {done[0]}/{total} selesai", flush=True)
+            return result
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency, thread_name_prefix='load-test') as executor:
+            results = list(executor.map(task, range(total)))
+        elapsed = time.perf_counter() - started
+        summary = summarize(results, elapsed, server.stats())
+    finally:
+        server.stop()
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['summary']
+    
+    print_report(summary, baseline)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'created_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'args': vars(args),
+                       'summary': summary, 'results': results}, f, indent=2)
+        print(f"\n✓ Hasil disimpan ke {args.output}")
+
+if __name__ == '__main__':
+    main()
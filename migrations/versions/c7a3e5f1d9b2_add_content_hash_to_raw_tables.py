@@ -0,0 +1,76 @@
+"""Add content_hash to raw_data and raw_data_scraper
+
+Revision ID: c7a3e5f1d9b2
+Revises: b4e1a9d3c2f0
+Create Date: 2026-10-18 11:26:03.417552
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a3e5f1d9b2'
+down_revision = 'b4e1a9d3c2f0'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_content_hash(table_name):
+    """Isi content_hash untuk baris lama (SHA-1 dari content yang di-trim)"""
+    connection = op.get_bind()
+    table = sa.table(table_name, sa.column('id', sa.Integer), sa.column('content', sa.Text),
+                     sa.column('content_hash', sa.String))
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(table.c.id, table.c.content)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for row_id, content in rows:
+            normalized = str(content).strip() if content is not None else ''
+            if normalized:
+                updates.append({'row_id': row_id, 'hash': hashlib.sha1(normalized.encode('utf-8')).hexdigest()})
+        if updates:
+            connection.execute(
+                table.update().where(table.c.id == sa.bindparam('row_id')).values(content_hash=sa.bindparam('hash')),
+                updates
+            )
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    with op.batch_alter_table('raw_data', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=40), nullable=True))
+
+    with op.batch_alter_table('raw_data_scraper', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=40), nullable=True))
+
+    backfill_content_hash('raw_data')
+    backfill_content_hash('raw_data_scraper')
+
+    with op.batch_alter_table('raw_data', schema=None) as batch_op:
+        batch_op.create_index('idx_raw_data_dataset_content_hash', ['dataset_id', 'content_hash'], unique=False)
+
+    with op.batch_alter_table('raw_data_scraper', schema=None) as batch_op:
+        batch_op.create_index('idx_raw_data_scraper_dataset_content_hash', ['dataset_id', 'content_hash'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('raw_data_scraper', schema=None) as batch_op:
+        batch_op.drop_index('idx_raw_data_scraper_dataset_content_hash')
+        batch_op.drop_column('content_hash')
+
+    with op.batch_alter_table('raw_data', schema=None) as batch_op:
+        batch_op.drop_index('idx_raw_data_dataset_content_hash')
+        batch_op.drop_column('content_hash')
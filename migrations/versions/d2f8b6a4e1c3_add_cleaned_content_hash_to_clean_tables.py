@@ -0,0 +1,78 @@
+"""Add cleaned_content_hash to clean_data_upload and clean_data_scraper
+
+Revision ID: d2f8b6a4e1c3
+Revises: c7a3e5f1d9b2
+Create Date: 2026-10-18 13:02:47.118204
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f8b6a4e1c3'
+down_revision = 'c7a3e5f1d9b2'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_cleaned_content_hash(table_name):
+    """Isi cleaned_content_hash untuk baris lama (SHA-1 dari cleaned_content yang di-trim)"""
+    connection = op.get_bind()
+    table = sa.table(table_name, sa.column('id', sa.Integer), sa.column('cleaned_content', sa.Text),
+                     sa.column('cleaned_content_hash', sa.String))
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(table.c.id, table.c.cleaned_content)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        updates = []
+        for row_id, cleaned_content in rows:
+            normalized = str(cleaned_content).strip() if cleaned_content is not None else ''
+            if normalized:
+                updates.append({'row_id': row_id, 'hash': hashlib.sha1(normalized.encode('utf-8')).hexdigest()})
+        if updates:
+            connection.execute(
+                table.update().where(table.c.id == sa.bindparam('row_id')).values(cleaned_content_hash=sa.bindparam('hash')),
+                updates
+            )
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    with op.batch_alter_table('clean_data_upload', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('cleaned_content_hash', sa.String(length=40), nullable=True))
+
+    with op.batch_alter_table('clean_data_scraper', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('cleaned_content_hash', sa.String(length=40), nullable=True))
+
+    backfill_cleaned_content_hash('clean_data_upload')
+    backfill_cleaned_content_hash('clean_data_scraper')
+
+    with op.batch_alter_table('clean_data_upload', schema=None) as batch_op:
+        batch_op.create_index('idx_clean_data_upload_cleaned_content_hash', ['cleaned_content_hash'], unique=False)
+        batch_op.create_index('idx_clean_data_upload_dataset_cleaned_content_hash', ['dataset_id', 'cleaned_content_hash'], unique=False)
+
+    with op.batch_alter_table('clean_data_scraper', schema=None) as batch_op:
+        batch_op.create_index('idx_clean_data_scraper_cleaned_content_hash', ['cleaned_content_hash'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('clean_data_scraper', schema=None) as batch_op:
+        batch_op.drop_index('idx_clean_data_scraper_cleaned_content_hash')
+        batch_op.drop_column('cleaned_content_hash')
+
+    with op.batch_alter_table('clean_data_upload', schema=None) as batch_op:
+        batch_op.drop_index('idx_clean_data_upload_dataset_cleaned_content_hash')
+        batch_op.drop_index('idx_clean_data_upload_cleaned_content_hash')
+        batch_op.drop_column('cleaned_content_hash')
@@ -0,0 +1,355 @@
+import os
+import time
+import logging
+import threading
+from datetime import datetime
+from functools import wraps
+from flask import request, jsonify, flash, redirect, url_for
+
+logger = logging.getLogger(__name__)
+
+class ModelRegistry:
+    """
+    Snapshot model yang sedang aktif beserta versinya. Tidak pernah diubah setelah
+    dibuat; reload membuat registry baru lalu menukarnya sekaligus, sehingga request
+    yang sedang berjalan tetap memakai model lama sampai selesai.
+    """
+    
+    def __init__(self, word2vec_model=None, naive_bayes_models=None, word2vec_version=None,
+                 naive_bayes_versions=None, version=0):
+        self.word2vec_model = word2vec_model
+        self.naive_bayes_models = naive_bayes_models or {}
+        self.word2vec_version = word2vec_version
+        self.naive_bayes_versions = naive_bayes_versions or {}
+        self.version = version
+        self.loaded_at = datetime.now()
+    
+    def to_dict(self):
+        return {
+            'version': self.version,
+            'loaded_at': self.loaded_at.isoformat(),
+            'word2vec': self.word2vec_version,
+            'naive_bayes': dict(self.naive_bayes_versions)
+        }
+
+class ModelLoader:
+    """
+    Memuat model Word2Vec dan 3 model Naive Bayes di thread background setelah
+    aplikasi mulai melayani request, sehingga restart tidak memblokir seluruh situs.
+    
+    Status: pending -> loading -> ready (atau failed). Selama belum ready,
+    endpoint klasifikasi menjawab 503 dengan header Retry-After.
+    
+    Setelah ready, model dapat di-reload tanpa restart (dipicu admin atau perubahan
+    mtime file model). Hanya file yang berubah yang dimuat ulang, lalu registry
+    ditukar secara atomik.
+    """
+    
+    STEPS = ('word2vec', 'model1', 'model2', 'model3')
+    
+    def __init__(self, app=None):
+        self.app = app
+        self.background = True
+        self.retry_after = 10
+        self.watch_interval = 60
+        self.registry = ModelRegistry()
+        self._thread = None
+        self._watch_thread = None
+        self._pending_versions = None
+        self._failed_versions = None
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._reset_state()
+        self._reload_state = {'status': 'idle', 'last_reload_at': None, 'duration_seconds': None,
+                              'reloaded': [], 'error': None}
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.background = app.config.get('MODEL_BACKGROUND_LOADING', True)
+        self.retry_after = app.config.get('MODEL_LOADING_RETRY_AFTER', 10)
+        
+        app.config.setdefault('WORD2VEC_MODEL', None)
+        app.config.setdefault('NAIVE_BAYES_MODELS', {})
+        app.models_loaded = False
+        
+        # Thread tidak ikut ter-fork (mis. gunicorn --preload), muat ulang di child
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+    
+    def _reset_state(self):
+        self._state = {
+            'status': 'pending',
+            'current_step': None,
+            'completed_steps': [],
+            'started_at': None,
+            'finished_at': None,
+            'duration_seconds': None,
+            'error': None
+        }
+    
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._thread = None
+        self._watch_thread = None
+        if self.app is not None and self._state['status'] == 'loading':
+            self._reset_state()
+            self.start()
+    
+    def start(self):
+        """Mulai memuat model (background atau sinkron sesuai MODEL_BACKGROUND_LOADING)"""
+        with self._lock:
+            if self._state['status'] in ('loading', 'ready'):
+                return
+            self._state['status'] = 'loading'
+            self._state['started_at'] = datetime.now()
+        
+        if not self.background:
+            self._load()
+            return
+        
+        self._thread = threading.Thread(target=self._load, name='model-loader', daemon=True)
+        self._thread.start()
+        logger.info("Model loading started in background thread")
+    
+    def _load(self):
+        app = self.app
+        started = time.perf_counter()
+        
+        try:
+            with app.app_context():
+                registry, reloaded = self._build_registry(self.registry, track_progress=True)
+            self._swap(registry)
+            
+            with self._lock:
+                self._state['status'] = 'ready'
+                self._state['current_step'] = None
+            app.models_loaded = True
+            logger.info(f"Models loaded: word2vec={'yes' if registry.word2vec_model else 'no'}, "
+                        f"naive_bayes={len(registry.naive_bayes_models)}/3")
+        
+        except Exception as e:
+            with self._lock:
+                self._state['status'] = 'failed'
+                self._state['error'] = str(e)
+            logger.error(f"Model loading failed: {str(e)}")
+        
+        finally:
+            with self._lock:
+                self._state['finished_at'] = datetime.now()
+                self._state['duration_seconds'] = round(time.perf_counter() - started, 3)
+        
+        if self.background and self.watch_interval:
+            self._start_watcher()
+    
+    def _build_registry(self, previous, track_progress=False):
+        """
+        Buat registry baru. Model yang versinya sama dengan registry sebelumnya dipakai
+        ulang; hanya file yang berubah yang dideserialisasi.
+        """
+        from utils import (load_word2vec_model, load_naive_bayes_model, get_naive_bayes_model_paths,
+                           get_word2vec_model_version, get_naive_bayes_model_versions)
+        
+        is_reload = previous.version > 0
+        reloaded = []
+        
+        if track_progress:
+            self._set_step('word2vec')
+        word2vec_version = get_word2vec_model_version()
+        if is_reload and word2vec_version == previous.word2vec_version:
+            word2vec_model = previous.word2vec_model
+        else:
+            word2vec_model = load_word2vec_model()
+            if is_reload and word2vec_model is None:
+                raise Exception('Model Word2Vec baru gagal dimuat')
+            reloaded.append('word2vec')
+        if track_progress:
+            self._complete_step('word2vec')
+        
+        naive_bayes_versions = get_naive_bayes_model_versions()
+        naive_bayes_models = {}
+        for model_name, model_path in get_naive_bayes_model_paths().items():
+            if track_progress:
+                self._set_step(model_name)
+            if is_reload and naive_bayes_versions.get(model_name) == previous.naive_bayes_versions.get(model_name):
+                model = previous.naive_bayes_models.get(model_name)
+            else:
+                model = load_naive_bayes_model(model_path)
+                if is_reload and model is None:
+                    raise Exception(f'Model Naive Bayes {model_name} baru gagal dimuat')
+                reloaded.append(model_name)
+            if model is not None:
+                naive_bayes_models[model_name] = model
+            if track_progress:
+                self._complete_step(model_name)
+        
+        registry = ModelRegistry(
+            word2vec_model=word2vec_model,
+            naive_bayes_models=naive_bayes_models,
+            word2vec_version=word2vec_version,
+            naive_bayes_versions=naive_bayes_versions,
+            version=previous.version + 1
+        )
+        return registry, reloaded
+    
+    def _swap(self, registry):
+        """Tukar registry aktif sekaligus; config diperbarui untuk kode yang masih membacanya"""
+        app = self.app
+        self.registry = registry
+        app.config['WORD2VEC_MODEL_VERSION'] = registry.word2vec_version
+        app.config['NAIVE_BAYES_MODEL_VERSIONS'] = registry.naive_bayes_versions
+        app.config['NAIVE_BAYES_MODELS'] = registry.naive_bayes_models
+        app.config['WORD2VEC_MODEL'] = registry.word2vec_model
+    
+    def get_registry(self):
+        """Snapshot model aktif; simpan di variabel lokal selama satu request/batch"""
+        return self.registry
+    
+    def reload(self, background=True):
+        """
+        Muat ulang model yang file-nya berubah lalu tukar registry secara atomik.
+        Return False jika model belum siap atau reload lain sedang berjalan.
+        """
+        if not self.is_ready():
+            return False
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        
+        with self._lock:
+            self._reload_state['status'] = 'reloading'
+            self._reload_state['error'] = None
+        
+        if background:
+            threading.Thread(target=self._reload, name='model-reloader', daemon=True).start()
+        else:
+            self._reload()
+        return True
+    
+    def _reload(self):
+        started = time.perf_counter()
+        try:
+            with self.app.app_context():
+                registry, reloaded = self._build_registry(self.registry)
+            if reloaded:
+                self._swap(registry)
+                logger.info(f"Models reloaded ({', '.join(reloaded)}), registry version {registry.version}")
+            with self._lock:
+                self._reload_state['status'] = 'idle'
+                self._reload_state['reloaded'] = reloaded
+        except Exception as e:
+            # Registry lama tetap aktif
+            with self._lock:
+                self._reload_state['status'] = 'failed'
+                self._reload_state['error'] = str(e)
+            logger.error(f"Model reload failed, keeping registry version {self.registry.version}: {str(e)}")
+        finally:
+            with self._lock:
+                self._reload_state['last_reload_at'] = datetime.now().isoformat()
+                self._reload_state['duration_seconds'] = round(time.perf_counter() - started, 3)
+            self._reload_lock.release()
+    
+    def check_for_changes(self):
+        """
+        Bandingkan versi file model (nama, ukuran, mtime) dengan registry aktif.
+        Reload baru dipicu jika perubahan yang sama terlihat dua kali berturut-turut,
+        agar file yang masih disalin tidak ikut dimuat.
+        """
+        from utils import get_word2vec_model_version, get_naive_bayes_model_versions
+        
+        with self.app.app_context():
+            current = (get_word2vec_model_version(), get_naive_bayes_model_versions())
+        
+        registry = self.registry
+        if current == (registry.word2vec_version, registry.naive_bayes_versions) or current == self._failed_versions:
+            self._pending_versions = None
+            return False
+        
+        if current != self._pending_versions:
+            self._pending_versions = current
+            return False
+        
+        self._pending_versions = None
+        started = self.reload(background=False)
+        if started and self._reload_state['status'] == 'failed':
+            # Jangan ulangi reload yang sama sampai file berubah lagi
+            self._failed_versions = current
+        return started
+    
+    def _start_watcher(self):
+        if self._watch_thread is not None:
+            return
+        self._watch_thread = threading.Thread(target=self._watch, name='model-watcher', daemon=True)
+        self._watch_thread.start()
+    
+    def _watch(self):
+        while True:
+            time.sleep(self.watch_interval)
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                logger.error(f"Model watcher error: {str(e)}")
+    
+    def _set_step(self, step):
+        with self._lock:
+            self._state['current_step'] = step
+    
+    def _complete_step(self, step):
+        with self._lock:
+            self._state['completed_steps'].append(step)
+    
+    def is_ready(self):
+        return self._state['status'] == 'ready'
+    
+    def get_status(self):
+        """Status pemuatan model untuk health check"""
+        with self._lock:
+            state = dict(self._state)
+            state['completed_steps'] = list(state['completed_steps'])
+        
+        duration = state['duration_seconds']
+        if duration is None and state['started_at'] is not None:
+            duration = round((datetime.now() - state['started_at']).total_seconds(), 3)
+        
+        return {
+            'status': state['status'],
+            'current_step': state['current_step'],
+            'progress': round(len(state['completed_steps']) / len(self.STEPS) * 100, 1),
+            'completed_steps': state['completed_steps'],
+            'started_at': state['started_at'].isoformat() if state['started_at'] else None,
+            'finished_at': state['finished_at'].isoformat() if state['finished_at'] else None,
+            'duration_seconds': duration,
+            'error': state['error'],
+            'registry': self.registry.to_dict(),
+            'reload': dict(self._reload_state)
+        }
+
+# Instance global model loader
+model_loader = ModelLoader()
+
+def models_ready_required(f):
+    """
+    Decorator untuk endpoint klasifikasi: jawab 503 + Retry-After selama model belum siap
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if model_loader.is_ready():
+            return f(*args, **kwargs)
+        
+        status = model_loader.get_status()
+        message = 'Model klasifikasi sedang dimuat. Silakan coba lagi beberapa saat lagi.'
+        if status['status'] == 'failed':
+            message = 'Model klasifikasi gagal dimuat. Silakan hubungi administrator.'
+        
+        # Halaman biasa diarahkan kembali dengan pesan, request API/AJAX dapat 503
+        if request.method == 'GET' and not request.is_json and not request.path.startswith('/api/'):
+            flash(message, 'warning')
+            return redirect(url_for('classification'))
+        
+        response = jsonify({'success': False, 'message': message, 'models': status})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(model_loader.retry_after)
+        return response
+    return decorated_function
@@ -1,10 +1,28 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
-from datetime import datetime
+from datetime import datetime, timedelta
 from werkzeug.security import generate_password_hash, check_password_hash
+import hashlib
 
 db = SQLAlchemy()
 
+def compute_content_hash(content):
+    """SHA-1 dari konten yang sudah di-trim, None untuk konten kosong"""
+    if content is None:
+        return None
+    normalized = str(content).strip()
+    if not normalized:
+        return None
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+def content_hash_default(context):
+    """Default kolom content_hash, dihitung dari kolom content pada saat insert"""
+    return compute_content_hash(context.get_current_parameters().get('content'))
+
+def cleaned_content_hash_default(context):
+    """Default kolom cleaned_content_hash, dihitung dari kolom cleaned_content pada saat insert"""
+    return compute_content_hash(context.get_current_parameters().get('cleaned_content'))
+
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
     
@@ -74,10 +92,14 @@ class Dataset(db.Model):
 
 class RawData(db.Model):
     __tablename__ = 'raw_data'
+    __table_args__ = (
+        db.Index('idx_raw_data_dataset_content_hash', 'dataset_id', 'content_hash'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(255), nullable=False)
     content = db.Column(db.Text, nullable=False)
+    content_hash = db.Column(db.String(40), nullable=True, default=content_hash_default)  # SHA-1 of trimmed content for duplicate detection
     url = db.Column(db.Text, nullable=True)
     platform = db.Column(db.String(50), nullable=False)  # twitter, tiktok, facebook
     source_type = db.Column(db.String(20), default='upload')  # upload or scraping
@@ -99,10 +121,14 @@ class RawData(db.Model):
 
 class RawDataScraper(db.Model):
     __tablename__ = 'raw_data_scraper'
+    __table_args__ = (
+        db.Index('idx_raw_data_scraper_dataset_content_hash', 'dataset_id', 'content_hash'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(255), nullable=False)
     content = db.Column(db.Text, nullable=False)
+    content_hash = db.Column(db.String(40), nullable=True, default=content_hash_default)  # SHA-1 of trimmed content for duplicate detection
     url = db.Column(db.Text, nullable=True)
     platform = db.Column(db.String(50), nullable=False)  # twitter, tiktok, facebook
     keyword = db.Column(db.String(255), nullable=False)
@@ -128,12 +154,17 @@ class RawDataScraper(db.Model):
 
 class CleanDataUpload(db.Model):
     __tablename__ = 'clean_data_upload'
+    __table_args__ = (
+        db.Index('idx_clean_data_upload_cleaned_content_hash', 'cleaned_content_hash'),
+        db.Index('idx_clean_data_upload_dataset_cleaned_content_hash', 'dataset_id', 'cleaned_content_hash'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     raw_data_id = db.Column(db.Integer, db.ForeignKey('raw_data.id'), nullable=False)
     username = db.Column(db.String(255), nullable=False)
     content = db.Column(db.Text, nullable=False)
     cleaned_content = db.Column(db.Text, nullable=False)
+    cleaned_content_hash = db.Column(db.String(40), nullable=True, default=cleaned_content_hash_default)  # SHA-1 of cleaned_content for duplicate detection
     url = db.Column(db.Text, nullable=True)
     platform = db.Column(db.String(50), nullable=False)
     dataset_id = db.Column(db.Integer, db.ForeignKey('datasets.id'), nullable=True)
@@ -148,12 +179,16 @@ class CleanDataUpload(db.Model):
 
 class CleanDataScraper(db.Model):
     __tablename__ = 'clean_data_scraper'
+    __table_args__ = (
+        db.Index('idx_clean_data_scraper_cleaned_content_hash', 'cleaned_content_hash'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     raw_data_scraper_id = db.Column(db.Integer, db.ForeignKey('raw_data_scraper.id'), nullable=False)
     username = db.Column(db.String(255), nullable=False)
     content = db.Column(db.Text, nullable=False)
     cleaned_content = db.Column(db.Text, nullable=False)
+    cleaned_content_hash = db.Column(db.String(40), nullable=True, default=cleaned_content_hash_default)  # SHA-1 of cleaned_content for duplicate detection
     url = db.Column(db.Text, nullable=True)
     platform = db.Column(db.String(50), nullable=False)
     keyword = db.Column(db.String(255), nullable=False)
@@ -178,6 +213,8 @@ class ClassificationResult(db.Model):
     probability_radikal = db.Column(db.Float, nullable=False)
     probability_non_radikal = db.Column(db.Float, nullable=False)
     classified_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    model_version = db.Column(db.String(64), nullable=True)  # Version of the Naive Bayes model file that produced this result
+    embedding_version = db.Column(db.String(64), nullable=True)  # Version of the Word2Vec embeddings used
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     # Manual correction fields
@@ -196,6 +233,278 @@ class ClassificationResult(db.Model):
         """Get the final prediction (corrected if available, otherwise original)"""
         return self.corrected_prediction if self.is_corrected else self.prediction
 
+class DocumentVector(db.Model):
+    __tablename__ = 'document_vectors'
+    __table_args__ = (
+        db.UniqueConstraint('data_type', 'data_id', name='uq_document_vectors_data_type_id'),
+        db.Index('idx_document_vectors_embedding_version', 'embedding_version'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    data_type = db.Column(db.String(20), nullable=False)  # 'upload' or 'scraper'
+    data_id = db.Column(db.Integer, nullable=False)  # ID from clean_data_upload or clean_data_scraper
+    embedding_version = db.Column(db.String(64), nullable=False)  # Word2Vec model version that produced the vector
+    content_hash = db.Column(db.String(40), nullable=False)  # SHA-1 of cleaned_content, detects edited rows
+    vector = db.Column(db.LargeBinary, nullable=False)  # float32 document vector as raw bytes
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<DocumentVector {self.data_type}:{self.data_id}>'
+
+class NearDuplicateSignature(db.Model):
+    __tablename__ = 'near_duplicate_signatures'
+    __table_args__ = (
+        db.UniqueConstraint('data_type', 'data_id', name='uq_near_duplicate_signatures_data_type_id'),
+        db.Index('idx_near_duplicate_signatures_cluster_id', 'cluster_id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    data_type = db.Column(db.String(20), nullable=False)  # 'upload' or 'scraper'
+    data_id = db.Column(db.Integer, nullable=False)  # ID from clean_data_upload or clean_data_scraper
+    content_hash = db.Column(db.String(40), nullable=False)  # SHA-1 of cleaned_content, detects edited rows
+    signature = db.Column(db.LargeBinary, nullable=False)  # MinHash signature (uint32 per permutation) as raw bytes
+    cluster_id = db.Column(db.Integer, nullable=True)  # Signature ID of the cluster representative
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    bands = db.relationship('NearDuplicateBand', backref='signature', lazy=True, cascade='all, delete-orphan')
+    
+    def __repr__(self):
+        return f'<NearDuplicateSignature {self.data_type}:{self.data_id} cluster={self.cluster_id}>'
+
+class NearDuplicateBand(db.Model):
+    __tablename__ = 'near_duplicate_bands'
+    __table_args__ = (
+        db.Index('idx_near_duplicate_bands_band', 'band_index', 'band_hash'),
+        db.Index('idx_near_duplicate_bands_signature_id', 'signature_id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    signature_id = db.Column(db.Integer, db.ForeignKey('near_duplicate_signatures.id', ondelete='CASCADE'), nullable=False)
+    band_index = db.Column(db.SmallInteger, nullable=False)  # LSH band number
+    band_hash = db.Column(db.BigInteger, nullable=False)  # Hash of the signature rows in this band
+    
+    def __repr__(self):
+        return f'<NearDuplicateBand {self.band_index}:{self.band_hash}>'
+
+class IngestionJob(db.Model):
+    __tablename__ = 'ingestion_jobs'
+    __table_args__ = (
+        db.Index('idx_ingestion_jobs_created_by_created_at', 'created_by', 'created_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(20), nullable=False, default='upload')
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, completed, failed
+    backend = db.Column(db.String(20), nullable=True)  # thread, celery, sync
+    filename = db.Column(db.String(255), nullable=True)
+    dataset_id = db.Column(db.Integer, db.ForeignKey('datasets.id', ondelete='SET NULL'), nullable=True)
+    dataset_name = db.Column(db.String(255), nullable=True)
+    params = db.Column(db.JSON, nullable=True)  # Upload id, column mapping and file info for the worker
+    total_rows = db.Column(db.Integer, default=0)
+    rows_read = db.Column(db.Integer, default=0)
+    rows_inserted = db.Column(db.Integer, default=0)
+    rows_skipped = db.Column(db.Integer, default=0)  # Rows without content
+    error_message = db.Column(db.Text, nullable=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    worker_id = db.Column(db.String(255), nullable=True)  # hostname:pid of the process running the job
+    last_progress_at = db.Column(db.DateTime, nullable=True)  # Heartbeat refreshed after every committed chunk
+    
+    user = db.relationship('User', backref=db.backref('ingestion_jobs', lazy=True))
+    
+    def to_dict(self):
+        if self.status == 'completed':
+            progress_percentage = 100
+        elif self.total_rows:
+            progress_percentage = min(99, int((self.rows_read or 0) * 100 / self.total_rows))
+        else:
+            progress_percentage = 0
+        
+        return {
+            'id': self.id,
+            'job_type': self.job_type,
+            'status': self.status,
+            'filename': self.filename,
+            'dataset_id': self.dataset_id,
+            'dataset_name': self.dataset_name,
+            'total_rows': self.total_rows or 0,
+            'rows_read': self.rows_read or 0,
+            'rows_inserted': self.rows_inserted or 0,
+            'rows_skipped': self.rows_skipped or 0,
+            'progress_percentage': progress_percentage,
+            'error_message': self.error_message,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+    
+    def __repr__(self):
+        return f'<IngestionJob {self.id} {self.status}>'
+
+class ScrapingJob(db.Model):
+    __tablename__ = 'scraping_jobs'
+    __table_args__ = (
+        db.Index('idx_scraping_jobs_created_by_created_at', 'created_by', 'created_at'),
+        db.Index('idx_scraping_jobs_status', 'status'),
+        db.Index('idx_scraping_jobs_scheduled_scrape_id', 'scheduled_scrape_id'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, completed, failed
+    backend = db.Column(db.String(20), nullable=True)  # thread, celery, sync
+    platform = db.Column(db.String(50), nullable=False)
+    keyword = db.Column(db.String(255), nullable=False)
+    date_from = db.Column(db.String(20), nullable=True)  # YYYY-MM-DD as sent to the actor
+    date_to = db.Column(db.String(20), nullable=True)
+    max_results = db.Column(db.Integer, default=25)
+    params = db.Column(db.JSON, nullable=True)  # Instagram specific actor parameters
+    dataset_id = db.Column(db.Integer, db.ForeignKey('datasets.id', ondelete='SET NULL'), nullable=True)
+    dataset_name = db.Column(db.String(255), nullable=True)
+    run_id = db.Column(db.String(100), nullable=True)  # Apify actor run ID
+    apify_status = db.Column(db.String(20), nullable=True)  # Last status reported by Apify
+    poll_count = db.Column(db.Integer, default=0)  # Also used to claim each poll atomically
+    items_count = db.Column(db.Integer, default=0)
+    temp_id = db.Column(db.String(36), nullable=True)  # Temporary results file for column mapping
+    raw_items = db.deferred(db.Column(db.LargeBinary, nullable=True))  # Gzip JSON Lines of the raw Apify items, for re-mapping
+    raw_items_size = db.Column(db.Integer, nullable=True)  # Compressed bytes
+    scheduled_scrape_id = db.Column(db.Integer, db.ForeignKey('scheduled_scrapes.id', ondelete='SET NULL'), nullable=True)
+    records_added = db.Column(db.Integer, nullable=True)  # Scheduled runs: rows saved, cleaned and classified
+    cleaned_count = db.Column(db.Integer, nullable=True)
+    classified_count = db.Column(db.Integer, nullable=True)
+    timings = db.Column(db.JSON, nullable=True)  # Seconds per stage (apify_run, fetch, save, clean, classify)
+    since_item_id = db.Column(db.String(100), nullable=True)  # Watermark snapshot the run was narrowed to
+    since_item_at = db.Column(db.DateTime, nullable=True)
+    newest_item_id = db.Column(db.String(100), nullable=True)  # Newest item of this run, becomes the watermark once mapped
+    newest_item_at = db.Column(db.DateTime, nullable=True)
+    covered_from = db.Column(db.DateTime, nullable=True)  # Start of the range this run fetched completely
+    error_message = db.Column(db.Text, nullable=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    last_polled_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    user = db.relationship('User', backref=db.backref('scraping_jobs', lazy=True))
+    
+    def to_dict(self):
+        elapsed_time = None
+        if self.started_at:
+            elapsed_time = ((self.finished_at or datetime.utcnow()) - self.started_at).total_seconds()
+        
+        if self.status == 'completed':
+            progress_percentage = 100
+        elif self.status == 'running' and elapsed_time is not None:
+            # Apify does not report progress; most runs take 30-120 seconds
+            progress_percentage = min(95, 10 + int(elapsed_time * 85 / 90))
+        else:
+            progress_percentage = 5 if self.status == 'pending' else 0
+        
+        return {
+            'id': self.id,
+            'status': self.status,
+            'platform': self.platform,
+            'keyword': self.keyword,
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'max_results': self.max_results,
+            'dataset_id': self.dataset_id,
+            'dataset_name': self.dataset_name,
+            'run_id': self.run_id,
+            'apify_status': self.apify_status,
+            'items_count': self.items_count or 0,
+            'since_item_at': self.since_item_at.isoformat() if self.since_item_at else None,
+            'scheduled_scrape_id': self.scheduled_scrape_id,
+            'records_added': self.records_added,
+            'cleaned_count': self.cleaned_count,
+            'classified_count': self.classified_count,
+            'timings': self.timings,
+            'has_raw_items': bool(self.raw_items_size),
+            'progress_percentage': progress_percentage,
+            'elapsed_time': elapsed_time,
+            'error_message': self.error_message,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+    
+    def __repr__(self):
+        return f'<ScrapingJob {self.id} {self.platform} {self.status}>'
+
+class ScrapingWatermark(db.Model):
+    __tablename__ = 'scraping_watermarks'
+    __table_args__ = (
+        db.UniqueConstraint('platform', 'keyword', 'dataset_id', name='uq_scraping_watermarks_platform_keyword_dataset'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    platform = db.Column(db.String(50), nullable=False)
+    keyword = db.Column(db.String(255), nullable=False)  # Normalized: stripped and lower case
+    dataset_id = db.Column(db.Integer, db.ForeignKey('datasets.id', ondelete='CASCADE'), nullable=False)
+    last_item_id = db.Column(db.String(100), nullable=True)  # Newest post ID already saved to the dataset
+    last_item_at = db.Column(db.DateTime, nullable=False)  # Timestamp (UTC) of that post
+    covered_from = db.Column(db.DateTime, nullable=True)  # Start of the range fully saved up to last_item_at
+    last_run_id = db.Column(db.String(100), nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ScrapingWatermark {self.platform}:{self.keyword} dataset={self.dataset_id} {self.last_item_at}>'
+
+class ScheduledScrape(db.Model):
+    __tablename__ = 'scheduled_scrapes'
+    __table_args__ = (
+        db.Index('idx_scheduled_scrapes_active_next_run_at', 'is_active', 'next_run_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    platform = db.Column(db.String(50), nullable=False)
+    keyword = db.Column(db.String(255), nullable=False)
+    interval_minutes = db.Column(db.Integer, nullable=False)  # Cadence; runs stay aligned to next_run_at
+    max_results = db.Column(db.Integer, default=100)
+    dataset_id = db.Column(db.Integer, db.ForeignKey('datasets.id', ondelete='CASCADE'), nullable=False)
+    auto_clean = db.Column(db.Boolean, default=False)
+    auto_classify = db.Column(db.Boolean, default=False)  # Implies cleaning first
+    is_active = db.Column(db.Boolean, default=True)
+    next_run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_run_at = db.Column(db.DateTime, nullable=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    dataset = db.relationship('Dataset', backref=db.backref('scheduled_scrapes', lazy=True, passive_deletes=True))
+    runs = db.relationship('ScrapingJob', backref='scheduled_scrape', lazy='dynamic', passive_deletes=True)
+    
+    def compute_next_run(self, now=None):
+        """Next slot on the interval grid after now; missed slots (e.g. downtime) are skipped, not replayed"""
+        now = now or datetime.utcnow()
+        interval = timedelta(minutes=self.interval_minutes)
+        next_run_at = self.next_run_at or now
+        if next_run_at <= now:
+            next_run_at += interval * ((now - next_run_at) // interval + 1)
+        return next_run_at
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'platform': self.platform,
+            'keyword': self.keyword,
+            'interval_minutes': self.interval_minutes,
+            'max_results': self.max_results,
+            'dataset_id': self.dataset_id,
+            'dataset_name': self.dataset.name if self.dataset else None,
+            'auto_clean': bool(self.auto_clean),
+            'auto_classify': bool(self.auto_classify),
+            'is_active': bool(self.is_active),
+            'next_run_at': self.next_run_at.isoformat() if self.next_run_at else None,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+    
+    def __repr__(self):
+        return f'<ScheduledScrape {self.id} {self.platform}:{self.keyword} every {self.interval_minutes}m>'
+
 class UserActivity(db.Model):
     __tablename__ = 'user_activities'
     
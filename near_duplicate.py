@@ -0,0 +1,249 @@
+import hashlib
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+
+class NearDuplicateIndex:
+    """
+    Index near-duplicate untuk cleaned_content berbasis MinHash LSH.
+    
+    Setiap baris clean mendapat signature MinHash dari himpunan katanya (sama seperti
+    vektor dokumen Word2Vec yang tidak peduli urutan kata). Baris bergabung ke cluster
+    yang representatifnya memiliki estimasi kemiripan Jaccard >= NEAR_DUPLICATE_THRESHOLD;
+    jika tidak ada, baris menjadi representatif cluster baru. Hanya representatif yang
+    disimpan di tabel band, sehingga pencarian kandidat cukup satu query IN per chunk
+    dan baris baru diindex secara inkremental tanpa membangun ulang index.
+    
+    Dengan NEAR_DUPLICATE_CLASSIFY_REPRESENTATIVES, klasifikasi massal cukup menjalankan
+    model untuk satu baris per cluster lalu menyalin hasilnya ke anggota lain.
+    """
+    
+    NUM_PERM = 64
+    BANDS = 16
+    ROWS_PER_BAND = NUM_PERM // BANDS
+    SEED = 1
+    MAX_CANDIDATES_PER_BAND = 100
+    
+    def __init__(self, app=None):
+        self.app = app
+        self.enabled = True
+        self.threshold = 0.8
+        self.classify_representatives = False
+        
+        # Parameter permutasi tetap agar signature lama tetap bisa dibandingkan
+        rng = np.random.RandomState(self.SEED)
+        self._a = rng.randint(1, 2 ** 31 - 1, size=self.NUM_PERM).astype(np.uint64)
+        self._b = rng.randint(0, 2 ** 31 - 1, size=self.NUM_PERM).astype(np.uint64)
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('NEAR_DUPLICATE_ENABLED', True)
+        self.threshold = app.config.get('NEAR_DUPLICATE_THRESHOLD', 0.8)
+        self.classify_representatives = app.config.get('NEAR_DUPLICATE_CLASSIFY_REPRESENTATIVES', False)
+    
+    def compute_signature(self, text):
+        """Signature MinHash (uint32 per permutasi) dari himpunan kata, None untuk teks kosong"""
+        tokens = set(text.split()) if text else set()
+        if not tokens:
+            return None
+        
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=4).digest(), 'little') for token in tokens),
+            dtype=np.uint64, count=len(tokens)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+    
+    def compute_band_hashes(self, signature):
+        """Hash 64-bit (signed, muat di BIGINT) untuk setiap band signature"""
+        rows = self.ROWS_PER_BAND
+        return [
+            int.from_bytes(hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest(),
+                           'little', signed=True)
+            for band in range(self.BANDS)
+        ]
+    
+    @staticmethod
+    def similarity(signature_a, signature_b):
+        """Estimasi kemiripan Jaccard dari dua signature"""
+        if len(signature_a) != len(signature_b):
+            return 0.0
+        return float(np.mean(signature_a == signature_b))
+    
+    def index(self, items, chunk_size=1000):
+        """
+        Index item (data_type, data_id, cleaned_content) yang belum ada atau isinya berubah,
+        lalu return {(data_type, data_id): cluster_id}. Item kosong tidak diindex.
+        Commit dilakukan oleh pemanggil.
+        """
+        from models import db, NearDuplicateSignature, NearDuplicateBand, compute_content_hash
+        
+        items = list(items)
+        if not self.enabled or not items:
+            return {}
+        
+        stored = self._get_signature_rows(items, chunk_size)
+        clusters = {}
+        entries = []
+        
+        for data_type, data_id, content in items:
+            key = (data_type, data_id)
+            if key in clusters:
+                continue
+            
+            content_hash = compute_content_hash(content)
+            signature = self.compute_signature(content) if content_hash else None
+            if signature is None:
+                continue
+            
+            row = stored.get(key)
+            if row is not None and row.content_hash == content_hash:
+                clusters[key] = row.cluster_id
+                continue
+            
+            if row is None:
+                row = NearDuplicateSignature(data_type=data_type, data_id=data_id)
+                db.session.add(row)
+            else:
+                # Isi berubah: cluster dihitung ulang
+                row.bands = []
+            row.content_hash = content_hash
+            row.signature = signature.tobytes()
+            entries.append((key, row, signature, self.compute_band_hashes(signature)))
+            clusters[key] = None
+        
+        if not entries:
+            return clusters
+        
+        band_map, representative_signatures = self._find_representatives(entries, chunk_size)
+        
+        # Representatif baru dari batch ini ikut menjadi kandidat untuk baris berikutnya
+        batch_bands = {}
+        assignments = []
+        for key, row, signature, band_hashes in entries:
+            best_cluster, best_similarity = None, self.threshold
+            checked = set()
+            
+            for band_key in enumerate(band_hashes):
+                candidates = [(representative_id, representative_signatures.get(representative_id))
+                              for representative_id in band_map.get(band_key, ())]
+                candidates += batch_bands.get(band_key, [])
+                
+                for cluster, candidate_signature in candidates:
+                    marker = ('index', cluster) if isinstance(cluster, int) else ('batch', id(cluster))
+                    if marker in checked or candidate_signature is None or cluster is row or cluster == row.id:
+                        continue
+                    checked.add(marker)
+                    
+                    candidate_similarity = self.similarity(signature, candidate_signature)
+                    if candidate_similarity >= best_similarity:
+                        best_cluster, best_similarity = cluster, candidate_similarity
+            
+            if best_cluster is None:
+                row.bands = [NearDuplicateBand(band_index=band_index, band_hash=band_hash)
+                             for band_index, band_hash in enumerate(band_hashes)]
+                for band_key in enumerate(band_hashes):
+                    batch_bands.setdefault(band_key, []).append((row, signature))
+                best_cluster = row
+            
+            assignments.append((key, row, best_cluster))
+        
+        # ID representatif dari batch ini baru tersedia setelah flush
+        db.session.flush()
+        for key, row, cluster in assignments:
+            row.cluster_id = cluster if isinstance(cluster, int) else cluster.id
+            clusters[key] = row.cluster_id
+        
+        return clusters
+    
+    def index_clean_rows(self, clean_rows):
+        """Index baris CleanDataUpload/CleanDataScraper yang baru ditambahkan ke session"""
+        from models import db, CleanDataUpload
+        
+        clean_rows = [clean_row for clean_row in clean_rows if clean_row is not None]
+        if not self.enabled or not clean_rows:
+            return {}
+        
+        db.session.flush()
+        return self.index(
+            ('upload' if isinstance(clean_row, CleanDataUpload) else 'scraper', clean_row.id, clean_row.cleaned_content)
+            for clean_row in clean_rows
+        )
+    
+    def select_representatives(self, items):
+        """
+        Pilih satu item per cluster untuk diklasifikasi. Return (representative_items,
+        representative_rows) dengan representative_rows[i] = posisi di representative_items
+        yang hasilnya dipakai item ke-i. Tanpa NEAR_DUPLICATE_CLASSIFY_REPRESENTATIVES
+        setiap item mewakili dirinya sendiri.
+        """
+        items = list(items)
+        if not self.enabled or not self.classify_representatives or not items:
+            return items, list(range(len(items)))
+        
+        # Item yang belum diindex (mis. dibersihkan sebelum fitur ini aktif) diindex sekarang
+        clusters = self.index(items)
+        
+        representative_items = []
+        representative_rows = []
+        positions = {}
+        for item in items:
+            cluster_id = clusters.get((item[0], item[1]))
+            group = ('cluster', cluster_id) if cluster_id is not None else ('item', item[0], item[1])
+            if group not in positions:
+                positions[group] = len(representative_items)
+                representative_items.append(item)
+            representative_rows.append(positions[group])
+        
+        return representative_items, representative_rows
+    
+    def _get_signature_rows(self, items, chunk_size):
+        from models import NearDuplicateSignature
+        
+        stored = {}
+        for data_type in set(item[0] for item in items):
+            data_ids = list(set(item[1] for item in items if item[0] == data_type))
+            for start in range(0, len(data_ids), chunk_size):
+                rows = NearDuplicateSignature.query.filter(
+                    NearDuplicateSignature.data_type == data_type,
+                    NearDuplicateSignature.data_id.in_(data_ids[start:start + chunk_size])
+                ).all()
+                for row in rows:
+                    stored[(row.data_type, row.data_id)] = row
+        return stored
+    
+    def _find_representatives(self, entries, chunk_size):
+        """Representatif yang berbagi minimal satu band dengan entries, dengan signature-nya"""
+        from models import NearDuplicateSignature, NearDuplicateBand
+        
+        band_hashes = list({band_hash for _, _, _, hashes in entries for band_hash in hashes})
+        band_map = {}
+        for start in range(0, len(band_hashes), chunk_size):
+            rows = NearDuplicateBand.query.with_entities(
+                NearDuplicateBand.signature_id, NearDuplicateBand.band_index, NearDuplicateBand.band_hash
+            ).filter(NearDuplicateBand.band_hash.in_(band_hashes[start:start + chunk_size]))
+            for row in rows:
+                representative_ids = band_map.setdefault((row.band_index, row.band_hash), [])
+                if len(representative_ids) < self.MAX_CANDIDATES_PER_BAND:
+                    representative_ids.append(row.signature_id)
+        
+        representative_ids = list({representative_id for ids in band_map.values() for representative_id in ids})
+        signatures = {}
+        for start in range(0, len(representative_ids), chunk_size):
+            rows = NearDuplicateSignature.query.with_entities(
+                NearDuplicateSignature.id, NearDuplicateSignature.signature
+            ).filter(NearDuplicateSignature.id.in_(representative_ids[start:start + chunk_size]))
+            for row in rows:
+                signatures[row.id] = np.frombuffer(row.signature, dtype=np.uint32)
+        
+        return band_map, signatures
+
+# Instance global index near-duplicate
+near_duplicate_index = NearDuplicateIndex()
@@ -0,0 +1,139 @@
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class PredictionCache:
+    """
+    Cache hasil klasifikasi per teks bersih. Key berupa hash dari teks bersih
+    dan versi model yang sedang dimuat, nilai berupa hasil prediksi per model.
+    
+    Cache lokal berupa LRU dengan TTL. Jika REDIS_URL tersedia, Redis dipakai
+    sebagai backend bersama agar hit berlaku lintas worker.
+    """
+    
+    KEY_PREFIX = 'waskita:prediction:'
+    
+    def __init__(self, app=None):
+        self.app = app
+        self.enabled = True
+        self.max_size = 10000
+        self.ttl = 3600
+        self.redis = None
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'local_hits': 0, 'shared_hits': 0, 'misses': 0, 'sets': 0, 'shared_errors': 0}
+        
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app):
+        self.app = app
+        self.enabled = app.config.get('PREDICTION_CACHE_ENABLED', True)
+        self.max_size = app.config.get('PREDICTION_CACHE_SIZE', 10000)
+        self.ttl = app.config.get('PREDICTION_CACHE_TTL', 3600)
+        
+        redis_url = app.config.get('PREDICTION_CACHE_REDIS_URL')
+        if self.enabled and redis_url:
+            try:
+                import redis
+                self.redis = redis.Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+                self.redis.ping()
+                logger.info("Prediction cache menggunakan backend Redis bersama")
+            except Exception as e:
+                # Tetap jalan dengan cache lokal saja
+                logger.warning(f"Redis tidak tersedia untuk prediction cache, memakai cache lokal: {str(e)}")
+                self.redis = None
+    
+    @staticmethod
+    def make_key(cleaned_text, model_versions):
+        """Buat key dari hash teks bersih + versi model"""
+        version_part = json.dumps(model_versions, sort_keys=True, default=str)
+        digest = hashlib.sha256(f"{version_part}\n{cleaned_text}".encode('utf-8')).hexdigest()
+        return digest
+    
+    def get(self, key):
+        """Ambil hasil dari cache, None jika miss"""
+        if not self.enabled:
+            return None
+        
+        now = time.time()
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._local.move_to_end(key)
+                    self._stats['hits'] += 1
+                    self._stats['local_hits'] += 1
+                    return value
+                del self._local[key]
+        
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(self.KEY_PREFIX + key)
+                if raw is not None:
+                    value = json.loads(raw)
+                    self._set_local(key, value, now)
+                    with self._lock:
+                        self._stats['hits'] += 1
+                        self._stats['shared_hits'] += 1
+                    return value
+            except Exception as e:
+                with self._lock:
+                    self._stats['shared_errors'] += 1
+        
+        with self._lock:
+            self._stats['misses'] += 1
+        return None
+    
+    def set(self, key, value):
+        """Simpan hasil ke cache lokal dan backend bersama"""
+        if not self.enabled:
+            return
+        
+        self._set_local(key, value, time.time())
+        with self._lock:
+            self._stats['sets'] += 1
+        
+        if self.redis is not None:
+            try:
+                self.redis.setex(self.KEY_PREFIX + key, self.ttl, json.dumps(value))
+            except Exception as e:
+                with self._lock:
+                    self._stats['shared_errors'] += 1
+    
+    def _set_local(self, key, value, now):
+        with self._lock:
+            self._local[key] = (now + self.ttl, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_size:
+                self._local.popitem(last=False)
+    
+    def clear(self):
+        """Kosongkan cache lokal (cache bersama kadaluarsa sendiri lewat TTL)"""
+        with self._lock:
+            self._local.clear()
+    
+    def get_stats(self):
+        """Statistik cache untuk monitoring"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['local_size'] = len(self._local)
+        
+        lookups = stats['hits'] + stats['misses']
+        stats.update({
+            'enabled': self.enabled,
+            'backend': 'redis' if self.redis is not None else 'local',
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+            'hit_rate': round(stats['hits'] / lookups, 4) if lookups else 0.0
+        })
+        return stats
+
+# Instance global cache
+prediction_cache = PredictionCache()
@@ -8,10 +8,8 @@ import numpy as np
 from datetime import datetime, date
 import pytz
 import re
-import json
 import pickle
 import uuid
-import tempfile
 
 # Conditional imports for ML libraries
 try:
@@ -33,9 +31,15 @@ try:
 except ImportError:
     OPENPYXL_AVAILABLE = False
 from sqlalchemy import func, desc, text
-from models import db, User, RawData, RawDataScraper, CleanDataUpload, CleanDataScraper, ClassificationResult, DatasetStatistics, Dataset
-from utils import clean_text, vectorize_text, classify_content, scrape_with_apify, admin_required, active_user_required, format_datetime, check_content_duplicate, check_cleaned_content_duplicate, check_cleaned_content_duplicate_by_dataset, generate_activity_log
+from models import db, User, RawData, RawDataScraper, CleanDataUpload, CleanDataScraper, ClassificationResult, DatasetStatistics, Dataset, IngestionJob, ScrapingJob, ScheduledScrape
+from utils import clean_text, clean_texts, vectorize_text, get_document_vectors, classify_content, classify_contents, admin_required, active_user_required, format_datetime, check_cleaned_content_duplicate, CleanedContentDeduper, generate_activity_log
 from security_utils import SecurityValidator, generate_secure_filename, log_security_event, add_security_headers
+from prediction_cache import prediction_cache
+from model_loader import model_loader, models_ready_required
+from near_duplicate import near_duplicate_index
+from ingestion import get_staging_dir, stage_upload, read_staged_upload, remove_staged_upload, cleanup_stale_staging
+from background_jobs import background_job_runner
+from scraping_jobs import submit_scraping_job, read_scraping_temp_file, iter_scraping_temp_rows, remove_scraping_temp_file, advance_scraping_watermark, save_scraped_rows, read_scraping_job_results, iter_scraping_job_rows
 
 def init_routes(app, word2vec_model_param, naive_bayes_models_param):
     # Store models in app config for global access
@@ -431,46 +435,31 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 db.session.add(dataset)
                 db.session.flush()  # Get the ID
                 
-                # Use Apify API for scraping - get raw results for column mapping
-                scraped_data, run_id = scrape_with_apify(
+                # Run the Apify scrape as a background job; results are fetched for column mapping
+                scraping_job = ScrapingJob(
+                    status='pending',
+                    backend=background_job_runner.backend,
                     platform=platform,
                     keyword=keyword,
                     date_from=date_from,
                     date_to=date_to,
-                    max_results=max_results
+                    max_results=max_results,
+                    dataset_id=dataset.id,
+                    dataset_name=dataset.name,
+                    created_by=current_user.id
                 )
+                db.session.add(scraping_job)
+                db.session.commit()
+                submit_scraping_job(scraping_job)
                 
-                # Store scraping info in session for column mapping
-                session['scraping_platform'] = platform
-                session['scraping_keyword'] = keyword
-                session['scraping_date_from'] = date_from
-                session['scraping_date_to'] = date_to
-                session['scraping_max_results'] = max_results
-                session['scraping_dataset_id'] = dataset.id
-                session['scraping_dataset_name'] = dataset.name
-                session['scraping_run_id'] = run_id
-                session['scraping_raw_data'] = scraped_data
-                
-                # Get available columns from first item
-                if scraped_data:
-                    first_item = scraped_data[0]
-                    available_columns = list(first_item.keys())
-                    
-                    # Get sample data for preview (first 5 items)
-                    sample_data = scraped_data[:5]
-                    
-                    return jsonify({
-                        'success': True,
-                        'show_mapping': True,
-                        'columns': available_columns,
-                        'sample_data': sample_data,
-                        'platform': platform,
-                        'total_items': len(scraped_data),
-                        'run_id': run_id
-                    })
-                else:
-                    flash('Tidak ada data yang ditemukan untuk scraping ini', 'warning')
-                    return redirect(url_for('scraping_page'))
+                return jsonify({
+                    'success': True,
+                    'message': f'Scraping {platform} sedang berjalan di background',
+                    'job_id': scraping_job.id,
+                    'status_url': url_for('get_scraping_job', job_id=scraping_job.id),
+                    'dataset_id': dataset.id,
+                    'platform': platform
+                })
                 
             except Exception as e:
                 db.session.rollback()
@@ -860,6 +849,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 raw_data.status = 'cleaned'
             
             db.session.add(clean_data)
+            near_duplicate_index.index_clean_rows([clean_data])
             db.session.commit()
             
             # Update dataset total_records
@@ -1141,6 +1131,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
 
     @app.route('/classification/classify/<data_type>/<int:data_id>')
     @login_required
+    @models_ready_required
     def classify_data(data_type, data_id):
         try:
             if data_type == 'upload':
@@ -1169,8 +1160,9 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 return redirect(url_for('classification'))
             
             # Get models from app config
-            word2vec_model = current_app.config.get('WORD2VEC_MODEL')
-            naive_bayes_models = current_app.config.get('NAIVE_BAYES_MODELS', {})
+            registry = model_loader.get_registry()
+            word2vec_model = registry.word2vec_model
+            naive_bayes_models = registry.naive_bayes_models
             
             # Vectorize content using Word2Vec
             if word2vec_model:
@@ -1194,6 +1186,8 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                             data_type=data_type,
                             data_id=data_id,
                             model_name=model_name,
+                            model_version=registry.naive_bayes_versions.get(model_name),
+                            embedding_version=registry.word2vec_version,
                             prediction=prediction,
                             probability_radikal=prob_radikal,
                             probability_non_radikal=prob_non_radikal,
@@ -1360,6 +1354,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
     
     @app.route('/classification/batch/process', methods=['POST'])
     @login_required
+    @models_ready_required
     def process_batch_classification():
         try:
             selected_data = request.json.get('selected_data', [])
@@ -1369,6 +1364,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             
             processed_count = 0
             error_count = 0
+            pending_items = []
             
             for item in selected_data:
                 try:
@@ -1400,42 +1396,47 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     if existing_classification:
                         continue  # Skip if already classified
                     
-                    # Get models from app config
-                    word2vec_model = current_app.config.get('WORD2VEC_MODEL')
-                    naive_bayes_models = current_app.config.get('NAIVE_BAYES_MODELS', {})
-                    
-                    # Vectorize and classify
-                    if word2vec_model:
-                        vector = vectorize_text(content, word2vec_model)
-                        
-                        # Classify using all three models
-                        for model_name, model in naive_bayes_models.items():
-                            if model:
-                                prediction, probabilities = classify_content(vector, model)
-                                
-                                # Save classification result
-                                # Handle probabilities consistently
-                                if isinstance(probabilities, (list, tuple, np.ndarray)) and len(probabilities) >= 2:
-                                    prob_non_radikal = float(probabilities[0])
-                                    prob_radikal = float(probabilities[1])
-                                else:
-                                    prob_non_radikal = 0.0
-                                    prob_radikal = 0.0
-                                
-                                result = ClassificationResult(
-                                    data_type=data_type,
-                                    data_id=data_id,
-                                    model_name=model_name,
-                                    prediction=prediction,
-                                    probability_radikal=prob_radikal,
-                                    probability_non_radikal=prob_non_radikal,
-                                    created_at=datetime.now()
-                                )
-                                db.session.add(result)
+                    pending_items.append((data_type, data_id, content))
                         
-                        processed_count += 1
-                    else:
-                        error_count += 1
+                except Exception as e:
+                    error_count += 1
+                    continue
+            
+            # Get models from app config
+            registry = model_loader.get_registry()
+            word2vec_model = registry.word2vec_model
+            naive_bayes_models = registry.naive_bayes_models
+            
+            if pending_items and not word2vec_model:
+                error_count += len(pending_items)
+                pending_items = []
+            
+            # Reuse stored document vectors, vectorize only missing rows, then classify the whole matrix per model
+            # Optionally classify one representative per near-duplicate cluster and copy its result
+            representative_items, representative_rows = near_duplicate_index.select_representatives(pending_items)
+            vectors = get_document_vectors(representative_items, word2vec_model, registry.word2vec_version)
+            classifications = classify_contents(vectors, naive_bayes_models)
+            
+            for item_index, (data_type, data_id, _) in enumerate(pending_items):
+                row_index = representative_rows[item_index]
+                try:
+                    # Save one result per model
+                    for model_name, (predictions, probabilities) in classifications.items():
+                        result = ClassificationResult(
+                            data_type=data_type,
+                            data_id=data_id,
+                            model_name=model_name,
+                            model_version=registry.naive_bayes_versions.get(model_name),
+                            embedding_version=registry.word2vec_version,
+                            prediction=predictions[row_index],
+                            probability_radikal=float(probabilities[row_index][1]),
+                            probability_non_radikal=float(probabilities[row_index][0]),
+                            classified_by=current_user.id,
+                            created_at=datetime.now()
+                        )
+                        db.session.add(result)
+                    
+                    processed_count += 1
                         
                 except Exception as e:
                     error_count += 1
@@ -1942,43 +1943,26 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             # Get file size in bytes
             file_size = os.path.getsize(filepath)
             
-            # Read and process file with proper encoding handling
-            if file_info['mime_type'] in ['text/csv', 'text/plain', 'application/csv']:
-                # Try different encodings for CSV files
-                encodings_to_try = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252', 'iso-8859-1']
-                df = None
-                last_error = None
-                
-                for encoding in encodings_to_try:
-                    try:
-                        df = pd.read_csv(filepath, encoding=encoding)
-                        app.logger.info(f"Successfully read CSV with encoding: {encoding}")
-                        break
-                    except (UnicodeDecodeError, UnicodeError) as e:
-                        last_error = e
-                        app.logger.warning(f"Failed to read CSV with encoding {encoding}: {str(e)}")
-                        continue
-                    except Exception as e:
-                        # For other errors (like parsing errors), try with error handling
-                        try:
-                            df = pd.read_csv(filepath, encoding=encoding, on_bad_lines='skip')
-                            app.logger.info(f"Successfully read CSV with encoding {encoding} (skipping bad lines)")
-                            break
-                        except Exception as e2:
-                            last_error = e2
-                            app.logger.warning(f"Failed to read CSV with encoding {encoding} even with error handling: {str(e2)}")
-                            continue
-                
-                if df is None:
-                    raise Exception(f"Could not read CSV file with any encoding. Last error: {str(last_error)}")
-            else:
-                df = pd.read_excel(filepath)
+            # Parse the file once (CSV encoding detected from a byte sample) and stage the
+            # parsed chunks under UPLOAD_FOLDER so column mapping never re-reads the file
+            cleanup_stale_staging(app.config['UPLOAD_FOLDER'])
+            previous_upload_id = session.pop('upload_id', None)
+            if previous_upload_id:
+                remove_staged_upload(get_staging_dir(app.config['UPLOAD_FOLDER'], previous_upload_id))
+            
+            upload_id = uuid.uuid4().hex
+            staging_dir = get_staging_dir(app.config['UPLOAD_FOLDER'], upload_id)
+            columns, preview_df, row_count = stage_upload(
+                filepath, unique_filename, staging_dir,
+                chunk_size=app.config.get('UPLOAD_CHUNK_SIZE', 50000)
+            )
+            app.logger.info(f"Staged upload {upload_id}: {row_count} rows, {len(columns)} columns")
             
-            # Store file temporarily and show column mapping page
-
+            # The staged copy replaces the uploaded file
+            os.remove(filepath)
             
             # Get sample data for preview (first 5 rows) with input sanitization
-            sample_df = df.head(5).fillna('')
+            sample_df = preview_df.fillna('')
             
             # Clean sample data to ensure JSON serialization works properly
             sample_data = []
@@ -2005,10 +1989,10 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 sample_data.append(clean_row)
             
             # Store file info in session for later processing
-            session['upload_file_path'] = filepath
+            session['upload_id'] = upload_id
             session['upload_filename'] = unique_filename
             session['upload_file_size'] = file_size
-            session['upload_columns'] = list(df.columns)
+            session['upload_columns'] = columns
             session['upload_sample_data'] = sample_data
             # Sanitize form inputs
             session['upload_description'] = SecurityValidator.sanitize_input(
@@ -2029,7 +2013,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             
             # Clean column names to ensure JSON serialization works properly
             clean_columns = []
-            for col in df.columns:
+            for col in columns:
                 # Convert to string and sanitize column names
                 clean_col = SecurityValidator.sanitize_input(str(col), max_length=100)
                 clean_columns.append(clean_col)
@@ -2049,6 +2033,8 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             db.session.rollback()
             if 'filepath' in locals() and os.path.exists(filepath):
                 os.remove(filepath)
+            if 'staging_dir' in locals():
+                remove_staged_upload(staging_dir)
             return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
     
     @app.route('/process_column_mapping', methods=['POST'])
@@ -2075,27 +2061,24 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 }), 400
             
             # Get file info from session
-            filepath = session.get('upload_file_path')
+            upload_id = session.get('upload_id')
             filename = session.get('upload_filename')
             file_size = session.get('upload_file_size', 0)
             description = session.get('upload_description', '')
             source = session.get('upload_source', 'manual')
             dataset_name = session.get('upload_dataset_name', 'Unknown Dataset')
             
-            if not filepath or not os.path.exists(filepath):
+            # Reuse the chunks parsed and staged by upload_data
+            staging_dir = get_staging_dir(app.config['UPLOAD_FOLDER'], upload_id) if upload_id else None
+            staged_upload = read_staged_upload(staging_dir) if staging_dir else None
+            if not staged_upload:
                 return jsonify({
                     'success': False,
                     'message': 'File upload tidak ditemukan. Silakan upload ulang file.'
                 }), 400
             
-            # Read the file again
-            if filename.endswith('.csv'):
-                df = pd.read_csv(filepath)
-            else:
-                df = pd.read_excel(filepath)
-            
             # Validate selected columns exist
-            if content_column not in df.columns:
+            if content_column not in staged_upload['columns']:
                 return jsonify({
                     'success': False,
                     'message': f'Kolom {content_column} tidak ditemukan dalam file'
@@ -2112,75 +2095,40 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 db.session.add(dataset)
                 db.session.flush()  # Get the dataset ID
             
-            # Save data to database
-            records_added = 0
-            for _, row in df.iterrows():
-                if pd.notna(row[content_column]) and str(row[content_column]).strip():
-                    content_text = str(row[content_column]).strip()
-                    
-                    # Get mapped values
-                    url_value = row.get(url_column, '') if url_column and url_column in df.columns else ''
-                    username_value = row.get(username_column, 'unknown') if username_column and username_column in df.columns else 'unknown'
-                    
-                    # Ensure username is not empty
-                    if not username_value or not str(username_value).strip():
-                        username_value = 'unknown'
-                    
-                    # Auto-detect platform from URL or use default
-                    detected_platform = 'manual'  # Default for manual uploads
-                    if url_value:
-                        if 'twitter.com' in str(url_value) or 'x.com' in str(url_value):
-                            detected_platform = 'twitter'
-                        elif 'facebook.com' in str(url_value):
-                            detected_platform = 'facebook'
-                        elif 'tiktok.com' in str(url_value):
-                            detected_platform = 'tiktok'
-                        elif 'instagram.com' in str(url_value):
-                            detected_platform = 'instagram'
-                    
-                    raw_data = RawData(
-                        content=content_text,
-                        platform=detected_platform,
-                        username=str(username_value).strip(),
-                        url=str(url_value) if url_value else '',
-                        file_size=file_size,
-                        original_filename=secure_filename(filename),
-                        dataset_id=dataset.id,
-                        dataset_name=dataset_name,
-                        uploaded_by=current_user.id
-                    )
-                    db.session.add(raw_data)
-                    records_added += 1
-            
-            db.session.commit()
-            
-            # Update dataset total_records
-            dataset.total_records = RawData.query.filter_by(dataset_id=dataset.id).count() + RawDataScraper.query.filter_by(dataset_id=dataset.id).count()
-            db.session.commit()
-            
-            # Update statistics
-            update_statistics()
-            
-            # Log aktivitas upload data
-            log_message = f'Berhasil mengupload {records_added} data dari file {filename}'
-            
-            generate_activity_log(
-                action='upload_data',
-                description=log_message,
-                user_id=current_user.id,
-                details={
-                    'filename': filename,
-                    'records_count': records_added,
-                    'dataset_name': dataset_name,
-                    'file_size': file_size
+            # Ingest in a background job; the upload page polls its progress
+            ingestion_job = IngestionJob(
+                job_type='upload',
+                status='pending',
+                backend=background_job_runner.backend,
+                filename=filename,
+                dataset_id=dataset.id,
+                dataset_name=dataset_name,
+                total_rows=staged_upload['row_count'],
+                params={
+                    'upload_id': upload_id,
+                    'content_column': content_column,
+                    'username_column': username_column,
+                    'url_column': url_column,
+                    'file_size': file_size,
+                    'original_filename': secure_filename(filename),
+                    'source': source
                 },
-                icon='fa-upload',
-                color='success'
+                created_by=current_user.id
             )
+            db.session.add(ingestion_job)
+            db.session.commit()
+            job_id = ingestion_job.id
             
-            # Clean up file and session
-            os.remove(filepath)
-            session.pop('upload_file_path', None)
+            try:
+                background_job_runner.submit('upload_ingestion', job_id)
+            except Exception as e:
+                ingestion_job.status = 'failed'
+                ingestion_job.error_message = str(e)
+                db.session.commit()
+                raise
+            
+            # The staged upload now belongs to the job
+            session.pop('upload_id', None)
             session.pop('upload_filename', None)
             session.pop('upload_file_size', None)
             session.pop('upload_columns', None)
@@ -2189,12 +2137,27 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             session.pop('upload_source', None)
             session.pop('upload_dataset_name', None)
             
-            success_message = f'Berhasil mengupload {records_added} data baru dari file {filename}'
+            # Re-read the job: with the sync backend it has already finished
+            db.session.expire_all()
+            job_data = db.session.get(IngestionJob, job_id).to_dict()
+            if job_data['status'] == 'failed':
+                return jsonify({
+                    'success': False,
+                    'message': f"Error: {job_data['error_message']}",
+                    'job': job_data
+                }), 500
+            
+            if job_data['status'] == 'completed':
+                message = f"Berhasil mengupload {job_data['rows_inserted']} data baru dari file {filename}"
+            else:
+                message = f'File {filename} sedang diproses di background'
             
             return jsonify({
                 'success': True,
-                'message': success_message,
-                'records_added': records_added
+                'message': message,
+                'records_added': job_data['rows_inserted'],
+                'job': job_data,
+                'status_url': url_for('get_ingestion_job', job_id=job_id)
             })
             
         except Exception as e:
@@ -2202,6 +2165,195 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
 
             return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
     
+    @app.route('/api/ingestion-jobs/<int:job_id>')
+    @login_required
+    def get_ingestion_job(job_id):
+        """Get progress of a background upload ingestion job"""
+        ingestion_job = db.session.get(IngestionJob, job_id)
+        if not ingestion_job:
+            return jsonify({'success': False, 'message': 'Job tidak ditemukan'}), 404
+        
+        if not current_user.is_admin() and ingestion_job.created_by != current_user.id:
+            return jsonify({'success': False, 'message': 'Akses ditolak'}), 403
+        
+        return jsonify({'success': True, 'job': ingestion_job.to_dict()})
+    
+    @app.route('/api/scraping/jobs/<int:job_id>')
+    @login_required
+    def get_scraping_job(job_id):
+        """Get status of a background scraping job, with the column mapping preview once it completes"""
+        scraping_job = db.session.get(ScrapingJob, job_id)
+        if not scraping_job:
+            return jsonify({'success': False, 'message': 'Job tidak ditemukan'}), 404
+        
+        if not current_user.is_admin() and scraping_job.created_by != current_user.id:
+            return jsonify({'success': False, 'message': 'Akses ditolak'}), 403
+        
+        response = {'success': True, 'job': scraping_job.to_dict()}
+        if scraping_job.status == 'completed' and scraping_job.scheduled_scrape_id:
+            # Scheduled runs save straight into their dataset; there is nothing to map
+            response.update({
+                'requires_mapping': False,
+                'message': f"Scraping terjadwal menyimpan {scraping_job.records_added or 0} data baru dari {scraping_job.platform}",
+                'total_records': scraping_job.records_added or 0,
+                'dataset_id': scraping_job.dataset_id,
+                'run_id': scraping_job.run_id
+            })
+        elif scraping_job.status == 'completed' and not scraping_job.items_count and scraping_job.since_item_at:
+            # Incremental scrape found nothing newer than the keyword's watermark
+            response.update({
+                'requires_mapping': False,
+                'message': f"Tidak ada data baru dari {scraping_job.platform} sejak {scraping_job.since_item_at.strftime('%Y-%m-%d %H:%M')} UTC",
+                'total_records': 0,
+                'dataset_id': scraping_job.dataset_id,
+                'run_id': scraping_job.run_id
+            })
+        elif scraping_job.status == 'completed':
+            # After mapping the temp file is gone; the stored raw items allow mapping again
+            scraping_info = read_scraping_job_results(scraping_job)
+            if not scraping_info:
+                return jsonify({
+                    'success': False,
+                    'message': 'Data scraping tidak ditemukan. Silakan lakukan scraping ulang.',
+                    'job': response['job']
+                }), 410
+            
+            # Same payload the synchronous start_scraping used to return for column mapping
+            response.update({
+                'requires_mapping': True,
+                'message': f"Berhasil scraping {scraping_info['total_records']} data dari {scraping_job.platform}",
+                'total_records': scraping_info['total_records'],
+                'columns': scraping_info['columns'],
+                'sample_data': scraping_info['sample_data'],
+                'dataset_id': scraping_job.dataset_id,
+                'run_id': scraping_job.run_id,
+                'platform': scraping_job.platform,
+                'keywords': scraping_job.keyword,
+                'remap': bool(scraping_info.get('raw_items'))
+            })
+        
+        return jsonify(response)
+    
+    def _apply_scheduled_scrape_fields(scheduled, data):
+        """Validate and copy editable schedule fields from request JSON; returns an error message or None"""
+        if 'platform' in data:
+            if data['platform'] not in ('twitter', 'facebook', 'instagram', 'tiktok'):
+                return 'Platform tidak valid'
+            scheduled.platform = data['platform']
+        if 'keyword' in data:
+            keyword = SecurityValidator.sanitize_input(str(data['keyword'] or ''), max_length=255).strip()
+            if not keyword:
+                return 'Keyword harus diisi'
+            scheduled.keyword = keyword
+        try:
+            if 'interval_minutes' in data:
+                scheduled.interval_minutes = int(data['interval_minutes'])
+                if scheduled.interval_minutes < 5:
+                    return 'Interval minimal 5 menit'
+            if 'max_results' in data:
+                scheduled.max_results = int(data['max_results'])
+                if scheduled.max_results < 1 or scheduled.max_results > 1000:
+                    return 'Maksimal hasil harus antara 1 dan 1000'
+        except (ValueError, TypeError):
+            return 'Interval dan maksimal hasil harus berupa angka'
+        for field in ('auto_clean', 'auto_classify', 'is_active'):
+            if field in data:
+                setattr(scheduled, field, bool(data[field]))
+        return None
+    
+    def _get_owned_scheduled_scrape(schedule_id):
+        scheduled = db.session.get(ScheduledScrape, schedule_id)
+        if scheduled is None or (not current_user.is_admin() and scheduled.created_by != current_user.id):
+            return None
+        return scheduled
+    
+    @app.route('/api/scraping/schedules', methods=['GET', 'POST'])
+    @login_required
+    @active_user_required
+    def scraping_schedules():
+        """List or create recurring scrape definitions run by the scheduler"""
+        if request.method == 'GET':
+            query = ScheduledScrape.query
+            if not current_user.is_admin():
+                query = query.filter_by(created_by=current_user.id)
+            return jsonify({
+                'success': True,
+                'schedules': [scheduled.to_dict() for scheduled in query.order_by(ScheduledScrape.next_run_at).all()]
+            })
+        
+        try:
+            data = request.get_json() or {}
+            for field in ('platform', 'keyword', 'interval_minutes'):
+                if not data.get(field):
+                    return jsonify({'success': False, 'message': f'Field {field} wajib diisi'}), 400
+            
+            scheduled = ScheduledScrape(max_results=100, auto_clean=False, auto_classify=False, is_active=True, created_by=current_user.id)
+            error_message = _apply_scheduled_scrape_fields(scheduled, data)
+            if error_message:
+                return jsonify({'success': False, 'message': error_message}), 400
+            
+            # Target dataset: an existing one the user owns, or a new dataset for this keyword
+            if data.get('dataset_id'):
+                dataset = db.session.get(Dataset, int(data['dataset_id']))
+                if not dataset or (not current_user.is_admin() and dataset.uploaded_by != current_user.id):
+                    return jsonify({'success': False, 'message': 'Dataset tidak ditemukan'}), 404
+            else:
+                dataset = Dataset(
+                    name=f"Scraper Terjadwal {scheduled.platform.title()} - {scheduled.keyword}",
+                    description=f"Data hasil scraping terjadwal dari {scheduled.platform} dengan kata kunci '{scheduled.keyword}' setiap {scheduled.interval_minutes} menit",
+                    uploaded_by=current_user.id
+                )
+                db.session.add(dataset)
+                db.session.flush()
+            scheduled.dataset_id = dataset.id
+            scheduled.next_run_at = datetime.utcnow()  # First run on the next scheduler tick
+            
+            db.session.add(scheduled)
+            db.session.commit()
+            return jsonify({'success': True, 'message': 'Scraping terjadwal berhasil dibuat', 'schedule': scheduled.to_dict()}), 201
+        
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+    
+    @app.route('/api/scraping/schedules/<int:schedule_id>', methods=['GET', 'PUT', 'DELETE'])
+    @login_required
+    @active_user_required
+    def scraping_schedule_detail(schedule_id):
+        """Show (with recent runs), update or delete a recurring scrape definition"""
+        scheduled = _get_owned_scheduled_scrape(schedule_id)
+        if scheduled is None:
+            return jsonify({'success': False, 'message': 'Scraping terjadwal tidak ditemukan'}), 404
+        
+        try:
+            if request.method == 'DELETE':
+                db.session.delete(scheduled)
+                db.session.commit()
+                return jsonify({'success': True, 'message': 'Scraping terjadwal berhasil dihapus'})
+            
+            if request.method == 'PUT':
+                interval_minutes = scheduled.interval_minutes
+                error_message = _apply_scheduled_scrape_fields(scheduled, request.get_json() or {})
+                if error_message:
+                    db.session.rollback()
+                    return jsonify({'success': False, 'message': error_message}), 400
+                if scheduled.interval_minutes != interval_minutes:
+                    # Restart the cadence from the next tick with the new interval
+                    scheduled.next_run_at = datetime.utcnow()
+                db.session.commit()
+            
+            limit = min(request.args.get('limit', 20, type=int), 100)
+            runs = scheduled.runs.order_by(ScrapingJob.created_at.desc()).limit(limit).all()
+            return jsonify({
+                'success': True,
+                'schedule': scheduled.to_dict(),
+                'runs': [run.to_dict() for run in runs]
+            })
+        
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+    
     @app.route('/process_scraping_column_mapping', methods=['POST'])
     @login_required
     @active_user_required
@@ -2221,29 +2373,42 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     'message': 'Kolom content harus dipilih'
                 }), 400
             
-            # Get scraping info from temporary file
+            # Get scraping info from the background job's temporary file
             temp_id = session.get('scraping_temp_id')
-            scraping_info = None
+            scraping_job = None
+            scraping_job_id = mapping_data.get('scraping_job_id')
+            if scraping_job_id:
+                scraping_job = db.session.get(ScrapingJob, scraping_job_id)
+                if not scraping_job or (not current_user.is_admin() and scraping_job.created_by != current_user.id):
+                    return jsonify({
+                        'success': False,
+                        'message': 'Job scraping tidak ditemukan'
+                    }), 404
+                if scraping_job.scheduled_scrape_id:
+                    # Scheduled runs save straight into their dataset and have no date range to map with
+                    return jsonify({
+                        'success': False,
+                        'message': 'Hasil scraping terjadwal sudah disimpan otomatis dan tidak bisa di-mapping ulang'
+                    }), 400
+                temp_id = scraping_job.temp_id
             
-            if temp_id:
-                # Read from temporary file
-                temp_file_path = os.path.join(tempfile.gettempdir(), f'waskita_scraping_{temp_id}.json')
-                
-                if os.path.exists(temp_file_path):
-                    try:
-                        with open(temp_file_path, 'r', encoding='utf-8') as f:
-                            scraping_info = json.load(f)
-                    except Exception as e:
-                        app.logger.error(f"Error reading temp file: {str(e)}")
-                        scraping_info = None
+            if scraping_job is not None:
+                scraping_info = read_scraping_job_results(scraping_job)
+            else:
+                scraping_info = read_scraping_temp_file(temp_id)
             
             if not scraping_info:
                 # Fallback to old session format for compatibility
                 scraping_info = session.get('scraping_data')
             
             if scraping_info:
-                # Extract data from scraping info
+                # Extract data from scraping info; rows of job results are streamed from the JSON lines file
                 scraped_data = scraping_info.get('scraped_data')
+                if scraped_data is None and scraping_info.get('raw_items'):
+                    # Re-mapping: rows are normalized again from the job's compressed raw Apify items
+                    scraped_data = iter_scraping_job_rows(scraping_job)
+                elif scraped_data is None and scraping_info.get('total_records'):
+                    scraped_data = iter_scraping_temp_rows(temp_id)
                 platform = scraping_info.get('platform')
                 keyword = scraping_info.get('keywords')
                 date_from = scraping_info.get('start_date')
@@ -2270,16 +2435,21 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     'message': 'Data scraping tidak ditemukan. Silakan lakukan scraping ulang.'
                 }), 400
             
-            app.logger.info(f"Found scraped data - platform: {platform}, keyword: {keyword}, dataset_id: {dataset_id}, data_count: {len(scraped_data)}")
+            if isinstance(scraped_data, list):
+                total_scraped = len(scraped_data)
+                columns = list(scraped_data[0].keys())
+            else:
+                total_scraped = scraping_info['total_records']
+                columns = scraping_info['columns']
+            
+            app.logger.info(f"Found scraped data - platform: {platform}, keyword: {keyword}, dataset_id: {dataset_id}, data_count: {total_scraped}")
             
             # Validate selected columns exist in data
-            if scraped_data:
-                first_item = scraped_data[0]
-                if content_column not in first_item:
-                    return jsonify({
-                        'success': False,
-                        'message': f'Kolom {content_column} tidak ditemukan dalam data scraping'
-                    }), 400
+            if content_column not in columns:
+                return jsonify({
+                    'success': False,
+                    'message': f'Kolom {content_column} tidak ditemukan dalam data scraping'
+                }), 400
             
             # Get dataset
             dataset = Dataset.query.get(dataset_id)
@@ -2290,101 +2460,38 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 }), 400
             
             # Save data to database with column mapping
-            records_added = 0
             scrape_date = datetime.strptime(date_from, '%Y-%m-%d').date()
             
-            app.logger.info(f"Starting to save {len(scraped_data)} records to database")
+            app.logger.info(f"Starting to save {total_scraped} records to database")
             
-            for data in scraped_data:
-                # Get mapped values
-                content_value = data.get(content_column, '')
-                username_value = data.get(username_column, 'unknown') if username_column and username_column in data else 'unknown'
-                url_value = data.get(url_column, '') if url_column and url_column in data else ''
-                
-                # Skip empty content
-                if not content_value or not str(content_value).strip():
-                    app.logger.debug(f"Skipping empty content: {content_value}")
-                    continue
-                
-                # Ensure username is not empty
-                if not username_value or not str(username_value).strip():
-                    username_value = 'unknown'
-                
-                # Check for duplicate content in scraper data
-                content_to_check = str(content_value).strip()
-                existing_scraper_data = RawDataScraper.query.filter_by(
-                    content=content_to_check,
-                    dataset_id=dataset.id,
-                    platform=platform,
-                    keyword=keyword
-                ).first()
-                
-                if existing_scraper_data:
-                    # Skip duplicate content
-                    app.logger.debug(f"Skipping duplicate content: {content_to_check[:50]}...")
-                    continue
-                
-                # Extract engagement data based on platform
-                likes = data.get('likes', 0) or 0
-                retweets = data.get('retweets', 0) or 0
-                replies = data.get('replies', 0) or 0
-                comments = data.get('comments', 0) or 0
-                shares = data.get('shares', 0) or 0
-                views = data.get('views', 0) or 0
-                
-                # Handle TikTok specific engagement fields
-                if platform.lower() == 'tiktok':
-                    # TikTok uses different field names
-                    likes = data.get('diggCount', 0) or data.get('likes', 0) or 0
-                    comments = data.get('commentCount', 0) or data.get('comments', 0) or 0
-                    shares = data.get('shareCount', 0) or data.get('shares', 0) or 0
-                    views = data.get('playCount', 0) or data.get('views', 0) or 0
-                
-                raw_data_scraper = RawDataScraper(
-                    username=str(username_value).strip(),
-                    content=content_to_check,
-                    url=str(url_value) if url_value else '',
-                    platform=platform,
-                    keyword=keyword,
-                    scrape_date=scrape_date,
-                    dataset_id=dataset.id,
-                    dataset_name=dataset.name,
-                    scraped_by=current_user.id,
-                    # Engagement data
-                    likes=likes,
-                    retweets=retweets,
-                    replies=replies,
-                    comments=comments,
-                    shares=shares,
-                    views=views
-                )
-                db.session.add(raw_data_scraper)
-                records_added += 1
-                
-                # Debug logging for all platforms
-                if records_added <= 5:  # Log first 5 records
-                    app.logger.info(f"Record {records_added} - Platform: {platform}, Username: {username_value}, Content length: {len(content_to_check)}, Likes: {likes}, Views: {views}")
+            # Rows are streamed in chunks with one duplicate check query per chunk
+            records_added = save_scraped_rows(
+                scraped_data, dataset, platform, keyword, scrape_date, current_user.id,
+                content_column, username_column, url_column
+            )
             
-            app.logger.info(f"Processing completed - Total scraped: {len(scraped_data)}, Records added: {records_added}, Skipped: {len(scraped_data) - records_added}")
+            app.logger.info(f"Processing completed - Total scraped: {total_scraped}, Records added: {records_added}, Skipped: {total_scraped - records_added}")
             app.logger.info(f"About to commit {records_added} records to database")
             db.session.commit()
             app.logger.info(f"Successfully committed {records_added} records to database")
             
+            # The rows are saved, so the next scrape of this keyword into the dataset only fetches newer posts
+            if scraping_job is None and temp_id:
+                scraping_job = ScrapingJob.query.filter_by(temp_id=temp_id).first()
+            if scraping_job is not None:
+                try:
+                    advance_scraping_watermark(scraping_job)
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.warning(f"Failed to advance scraping watermark for job {scraping_job.id}: {str(e)}")
+            
             # Update statistics
             update_statistics()
             
             # Clean up session and temporary file
             session.pop('scraping_data', None)
-            temp_id = session.pop('scraping_temp_id', None)
-            
-            # Delete temporary file
-            if temp_id:
-                temp_file_path = os.path.join(tempfile.gettempdir(), f'waskita_scraping_{temp_id}.json')
-                if os.path.exists(temp_file_path):
-                    try:
-                        os.remove(temp_file_path)
-                    except Exception as e:
-                        pass
+            session.pop('scraping_temp_id', None)
+            remove_scraping_temp_file(temp_id)
             
             # Create consistent success message based on platform
             platform_name = {
@@ -2694,54 +2801,42 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                         'is_user_tagged_feed': data.get('instagram_is_user_tagged_feed', 'false') == 'true'
                     }
                 
-                scraped_data, run_id = scrape_with_apify(
+                # Poll the Apify run in a background job; the page polls the job status
+                scraping_job = ScrapingJob(
+                    status='pending',
+                    backend=background_job_runner.backend,
                     platform=data['platform'],
                     keyword=data['keywords'],
                     date_from=data['start_date'],
                     date_to=data['end_date'],
                     max_results=int(data['max_results']),
-                    instagram_params=instagram_params
+                    params=instagram_params,
+                    dataset_id=dataset.id,
+                    dataset_name=dataset.name,
+                    created_by=current_user.id
                 )
+                db.session.add(scraping_job)
+                db.session.commit()
+                job_id = scraping_job.id
+                submit_scraping_job(scraping_job)
                 
-                # Store scraping info in temporary file to avoid large session cookies
-                # Generate unique temp file ID
-                temp_id = str(uuid.uuid4())
-                temp_file_path = os.path.join(tempfile.gettempdir(), f'waskita_scraping_{temp_id}.json')
-                
-                # Save scraped data to temporary file
-                temp_data = {
-                    'scraped_data': scraped_data,
-                    'run_id': run_id,
-                    'platform': data['platform'],
-                    'keywords': data['keywords'],
-                    'start_date': data['start_date'],
-                    'end_date': data['end_date'],
-                    'dataset_id': dataset.id,
-                    'dataset_name': dataset.name
-                }
-                
-                from utils import DateTimeEncoder
-                with open(temp_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(temp_data, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
-                
-                # Store only temp file ID in session
-                session['scraping_temp_id'] = temp_id
-                
-                # Get column names from scraped data
-                columns = []
-                if scraped_data:
-                    columns = list(scraped_data[0].keys())
+                # Re-read the job: with the sync backend it has already finished
+                db.session.expire_all()
+                job_data = db.session.get(ScrapingJob, job_id).to_dict()
+                if job_data['status'] == 'failed':
+                    return jsonify({
+                        'success': False,
+                        'message': f"Error saat scraping: {job_data['error_message']}",
+                        'job': job_data
+                    }), 500
                 
-                # Return data for column mapping with run_id for progress tracking
                 return jsonify({
                     'success': True,
-                    'requires_mapping': True,
-                    'message': f'Berhasil scraping {len(scraped_data)} data dari {data["platform"]}',
-                    'total_records': len(scraped_data),
-                    'columns': columns,
-                    'sample_data': scraped_data[:5] if scraped_data else [],  # First 5 items for preview
+                    'message': f'Scraping {data["platform"]} sedang berjalan di background',
+                    'job_id': job_id,
+                    'job': job_data,
+                    'status_url': url_for('get_scraping_job', job_id=job_id),
                     'dataset_id': dataset.id,
-                    'run_id': run_id,
                     'platform': data['platform'],
                     'keywords': data['keywords']
                 })
@@ -2864,6 +2959,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
     @app.route('/api/classify_manual_text', methods=['POST'])
     @login_required
     @active_user_required
+    @models_ready_required
     def classify_manual_text():
         """Classify manual text input with all 3 models"""
         try:
@@ -2900,8 +2996,24 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 return jsonify({'success': False, 'message': 'Teks tidak valid setelah dibersihkan'}), 400
             
             # Get models from app config
-            word2vec_model = current_app.config.get('WORD2VEC_MODEL')
-            naive_bayes_models = current_app.config.get('NAIVE_BAYES_MODELS', {})
+            registry = model_loader.get_registry()
+            word2vec_model = registry.word2vec_model
+            naive_bayes_models = registry.naive_bayes_models
+            
+            # Return cached predictions for identical cleaned text and model versions
+            cache_key = prediction_cache.make_key(cleaned_text, {
+                'word2vec': registry.word2vec_version,
+                'naive_bayes': registry.naive_bayes_versions
+            })
+            cached_results = prediction_cache.get(cache_key)
+            if cached_results is not None:
+                return jsonify({
+                    'success': True,
+                    'text': text,
+                    'cleaned_text': cleaned_text,
+                    'results': cached_results,
+                    'cache': 'hit'
+                })
             
             # Vectorize text
             text_vector = vectorize_text(cleaned_text, word2vec_model)
@@ -2931,16 +3043,28 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             if not results:
                 return jsonify({'success': False, 'message': 'Tidak ada model yang tersedia'}), 500
             
+            # Only cache complete results from a loaded Word2Vec model
+            if word2vec_model and not any('error' in result for result in results):
+                prediction_cache.set(cache_key, results)
+            
             return jsonify({
                 'success': True,
                 'text': text,
                 'cleaned_text': cleaned_text,
-                'results': results
+                'results': results,
+                'cache': 'miss'
             })
             
         except Exception as e:
             return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
     
+    @app.route('/api/classification/cache-stats', methods=['GET'])
+    @login_required
+    @active_user_required
+    def classification_cache_stats():
+        """Statistik prediction cache untuk klasifikasi teks manual"""
+        return jsonify({'success': True, 'stats': prediction_cache.get_stats()})
+    
     # Bulk Operations Routes
     @app.route('/dataset/bulk/clean', methods=['POST'])
     @login_required
@@ -2956,6 +3080,8 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             
             processed_count = 0
             errors = []
+            deduper = CleanedContentDeduper()
+            new_clean_rows = []
             
             for dataset_id in dataset_ids:
                 try:
@@ -2971,12 +3097,12 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     
                     # Clean raw upload data
                     raw_uploads = RawData.query.filter_by(dataset_id=dataset_id).all()
-                    for raw_data in raw_uploads:
+                    cleaned_uploads = clean_texts(raw_data.content for raw_data in raw_uploads)
+                    deduper.prefetch(cleaned_uploads)
+                    for raw_data, cleaned_content in zip(raw_uploads, cleaned_uploads):
                         if not CleanDataUpload.query.filter_by(raw_data_id=raw_data.id).first():
-                            cleaned_content = clean_text(raw_data.content)
-                            
                             # Check for duplicate content
-                            is_duplicate = check_cleaned_content_duplicate(cleaned_content)
+                            is_duplicate = deduper.is_duplicate(cleaned_content)
                             
                             if not is_duplicate:
                                 clean_data = CleanDataUpload(
@@ -2989,18 +3115,19 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                                     cleaned_by=current_user.id
                                 )
                                 db.session.add(clean_data)
+                                new_clean_rows.append(clean_data)
                             
                             # Update raw data status regardless of duplication
                             raw_data.status = 'cleaned'
                     
                     # Clean raw scraper data
                     raw_scrapers = RawDataScraper.query.filter_by(dataset_id=dataset_id).all()
-                    for raw_scraper in raw_scrapers:
+                    cleaned_scrapers = clean_texts(raw_scraper.content for raw_scraper in raw_scrapers)
+                    deduper.prefetch(cleaned_scrapers)
+                    for raw_scraper, cleaned_content in zip(raw_scrapers, cleaned_scrapers):
                         if not CleanDataScraper.query.filter_by(raw_data_scraper_id=raw_scraper.id).first():
-                            cleaned_content = clean_text(raw_scraper.content)
-                            
                             # Check for duplicate content
-                            is_duplicate = check_cleaned_content_duplicate(cleaned_content)
+                            is_duplicate = deduper.is_duplicate(cleaned_content)
                             
                             if not is_duplicate:
                                 clean_scraper = CleanDataScraper(
@@ -3015,6 +3142,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                                     cleaned_by=current_user.id
                                 )
                                 db.session.add(clean_scraper)
+                                new_clean_rows.append(clean_scraper)
                             
                             # Update raw data status regardless of duplication
                             raw_scraper.status = 'cleaned'
@@ -3025,6 +3153,8 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     errors.append(f'Error pada dataset {dataset_id}: {str(e)}')
                     continue
             
+            # Cluster near-duplicates of the new clean rows incrementally
+            near_duplicate_index.index_clean_rows(new_clean_rows)
             db.session.commit()
             
             # Update statistics after successful deletions
@@ -3052,6 +3182,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
     @app.route('/dataset/bulk/classify', methods=['POST'])
     @login_required
     @active_user_required
+    @models_ready_required
     def bulk_classify_datasets():
         """Classify multiple datasets"""
         try:
@@ -3067,6 +3198,11 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             processed_count = 0
             errors = []
             
+            # Get models from app config
+            registry = model_loader.get_registry()
+            word2vec_model = registry.word2vec_model
+            naive_bayes_models = registry.naive_bayes_models
+            
             for dataset_id in dataset_ids:
                 try:
                     dataset = Dataset.query.get(dataset_id)
@@ -3079,61 +3215,64 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                         errors.append(f'Tidak memiliki akses ke dataset {dataset.name}')
                         continue
                     
-                    # Classify clean upload data
+                    # Clean upload data for this dataset
                     clean_uploads = db.session.query(CleanDataUpload).join(
                         RawData, CleanDataUpload.raw_data_id == RawData.id
                     ).filter(RawData.dataset_id == dataset_id).all()
                     
-                    for clean_data in clean_uploads:
-                        if not ClassificationResult.query.filter_by(
-                            data_type='upload', data_id=clean_data.id
-                        ).first():
-                            prediction, probability = classify_content(
-                                clean_data.cleaned_content, word2vec_model, naive_bayes_models
-                            )
-                            
-                            classification = ClassificationResult(
-                                data_type='upload',
-                                data_id=clean_data.id,
-                                prediction=prediction,
-                                probability=probability,
-                                classified_at=datetime.utcnow(),
-                                classified_by=current_user.id
-                            )
-                            db.session.add(classification)
-                            
-                            # Update RawData status
-                            raw_upload = RawData.query.get(clean_data.raw_data_id)
-                            if raw_upload:
-                                raw_upload.status = 'classified'
-                    
-                    # Classify clean scraper data
+                    # Clean scraper data for this dataset
                     clean_scrapers = db.session.query(CleanDataScraper).join(
                         RawDataScraper, CleanDataScraper.raw_data_scraper_id == RawDataScraper.id
                     ).filter(RawDataScraper.dataset_id == dataset_id).all()
                     
-                    for clean_scraper in clean_scrapers:
-                        if not ClassificationResult.query.filter_by(
-                            data_type='scraper', data_id=clean_scraper.id
-                        ).first():
-                            prediction, probability = classify_content(
-                                clean_scraper.cleaned_content, word2vec_model, naive_bayes_models
-                            )
-                            
-                            classification = ClassificationResult(
-                                data_type='scraper',
-                                data_id=clean_scraper.id,
-                                prediction=prediction,
-                                probability=probability,
-                                classified_at=datetime.utcnow(),
-                                classified_by=current_user.id
-                            )
-                            db.session.add(classification)
+                    for data_type, clean_list in (('upload', clean_uploads), ('scraper', clean_scrapers)):
+                        if not clean_list:
+                            continue
+                        
+                        # Skip rows that already have classification results
+                        classified_ids = {
+                            row.data_id for row in db.session.query(ClassificationResult.data_id).filter(
+                                ClassificationResult.data_type == data_type,
+                                ClassificationResult.data_id.in_([c.id for c in clean_list])
+                            ).distinct()
+                        }
+                        pending = [c for c in clean_list if c.id not in classified_ids]
+                        if not pending:
+                            continue
+                        
+                        # Reuse stored vectors and classify the whole batch at once
+                        # Optionally classify one representative per near-duplicate cluster and copy its result
+                        representative_items, representative_rows = near_duplicate_index.select_representatives(
+                            [(data_type, c.id, c.cleaned_content) for c in pending]
+                        )
+                        text_vectors = get_document_vectors(
+                            representative_items, word2vec_model, registry.word2vec_version
+                        )
+                        classifications = classify_contents(text_vectors, naive_bayes_models)
+                        
+                        for item_index, clean_row in enumerate(pending):
+                            row_index = representative_rows[item_index]
+                            for model_name, (predictions, probabilities) in classifications.items():
+                                classification = ClassificationResult(
+                                    data_type=data_type,
+                                    data_id=clean_row.id,
+                                    model_name=model_name,
+                                    model_version=registry.naive_bayes_versions.get(model_name),
+                                    embedding_version=registry.word2vec_version,
+                                    prediction=predictions[row_index],
+                                    probability_radikal=float(probabilities[row_index][1]),
+                                    probability_non_radikal=float(probabilities[row_index][0]),
+                                    classified_by=current_user.id
+                                )
+                                db.session.add(classification)
                             
-                            # Update RawDataScraper status
-                            raw_scraper = RawDataScraper.query.get(clean_scraper.raw_data_scraper_id)
-                            if raw_scraper:
-                                raw_scraper.status = 'classified'
+                            # Update raw data status
+                            if data_type == 'upload':
+                                raw_row = RawData.query.get(clean_row.raw_data_id)
+                            else:
+                                raw_row = RawDataScraper.query.get(clean_row.raw_data_scraper_id)
+                            if raw_row:
+                                raw_row.status = 'classified'
                     
                     processed_count += 1
                     
@@ -3306,21 +3445,24 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             # Batch processing configuration
             BATCH_SIZE = 50  # Process 50 records at a time
             
+            # Existing cleaned content hashes are prefetched per batch
+            deduper = CleanedContentDeduper()
+            
             # Process upload data in batches
             for i in range(0, len(all_uploads), BATCH_SIZE):
                 batch_uploads = all_uploads[i:i + BATCH_SIZE]
+                cleaned_batch = clean_texts(raw_data.content for raw_data in batch_uploads)
+                deduper.prefetch(cleaned_batch)
+                new_clean_rows = []
                 
-                for raw_data in batch_uploads:
+                for raw_data, cleaned_content in zip(batch_uploads, cleaned_batch):
                     try:
                         # Check if already cleaned
                         if CleanDataUpload.query.filter_by(raw_data_id=raw_data.id).first():
                             continue
                         
-                        # Clean the content
-                        cleaned_content = clean_text(raw_data.content)
-                        
                         # Check for duplicate content
-                        is_duplicate = check_cleaned_content_duplicate(cleaned_content)
+                        is_duplicate = deduper.is_duplicate(cleaned_content)
                         
                         if not is_duplicate and cleaned_content:
                             clean_data = CleanDataUpload(
@@ -3333,6 +3475,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                                 cleaned_by=current_user.id
                             )
                             db.session.add(clean_data)
+                            new_clean_rows.append(clean_data)
                         
                         # Update raw data status regardless of duplication
                         raw_data.status = 'cleaned'
@@ -3344,26 +3487,28 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 
                 # Commit batch to avoid timeout
                 try:
+                    near_duplicate_index.index_clean_rows(new_clean_rows)
                     db.session.commit()
                 except Exception as e:
                     db.session.rollback()
+                    deduper = CleanedContentDeduper()
                     errors.append(f'Error commit batch upload: {str(e)}')
             
             # Process scraper data in batches
             for i in range(0, len(all_scrapers), BATCH_SIZE):
                 batch_scrapers = all_scrapers[i:i + BATCH_SIZE]
+                cleaned_batch = clean_texts(raw_scraper.content for raw_scraper in batch_scrapers)
+                deduper.prefetch(cleaned_batch)
+                new_clean_rows = []
                 
-                for raw_scraper in batch_scrapers:
+                for raw_scraper, cleaned_content in zip(batch_scrapers, cleaned_batch):
                     try:
                         # Check if already cleaned
                         if CleanDataScraper.query.filter_by(raw_data_scraper_id=raw_scraper.id).first():
                             continue
                         
-                        # Clean the content
-                        cleaned_content = clean_text(raw_scraper.content)
-                        
                         # Check for duplicate content
-                        is_duplicate = check_cleaned_content_duplicate(cleaned_content)
+                        is_duplicate = deduper.is_duplicate(cleaned_content)
                         
                         if not is_duplicate and cleaned_content:
                             clean_scraper = CleanDataScraper(
@@ -3378,6 +3523,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                                 cleaned_by=current_user.id
                             )
                             db.session.add(clean_scraper)
+                            new_clean_rows.append(clean_scraper)
                         
                         # Update raw data status regardless of duplication
                         raw_scraper.status = 'cleaned'
@@ -3389,9 +3535,11 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 
                 # Commit batch to avoid timeout
                 try:
+                    near_duplicate_index.index_clean_rows(new_clean_rows)
                     db.session.commit()
                 except Exception as e:
                     db.session.rollback()
+                    deduper = CleanedContentDeduper()
                     errors.append(f'Error commit batch scraper: {str(e)}')
             
             # Final commit for any remaining changes
@@ -3561,20 +3709,26 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             skipped_count = 0
             duplicate_removed = 0
             
+            # Remove existing clean data of rows being re-cleaned before duplicate checks
+            for clean_model, raw_id_column, raw_rows in (
+                (CleanDataUpload, CleanDataUpload.raw_data_id, raw_upload_data),
+                (CleanDataScraper, CleanDataScraper.raw_data_scraper_id, raw_scraper_data)
+            ):
+                raw_ids = [raw_row.id for raw_row in raw_rows]
+                for start in range(0, len(raw_ids), 1000):
+                    duplicate_removed += clean_model.query.filter(
+                        raw_id_column.in_(raw_ids[start:start + 1000])
+                    ).delete(synchronize_session=False)
+            
+            # Check for duplicate content in clean data tables across entire dataset
+            deduper = CleanedContentDeduper(dataset_id=dataset_id)
+            new_clean_rows = []
+            
             # Process upload data
-            for raw_data in raw_upload_data:
-                # Clean the content
-                cleaned_content = clean_text(raw_data.content)
-                
-                # Check if already has clean data
-                existing_clean = CleanDataUpload.query.filter_by(raw_data_id=raw_data.id).first()
-                if existing_clean:
-                    # Remove existing clean data to avoid duplicates
-                    db.session.delete(existing_clean)
-                    duplicate_removed += 1
-                
-                # Check for duplicate content in clean data tables across entire dataset
-                is_duplicate = check_cleaned_content_duplicate_by_dataset(cleaned_content, dataset_id)
+            cleaned_uploads = clean_texts(raw_data.content for raw_data in raw_upload_data)
+            deduper.prefetch(cleaned_uploads)
+            for raw_data, cleaned_content in zip(raw_upload_data, cleaned_uploads):
+                is_duplicate = deduper.is_duplicate(cleaned_content)
                 
                 if not is_duplicate:
                     # Create clean data record
@@ -3590,6 +3744,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     )
                     
                     db.session.add(clean_data)
+                    new_clean_rows.append(clean_data)
                     cleaned_count += 1
                 else:
                     skipped_count += 1
@@ -3598,19 +3753,10 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 raw_data.status = 'cleaned'
             
             # Process scraper data
-            for raw_scraper in raw_scraper_data:
-                # Clean the content
-                cleaned_content = clean_text(raw_scraper.content)
-                
-                # Check if already has clean data
-                existing_clean = CleanDataScraper.query.filter_by(raw_data_scraper_id=raw_scraper.id).first()
-                if existing_clean:
-                    # Remove existing clean data to avoid duplicates
-                    db.session.delete(existing_clean)
-                    duplicate_removed += 1
-                
-                # Check for duplicate content in clean data tables across entire dataset
-                is_duplicate = check_cleaned_content_duplicate_by_dataset(cleaned_content, dataset_id)
+            cleaned_scrapers = clean_texts(raw_scraper.content for raw_scraper in raw_scraper_data)
+            deduper.prefetch(cleaned_scrapers)
+            for raw_scraper, cleaned_content in zip(raw_scraper_data, cleaned_scrapers):
+                is_duplicate = deduper.is_duplicate(cleaned_content)
                 
                 if not is_duplicate:
                     # Create clean data record
@@ -3627,6 +3773,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     )
                     
                     db.session.add(clean_data)
+                    new_clean_rows.append(clean_data)
                     cleaned_count += 1
                 else:
                     skipped_count += 1
@@ -3634,6 +3781,9 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 # Update raw scraper status
                 raw_scraper.status = 'cleaned'
             
+            # Cluster near-duplicates of the new clean rows incrementally
+            near_duplicate_index.index_clean_rows(new_clean_rows)
+            
             # Update dataset statistics
             dataset.updated_at = datetime.utcnow()
             
@@ -3672,6 +3822,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
     
     @app.route('/api/dataset/<int:dataset_id>/classify', methods=['POST'])
     @login_required
+    @models_ready_required
     def api_dataset_classify(dataset_id):
         import traceback
         try:
@@ -3694,107 +3845,91 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             
             classified_count = 0
             
-            # Process upload data
+            # Get models from app config
+            registry = model_loader.get_registry()
+            word2vec_model = registry.word2vec_model
+            naive_bayes_models = registry.naive_bayes_models
+            
+            # Skip rows already classified with all 3 models
+            pending_uploads = []
             for clean_data in clean_upload_list:
-                # Check if already classified (check all models first)
                 result = db.session.execute(text("SELECT COUNT(*) as count FROM classification_results WHERE data_type = :data_type AND data_id = :data_id"), {'data_type': 'upload', 'data_id': clean_data.id})
                 existing_count = result.fetchone()[0]
-                if existing_count >= 3:  # Already classified with all 3 models
-                    continue
-                    
-                # Get models from app config
-                word2vec_model = current_app.config.get('WORD2VEC_MODEL')
-                naive_bayes_models = current_app.config.get('NAIVE_BAYES_MODELS', {})
-                
-                # Vectorize text first
-                text_vector = vectorize_text(clean_data.cleaned_content, word2vec_model)
-                
-                if text_vector is not None:
-                    # Perform classification with all three models
-                    for model_name, model in naive_bayes_models.items():
-                        if model:
-                            prediction, probabilities = classify_content(text_vector, model)
-                            
-                            # Create classification result
-                            # Handle probabilities consistently
-                            if isinstance(probabilities, (list, tuple, np.ndarray)) and len(probabilities) >= 2:
-                                prob_non_radikal = float(probabilities[0])
-                                prob_radikal = float(probabilities[1])
-                            else:
-                                prob_non_radikal = 0.0
-                                prob_radikal = 0.0
-                            
-                            classification_result = ClassificationResult(
-                                data_type='upload',
-                                data_id=clean_data.id,
-                                model_name=model_name,
-                                prediction=prediction,
-                                probability_radikal=prob_radikal,
-                                probability_non_radikal=prob_non_radikal,
-                                classified_by=current_user.id
-                            )
-                            
-                            db.session.add(classification_result)
-                    
-                    # Update RawData status
-                    raw_upload = RawData.query.get(clean_data.raw_data_id)
-                    if raw_upload:
-                        raw_upload.status = 'classified'
-                    
-                    classified_count += 1
-                else:
-                    pass
+                if existing_count < 3:
+                    pending_uploads.append(clean_data)
             
-            # Process scraper data
+            pending_scrapers = []
             for clean_scraper in clean_scraper_list:
-                # Check if already classified (check all models first)
                 result = db.session.execute(text("SELECT COUNT(*) as count FROM classification_results WHERE data_type = :data_type AND data_id = :data_id"), {'data_type': 'scraper', 'data_id': clean_scraper.id})
                 existing_count = result.fetchone()[0]
-                if existing_count >= 3:  # Already classified with all 3 models
-                    continue
+                if existing_count < 3:
+                    pending_scrapers.append(clean_scraper)
+            
+            # Reuse stored document vectors, vectorizing only missing rows in one batch per data type
+            # Optionally classify one representative per near-duplicate cluster and copy its result
+            embedding_version = registry.word2vec_version
+            upload_items, upload_rows = near_duplicate_index.select_representatives(
+                [('upload', c.id, c.cleaned_content) for c in pending_uploads]
+            )
+            scraper_items, scraper_rows = near_duplicate_index.select_representatives(
+                [('scraper', c.id, c.cleaned_content) for c in pending_scrapers]
+            )
+            upload_vectors = get_document_vectors(upload_items, word2vec_model, embedding_version)
+            scraper_vectors = get_document_vectors(scraper_items, word2vec_model, embedding_version)
+            
+            # Process upload data
+            upload_classifications = classify_contents(upload_vectors, naive_bayes_models)
+            for item_index, clean_data in enumerate(pending_uploads):
+                row_index = upload_rows[item_index]
+                # Store the results of all three models
+                for model_name, (predictions, probabilities) in upload_classifications.items():
+                    classification_result = ClassificationResult(
+                        data_type='upload',
+                        data_id=clean_data.id,
+                        model_name=model_name,
+                        model_version=registry.naive_bayes_versions.get(model_name),
+                        embedding_version=registry.word2vec_version,
+                        prediction=predictions[row_index],
+                        probability_radikal=float(probabilities[row_index][1]),
+                        probability_non_radikal=float(probabilities[row_index][0]),
+                        classified_by=current_user.id
+                    )
                     
-                # Get models from app config
-                word2vec_model = current_app.config.get('WORD2VEC_MODEL')
-                naive_bayes_models = current_app.config.get('NAIVE_BAYES_MODELS', {})
+                    db.session.add(classification_result)
                 
-                # Vectorize text first
-                text_vector = vectorize_text(clean_scraper.cleaned_content, word2vec_model)
+                # Update RawData status
+                raw_upload = RawData.query.get(clean_data.raw_data_id)
+                if raw_upload:
+                    raw_upload.status = 'classified'
                 
-                if text_vector is not None:
-                    # Perform classification with all three models
-                    for model_name, model in naive_bayes_models.items():
-                        if model:
-                            prediction, probabilities = classify_content(text_vector, model)
-                            
-                            # Create classification result
-                            # Handle probabilities consistently
-                            if isinstance(probabilities, (list, tuple, np.ndarray)) and len(probabilities) >= 2:
-                                prob_non_radikal = float(probabilities[0])
-                                prob_radikal = float(probabilities[1])
-                            else:
-                                prob_non_radikal = 0.0
-                                prob_radikal = 0.0
-                            
-                            classification_result = ClassificationResult(
-                                data_type='scraper',
-                                data_id=clean_scraper.id,
-                                model_name=model_name,
-                                prediction=prediction,
-                                probability_radikal=prob_radikal,
-                                probability_non_radikal=prob_non_radikal,
-                                classified_by=current_user.id
-                            )
-                            
-                            db.session.add(classification_result)
-                    
-                    # Update RawDataScraper status
-                    raw_scraper = RawDataScraper.query.get(clean_scraper.raw_data_scraper_id)
-                    if raw_scraper:
-                        raw_scraper.status = 'classified'
+                classified_count += 1
+            
+            # Process scraper data
+            scraper_classifications = classify_contents(scraper_vectors, naive_bayes_models)
+            for item_index, clean_scraper in enumerate(pending_scrapers):
+                row_index = scraper_rows[item_index]
+                # Store the results of all three models
+                for model_name, (predictions, probabilities) in scraper_classifications.items():
+                    classification_result = ClassificationResult(
+                        data_type='scraper',
+                        data_id=clean_scraper.id,
+                        model_name=model_name,
+                        model_version=registry.naive_bayes_versions.get(model_name),
+                        embedding_version=registry.word2vec_version,
+                        prediction=predictions[row_index],
+                        probability_radikal=float(probabilities[row_index][1]),
+                        probability_non_radikal=float(probabilities[row_index][0]),
+                        classified_by=current_user.id
+                    )
                     
-                    classified_count += 1
-                else:
-                    pass
+                    db.session.add(classification_result)
+                
+                # Update RawDataScraper status
+                raw_scraper = RawDataScraper.query.get(clean_scraper.raw_data_scraper_id)
+                if raw_scraper:
+                    raw_scraper.status = 'classified'
+                
+                classified_count += 1
             
             # Update dataset statistics
             dataset.updated_at = datetime.utcnow()
@@ -4583,21 +4718,30 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             # Convert to integers
             data_ids = [int(id) for id in data_ids]
             
+            # Load selected rows at once and prefetch existing cleaned content hashes
+            raw_uploads = {raw_data.id: raw_data for raw_data in RawData.query.filter(RawData.id.in_(data_ids)).all()}
+            raw_scrapers = {raw_scraper.id: raw_scraper for raw_scraper in RawDataScraper.query.filter(RawDataScraper.id.in_(data_ids)).all()}
+            cleaned_uploads = dict(zip(raw_uploads, clean_texts(raw_data.content for raw_data in raw_uploads.values())))
+            cleaned_scrapers = dict(zip(raw_scrapers, clean_texts(raw_scraper.content for raw_scraper in raw_scrapers.values())))
+            deduper = CleanedContentDeduper()
+            deduper.prefetch(list(cleaned_uploads.values()) + list(cleaned_scrapers.values()))
+            
             cleaned_count = 0
+            new_clean_rows = []
             for data_id in data_ids:
                 # Check RawData first
-                raw_data = RawData.query.get(data_id)
+                raw_data = raw_uploads.get(data_id)
                 if raw_data:
                     # Check if already cleaned
                     existing_clean = CleanDataUpload.query.filter_by(raw_data_id=data_id).first()
                     if existing_clean:
                         continue
                     
-                    # Clean the content
-                    cleaned_content = clean_text(raw_data.content)
+                    # Content was cleaned in bulk above
+                    cleaned_content = cleaned_uploads[data_id]
                     
                     # Check for duplicate content
-                    is_duplicate = check_cleaned_content_duplicate(cleaned_content)
+                    is_duplicate = deduper.is_duplicate(cleaned_content)
                     
                     if not is_duplicate:
                         # Save cleaned data
@@ -4612,6 +4756,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                         )
                         
                         db.session.add(clean_data)
+                        new_clean_rows.append(clean_data)
                         cleaned_count += 1
                     
                     # Update raw data status regardless of duplication
@@ -4619,7 +4764,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     continue
                 
                 # Check RawDataScraper
-                raw_scraper = RawDataScraper.query.get(data_id)
+                raw_scraper = raw_scrapers.get(data_id)
                 if raw_scraper:
                     # Check if already cleaned using raw SQL
                     result = db.session.execute(text("SELECT * FROM clean_data_scraper WHERE raw_data_scraper_id = :data_id LIMIT 1"), {'data_id': data_id})
@@ -4627,11 +4772,11 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                     if existing_clean:
                         continue
                     
-                    # Clean the content
-                    cleaned_content = clean_text(raw_scraper.content)
+                    # Content was cleaned in bulk above
+                    cleaned_content = cleaned_scrapers[data_id]
                     
                     # Check for duplicate content
-                    is_duplicate = check_cleaned_content_duplicate(cleaned_content)
+                    is_duplicate = deduper.is_duplicate(cleaned_content)
                     
                     if not is_duplicate:
                         # Save cleaned data
@@ -4648,11 +4793,13 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                         )
                         
                         db.session.add(clean_data)
+                        new_clean_rows.append(clean_data)
                         cleaned_count += 1
                     
                     # Update raw data status regardless of duplication
                     raw_scraper.status = 'cleaned'
             
+            near_duplicate_index.index_clean_rows(new_clean_rows)
             db.session.commit()
             update_statistics()
             
@@ -4727,6 +4874,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
     @app.route('/api/classify_data', methods=['POST'])
     @login_required
     @active_user_required
+    @models_ready_required
     def classify_data_api():
         """Classify data API"""
         try:
@@ -4743,6 +4891,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             data_ids = [int(id) for id in data_ids]
             
             classified_count = 0
+            pending_items = []
             for data_id in data_ids:
                 # Check both CleanDataUpload and CleanDataScraper
                 clean_data_upload = CleanDataUpload.query.get(data_id)
@@ -4771,40 +4920,37 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                 if existing_classification:
                     continue
                 
-                # Classify the text using available models
+                pending_items.append((data_type, data_id, cleaned_text))
+            
+            # Get models from app config
+            registry = model_loader.get_registry()
+            word2vec_model = registry.word2vec_model
+            naive_bayes_models = registry.naive_bayes_models
+            
+            # Reuse stored document vectors, vectorize only missing rows, then classify the whole matrix per model
+            # Optionally classify one representative per near-duplicate cluster and copy its result
+            representative_items, representative_rows = near_duplicate_index.select_representatives(pending_items)
+            text_vectors = get_document_vectors(representative_items, word2vec_model, registry.word2vec_version)
+            classifications = classify_contents(text_vectors, naive_bayes_models)
+            
+            for item_index, (data_type, data_id, _) in enumerate(pending_items):
+                row_index = representative_rows[item_index]
                 try:
-                    # Get models from app config
-                    word2vec_model = current_app.config.get('WORD2VEC_MODEL')
-                    naive_bayes_models = current_app.config.get('NAIVE_BAYES_MODELS', {})
-                    
-                    # Vectorize text
-                    text_vector = vectorize_text(cleaned_text, word2vec_model)
-                    
-                    # Classify with each available model
-                    for model_name, model in naive_bayes_models.items():
-                        if model is not None:
-                            prediction, probabilities = classify_content(text_vector, model)
-                            
-                            # Save classification result
-                            # Handle probabilities consistently
-                            if isinstance(probabilities, (list, tuple, np.ndarray)) and len(probabilities) >= 2:
-                                prob_non_radikal = float(probabilities[0])
-                                prob_radikal = float(probabilities[1])
-                            else:
-                                prob_non_radikal = 0.0
-                                prob_radikal = 0.0
-                            
-                            classification = ClassificationResult(
-                                data_type=data_type,
-                                data_id=data_id,
-                                model_name=model_name,
-                                prediction=prediction,
-                                probability_radikal=prob_radikal,
-                                probability_non_radikal=prob_non_radikal,
-                                classified_by=current_user.id
-                            )
-                            
-                            db.session.add(classification)
+                    # Save classification result for each available model
+                    for model_name, (predictions, probabilities) in classifications.items():
+                        classification = ClassificationResult(
+                            data_type=data_type,
+                            data_id=data_id,
+                            model_name=model_name,
+                            model_version=registry.naive_bayes_versions.get(model_name),
+                            embedding_version=registry.word2vec_version,
+                            prediction=predictions[row_index],
+                            probability_radikal=float(probabilities[row_index][1]),
+                            probability_non_radikal=float(probabilities[row_index][0]),
+                            classified_by=current_user.id
+                        )
+                        
+                        db.session.add(classification)
                     
                     # Update raw data status to 'classified'
                     if data_type == 'scraper':
@@ -5274,6 +5420,34 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
                              inactive_users=inactive_users,
                              current_time=datetime.now())
     
+    # Model Registry Routes
+    @app.route('/api/admin/models', methods=['GET'])
+    @login_required
+    @admin_required
+    def admin_model_status():
+        """Status model aktif, versi registry dan reload terakhir"""
+        return jsonify({'success': True, 'models': model_loader.get_status()})
+    
+    @app.route('/api/admin/models/reload', methods=['POST'])
+    @login_required
+    @admin_required
+    def admin_reload_models():
+        """Muat ulang model yang file-nya berubah tanpa restart worker"""
+        if not model_loader.reload():
+            response = jsonify({
+                'success': False,
+                'message': 'Model belum siap atau reload lain sedang berjalan',
+                'models': model_loader.get_status()
+            })
+            response.status_code = 409
+            return response
+        
+        return jsonify({
+            'success': True,
+            'message': 'Reload model dimulai di background',
+            'models': model_loader.get_status()
+        }), 202
+    
     # Admin API Routes
     @app.route('/api/admin/users', methods=['POST'])
     @login_required
@@ -5586,32 +5760,66 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             # Create a system user for API requests (or use a specific API user)
             api_user_id = 1  # Assuming admin user ID is 1, or create a dedicated API user
             
-            # Generate unique job ID
-            job_id = str(uuid.uuid4())
-            
-            # Start scraping process
-            processed_results, run_id = scrape_with_apify(
+            # Start scraping as a background job; poll /api/v1/scraping/jobs/<job_id> for the result
+            scraping_job = ScrapingJob(
+                status='pending',
+                backend=background_job_runner.backend,
                 platform=platform,
                 keyword=keywords,
                 date_from=start_date,
                 date_to=end_date,
-                max_results=max_results
+                max_results=max_results,
+                created_by=api_user_id
             )
+            db.session.add(scraping_job)
+            db.session.commit()
+            submit_scraping_job(scraping_job)
             
             return jsonify({
                 'success': True,
                 'message': 'Scraping started successfully',
-                'job_id': job_id,
-                'run_id': run_id,
+                'job_id': scraping_job.id,
+                'status_url': url_for('api_get_scraping_job', job_id=scraping_job.id),
                 'platform': platform,
                 'keywords': keywords,
-                'max_results': max_results,
-                'results_count': len(processed_results) if processed_results else 0,
-                'preview_data': processed_results[:3] if processed_results else []  # Return first 3 results as preview
+                'max_results': max_results
             })
                 
         except Exception as e:
             return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+    
+    @app.route('/api/v1/scraping/jobs/<int:job_id>', methods=['GET'])
+    @csrf.exempt
+    def api_get_scraping_job(job_id):
+        """API endpoint for getting a background scraping job - CSRF exempt for external API access"""
+        try:
+            # Check for API key authentication
+            api_key = request.headers.get('X-API-Key')
+            if not api_key:
+                return jsonify({'success': False, 'message': 'API key required'}), 401
+            
+            # Validate API key
+            expected_api_key = os.getenv('WASKITA_API_KEY')
+            if expected_api_key and api_key != expected_api_key:
+                return jsonify({'success': False, 'message': 'Invalid API key'}), 401
+            
+            scraping_job = db.session.get(ScrapingJob, job_id)
+            if not scraping_job:
+                return jsonify({'success': False, 'message': 'Job not found'}), 404
+            
+            response = {'success': True, 'job': scraping_job.to_dict()}
+            if scraping_job.status == 'completed':
+                scraping_info = read_scraping_job_results(scraping_job) or {}
+                response.update({
+                    'run_id': scraping_job.run_id,
+                    'results_count': scraping_info.get('total_records', 0),
+                    'preview_data': scraping_info.get('sample_data', [])[:3]  # Return first 3 results as preview
+                })
+            
+            return jsonify(response)
+        
+        except Exception as e:
+            return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
 
     @app.route('/api/v1/scraping/progress/<run_id>', methods=['GET'])
     @csrf.exempt
@@ -5690,7 +5898,8 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
         except Exception as e:
             db_status = f'unhealthy: {str(e)}'
         
-        # Check if models are loaded
+        # Check if models are loaded (loaded in background after startup)
+        model_loading = model_loader.get_status()
         models_status = 'loaded' if hasattr(app, 'models_loaded') and app.models_loaded else 'not_loaded'
         
         health_data = {
@@ -5699,6 +5908,7 @@ def init_routes(app, word2vec_model_param, naive_bayes_models_param):
             'version': '1.0.0',
             'database': db_status,
             'models': models_status,
+            'model_loading': model_loading,
             'uptime': str(datetime.now() - app.start_time) if hasattr(app, 'start_time') else 'unknown'
         }
         
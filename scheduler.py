@@ -2,9 +2,9 @@ import schedule
 import time
 import threading
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from flask import current_app
-from models import db, RawDataScraper, CleanDataScraper, ClassificationResult
+from models import db, RawDataScraper, CleanDataScraper, CleanDataUpload, ClassificationResult, DocumentVector, ScheduledScrape, ScrapingJob, NearDuplicateSignature, NearDuplicateBand
 from sqlalchemy import text
 
 # Setup logging
@@ -75,6 +75,79 @@ class DataCleanupScheduler:
             db.session.rollback()
             return 0
     
+    def cleanup_orphaned_document_vectors(self):
+        """Menghapus vektor dokumen yang data bersihnya sudah tidak ada"""
+        try:
+            with self.app.app_context():
+                deleted_count = 0
+                for data_type, clean_model in (('upload', CleanDataUpload), ('scraper', CleanDataScraper)):
+                    deleted_count += db.session.query(DocumentVector).filter(
+                        DocumentVector.data_type == data_type,
+                        ~DocumentVector.data_id.in_(db.session.query(clean_model.id))
+                    ).delete(synchronize_session=False)
+                
+                db.session.commit()
+                if deleted_count:
+                    logger.info(f"Menghapus {deleted_count} vektor dokumen orphan")
+                
+                return deleted_count
+        
+        except Exception as e:
+            logger.error(f"Error saat membersihkan vektor dokumen orphan: {str(e)}")
+            db.session.rollback()
+            return 0
+    
+    def cleanup_orphaned_near_duplicate_signatures(self):
+        """Menghapus signature near-duplicate (beserta band LSH-nya) yang data bersihnya sudah tidak ada"""
+        try:
+            with self.app.app_context():
+                deleted_count = 0
+                for data_type, clean_model in (('upload', CleanDataUpload), ('scraper', CleanDataScraper)):
+                    orphaned_ids = db.session.query(NearDuplicateSignature.id).filter(
+                        NearDuplicateSignature.data_type == data_type,
+                        ~NearDuplicateSignature.data_id.in_(db.session.query(clean_model.id))
+                    )
+                    # Band dihapus eksplisit karena bulk delete tidak menjalankan cascade relationship
+                    db.session.query(NearDuplicateBand).filter(
+                        NearDuplicateBand.signature_id.in_(orphaned_ids)
+                    ).delete(synchronize_session=False)
+                    deleted_count += db.session.query(NearDuplicateSignature).filter(
+                        NearDuplicateSignature.id.in_(orphaned_ids)
+                    ).delete(synchronize_session=False)
+                
+                db.session.commit()
+                if deleted_count:
+                    logger.info(f"Menghapus {deleted_count} signature near-duplicate orphan")
+                
+                return deleted_count
+        
+        except Exception as e:
+            logger.error(f"Error saat membersihkan signature near-duplicate orphan: {str(e)}")
+            db.session.rollback()
+            return 0
+    
+    def cleanup_expired_scraping_raw_items(self):
+        """Menghapus item mentah Apify yang disimpan untuk mapping ulang setelah masa simpan habis"""
+        try:
+            with self.app.app_context():
+                retention_days = current_app.config.get('SCRAPING_RAW_ITEMS_RETENTION_DAYS', 30)
+                cutoff = datetime.utcnow() - timedelta(days=retention_days)
+                cleared_count = ScrapingJob.query.filter(
+                    ScrapingJob.raw_items_size.isnot(None),
+                    db.or_(ScrapingJob.finished_at < cutoff, ScrapingJob.dataset_id.is_(None))
+                ).update({'raw_items': None, 'raw_items_size': None}, synchronize_session=False)
+                
+                db.session.commit()
+                if cleared_count:
+                    logger.info(f"Menghapus item mentah {cleared_count} job scraping yang kedaluwarsa")
+                
+                return cleared_count
+        
+        except Exception as e:
+            logger.error(f"Error saat menghapus item mentah scraping: {str(e)}")
+            db.session.rollback()
+            return 0
+    
     def update_statistics(self):
         """Update statistik dashboard setelah cleanup"""
         try:
@@ -109,6 +182,9 @@ class DataCleanupScheduler:
         logger.info(f"Memulai pembersihan otomatis data scraper orphan - {datetime.now()}")
         
         deleted_count = self.cleanup_orphaned_scraper_data()
+        self.cleanup_orphaned_document_vectors()
+        self.cleanup_orphaned_near_duplicate_signatures()
+        self.cleanup_expired_scraping_raw_items()
         
         if deleted_count > 0:
             self.update_statistics()
@@ -116,8 +192,77 @@ class DataCleanupScheduler:
         else:
             logger.info("Pembersihan selesai: tidak ada data orphan yang dihapus")
     
+    def run_due_scrapes(self, now=None):
+        """
+        Jalankan definisi scraping terjadwal yang sudah jatuh tempo sebagai background job.
+        Jumlah job Apify aktif per platform dibatasi SCRAPING_PLATFORM_CONCURRENCY; definisi yang
+        tertahan tetap jatuh tempo dan dicoba lagi pada pengecekan berikutnya. Setiap definisi
+        diklaim dengan memajukan next_run_at secara atomik sehingga tidak dijalankan dua kali.
+        """
+        from background_jobs import background_job_runner
+        from scraping_jobs import submit_scraping_job
+        
+        started_count = 0
+        try:
+            with self.app.app_context():
+                now = now or datetime.utcnow()
+                due_scrapes = ScheduledScrape.query.filter(
+                    ScheduledScrape.is_active.is_(True),
+                    ScheduledScrape.next_run_at <= now
+                ).order_by(ScheduledScrape.next_run_at).all()
+                if not due_scrapes:
+                    return 0
+                
+                limits = self.app.config.get('SCRAPING_PLATFORM_CONCURRENCY', {})
+                active_counts = dict(db.session.query(ScrapingJob.platform, db.func.count(ScrapingJob.id)).filter(
+                    ScrapingJob.status.in_(('pending', 'running'))
+                ).group_by(ScrapingJob.platform).all())
+                
+                for scheduled in due_scrapes:
+                    platform = scheduled.platform.lower()
+                    limit = limits.get(platform, 2)
+                    if active_counts.get(platform, 0) >= limit:
+                        logger.info(f"Scraping terjadwal {scheduled.id} ditunda: {active_counts[platform]} job {platform} masih berjalan (batas {limit})")
+                        continue
+                    
+                    claimed = ScheduledScrape.query.filter_by(id=scheduled.id, next_run_at=scheduled.next_run_at).update(
+                        {'next_run_at': scheduled.compute_next_run(now), 'last_run_at': now}, synchronize_session=False
+                    )
+                    if not claimed:
+                        db.session.rollback()
+                        continue
+                    
+                    job = ScrapingJob(
+                        status='pending',
+                        backend=background_job_runner.backend,
+                        platform=platform,
+                        keyword=scheduled.keyword,
+                        max_results=scheduled.max_results,
+                        dataset_id=scheduled.dataset_id,
+                        dataset_name=scheduled.dataset.name if scheduled.dataset else None,
+                        scheduled_scrape_id=scheduled.id,
+                        created_by=scheduled.created_by
+                    )
+                    db.session.add(job)
+                    db.session.commit()
+                    active_counts[platform] = active_counts.get(platform, 0) + 1
+                    started_count += 1
+                    
+                    try:
+                        submit_scraping_job(job)
+                    except Exception as e:
+                        logger.error(f"Gagal menjalankan scraping terjadwal {scheduled.id}: {str(e)}")
+                
+                logger.info(f"{started_count} dari {len(due_scrapes)} scraping terjadwal dijalankan")
+                return started_count
+        
+        except Exception as e:
+            logger.error(f"Error saat menjalankan scraping terjadwal: {str(e)}")
+            db.session.rollback()
+            return started_count
+    
     def start_scheduler(self):
-        """Memulai scheduler untuk pembersihan otomatis"""
+        """Memulai scheduler untuk pembersihan otomatis dan scraping terjadwal"""
         if self.running:
             logger.warning("Scheduler sudah berjalan")
             return
@@ -128,6 +273,9 @@ class DataCleanupScheduler:
         # Jadwalkan pembersihan setiap 6 jam untuk pembersihan lebih sering
         schedule.every(6).hours.do(self.scheduled_cleanup)
         
+        # Cek definisi scraping terjadwal yang jatuh tempo setiap menit
+        schedule.every(1).minutes.do(self.run_due_scrapes)
+        
         self.running = True
         
         def run_scheduler():
@@ -139,7 +287,7 @@ class DataCleanupScheduler:
         self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
         self.scheduler_thread.start()
         
-        logger.info("Scheduler berhasil dimulai - pembersihan otomatis setiap 6 jam dan setiap hari pukul 02:00")
+        logger.info("Scheduler berhasil dimulai - pembersihan otomatis setiap 6 jam dan setiap hari pukul 02:00, scraping terjadwal dicek setiap menit")
     
     def stop_scheduler(self):
         """Menghentikan scheduler"""
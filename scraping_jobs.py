@@ -0,0 +1,718 @@
+import io
+import os
+import gzip
+import json
+import uuid
+import itertools
+import logging
+import tempfile
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+SCRAPING_JOB_NAME = 'apify_scraping'
+DEFAULT_POLL_INTERVAL = 5
+DEFAULT_MAX_WAIT = 1800
+SAMPLE_ROWS = 5
+MAPPING_CHUNK_SIZE = 1000
+RAW_ITEMS_COMPRESS_LEVEL = 6
+
+def get_scraping_temp_path(temp_id):
+    """Path file metadata hasil scraping yang menunggu column mapping"""
+    return os.path.join(tempfile.gettempdir(), f'waskita_scraping_{temp_id}.json')
+
+def get_scraping_rows_path(temp_id):
+    """Path file JSON Lines berisi baris hasil scraping (satu item per baris)"""
+    return os.path.join(tempfile.gettempdir(), f'waskita_scraping_{temp_id}.jsonl')
+
+def write_scraping_temp_file(temp_id, temp_data, rows):
+    """
+    Simpan hasil scraping untuk column mapping. Baris (boleh generator) ditulis satu per satu
+    ke file JSON Lines sehingga memori tidak bergantung pada jumlah hasil; metadata berisi
+    jumlah baris, kolom dan sampel preview ditulis terakhir. Return jumlah baris.
+    """
+    from utils import DateTimeEncoder
+    
+    sample_data = []
+    total_records = 0
+    with open(get_scraping_rows_path(temp_id), 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False, cls=DateTimeEncoder))
+            f.write('\n')
+            if len(sample_data) < SAMPLE_ROWS:
+                sample_data.append(row)
+            total_records += 1
+    
+    temp_data = dict(
+        temp_data,
+        total_records=total_records,
+        columns=list(sample_data[0].keys()) if sample_data else [],
+        sample_data=sample_data
+    )
+    
+    # Tulis ke file .tmp lalu rename agar pembaca tidak pernah melihat metadata setengah jadi
+    temp_file_path = get_scraping_temp_path(temp_id)
+    with open(temp_file_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(temp_data, f, ensure_ascii=False, indent=2, cls=DateTimeEncoder)
+    os.replace(temp_file_path + '.tmp', temp_file_path)
+    return total_records
+
+def read_scraping_temp_file(temp_id):
+    """Baca metadata hasil scraping sementara, None jika file tidak ada atau rusak"""
+    if not temp_id:
+        return None
+    
+    temp_file_path = get_scraping_temp_path(temp_id)
+    if not os.path.exists(temp_file_path):
+        return None
+    try:
+        with open(temp_file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"Error membaca file sementara scraping {temp_id}: {str(e)}")
+        return None
+
+def iter_scraping_temp_rows(temp_id):
+    """Baca ulang baris hasil scraping satu per satu dari file JSON Lines"""
+    with open(get_scraping_rows_path(temp_id), 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def iter_scraped_chunks(rows, chunk_size=MAPPING_CHUNK_SIZE):
+    """Kelompokkan baris hasil scraping (list atau generator) menjadi list per chunk"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def remove_scraping_temp_file(temp_id):
+    if not temp_id:
+        return
+    for path in (get_scraping_temp_path(temp_id), get_scraping_rows_path(temp_id)):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def iter_archived_items(items, archive):
+    """Teruskan item mentah Apify sambil menulis setiap item sebagai baris JSON ke archive (file gzip)"""
+    from utils import DateTimeEncoder
+    
+    for item in items:
+        archive.write(json.dumps(item, ensure_ascii=False, separators=(',', ':'), cls=DateTimeEncoder).encode('utf-8'))
+        archive.write(b'\n')
+        yield item
+
+def iter_scraping_raw_items(raw_items):
+    """Baca ulang item mentah Apify satu per satu dari blob gzip JSON Lines (ScrapingJob.raw_items)"""
+    with gzip.GzipFile(fileobj=io.BytesIO(raw_items), mode='rb') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def iter_scraping_job_rows(job):
+    """Baris hasil scraping job yang dinormalisasi ulang dari item mentah tersimpan (tanpa scraping ulang)"""
+    from utils import iter_processed_apify_results
+    
+    return iter_processed_apify_results(iter_scraping_raw_items(job.raw_items), job.platform)
+
+def read_scraping_job_results(job):
+    """
+    Metadata hasil scraping job untuk column mapping: dari file sementara selama masih ada,
+    atau disusun dari item mentah tersimpan setelah file dihapus (mis. mapping ulang dengan
+    kolom lain). Flag raw_items menandai baris harus dibaca lewat iter_scraping_job_rows.
+    None jika keduanya tidak tersedia.
+    """
+    scraping_info = read_scraping_temp_file(job.temp_id)
+    if scraping_info or not job.raw_items_size:
+        return scraping_info
+    
+    sample_data = list(itertools.islice(iter_scraping_job_rows(job), SAMPLE_ROWS))
+    return {
+        'run_id': job.run_id,
+        'platform': job.platform,
+        'keywords': job.keyword,
+        'start_date': job.date_from,
+        'end_date': job.date_to,
+        'dataset_id': job.dataset_id,
+        'dataset_name': job.dataset_name,
+        'total_records': job.items_count or 0,
+        'columns': list(sample_data[0].keys()) if sample_data else [],
+        'sample_data': sample_data,
+        'raw_items': True
+    }
+
+def save_scraped_rows(rows, dataset, platform, keyword, scrape_date, scraped_by, content_column, username_column=None, url_column=None, chunk_size=MAPPING_CHUNK_SIZE):
+    """
+    Simpan baris hasil scraping (list atau generator) ke raw_data_scraper sesuai column mapping.
+    Baris diproses per chunk: duplikat dicek dengan query IN content_hash per chunk dan setiap
+    chunk di-flush agar terlihat oleh pengecekan chunk berikutnya. Commit dilakukan pemanggil.
+    Return jumlah baris yang ditambahkan; konten kosong dan duplikat dilewati.
+    """
+    from models import db, RawDataScraper
+    from utils import check_content_duplicates
+    
+    records_added = 0
+    for scraped_chunk in iter_scraped_chunks(rows, chunk_size):
+        contents_to_check = []
+        for data in scraped_chunk:
+            content_value = data.get(content_column, '')
+            contents_to_check.append(str(content_value).strip() if content_value else '')
+        duplicate_flags = check_content_duplicates(
+            contents_to_check,
+            dataset_id=dataset.id,
+            models=(RawDataScraper,),
+            platform=platform,
+            keyword=keyword
+        )
+        
+        for data, content_to_check, is_duplicate in zip(scraped_chunk, contents_to_check, duplicate_flags):
+            # Lewati konten kosong dan duplikat
+            if not content_to_check or is_duplicate:
+                continue
+            
+            username_value = data.get(username_column, 'unknown') if username_column and username_column in data else 'unknown'
+            url_value = data.get(url_column, '') if url_column and url_column in data else ''
+            if not username_value or not str(username_value).strip():
+                username_value = 'unknown'
+            
+            # Data engagement; TikTok memakai nama field yang berbeda
+            likes = data.get('likes', 0) or 0
+            retweets = data.get('retweets', 0) or 0
+            replies = data.get('replies', 0) or 0
+            comments = data.get('comments', 0) or 0
+            shares = data.get('shares', 0) or 0
+            views = data.get('views', 0) or 0
+            if platform.lower() == 'tiktok':
+                likes = data.get('diggCount', 0) or data.get('likes', 0) or 0
+                comments = data.get('commentCount', 0) or data.get('comments', 0) or 0
+                shares = data.get('shareCount', 0) or data.get('shares', 0) or 0
+                views = data.get('playCount', 0) or data.get('views', 0) or 0
+            
+            db.session.add(RawDataScraper(
+                username=str(username_value).strip(),
+                content=content_to_check,
+                url=str(url_value) if url_value else '',
+                platform=platform,
+                keyword=keyword,
+                scrape_date=scrape_date,
+                dataset_id=dataset.id,
+                dataset_name=dataset.name,
+                scraped_by=scraped_by,
+                likes=likes,
+                retweets=retweets,
+                replies=replies,
+                comments=comments,
+                shares=shares,
+                views=views
+            ))
+            records_added += 1
+        
+        db.session.flush()
+    
+    return records_added
+
+def clean_scraped_dataset_rows(dataset_id, cleaned_by):
+    """
+    Bersihkan data scraper berstatus 'raw' di dataset (dipakai scraping terjadwal). Sama seperti
+    pembersihan dataset dari UI: konten yang sudah ada di data bersih dilewati dan baris baru
+    diindeks untuk near-duplicate. Commit dilakukan pemanggil. Return jumlah data bersih baru.
+    """
+    from models import db, RawDataScraper, CleanDataScraper
+    from utils import clean_texts, CleanedContentDeduper
+    from near_duplicate import near_duplicate_index
+    
+    raw_rows = RawDataScraper.query.filter_by(dataset_id=dataset_id, status='raw').all()
+    if not raw_rows:
+        return 0
+    
+    deduper = CleanedContentDeduper(dataset_id=dataset_id)
+    cleaned_contents = clean_texts(raw_row.content for raw_row in raw_rows)
+    deduper.prefetch(cleaned_contents)
+    
+    new_clean_rows = []
+    for raw_row, cleaned_content in zip(raw_rows, cleaned_contents):
+        if not deduper.is_duplicate(cleaned_content):
+            clean_row = CleanDataScraper(
+                raw_data_scraper_id=raw_row.id,
+                platform=raw_row.platform,
+                username=raw_row.username,
+                content=raw_row.content,
+                cleaned_content=cleaned_content,
+                url=raw_row.url,
+                keyword=raw_row.keyword,
+                dataset_id=dataset_id,
+                cleaned_by=cleaned_by
+            )
+            db.session.add(clean_row)
+            new_clean_rows.append(clean_row)
+        raw_row.status = 'cleaned'
+    
+    db.session.flush()
+    near_duplicate_index.index_clean_rows(new_clean_rows)
+    return len(new_clean_rows)
+
+def classify_scraped_dataset_rows(dataset_id, classified_by):
+    """
+    Klasifikasikan data scraper bersih di dataset yang belum punya hasil klasifikasi dengan
+    ketiga model aktif. Commit dilakukan pemanggil. Return jumlah data yang diklasifikasi.
+    """
+    from models import db, RawDataScraper, CleanDataScraper, ClassificationResult
+    from utils import get_document_vectors, classify_contents
+    from model_loader import model_loader
+    from near_duplicate import near_duplicate_index
+    
+    if not model_loader.is_ready():
+        raise Exception('Model klasifikasi belum siap')
+    registry = model_loader.get_registry()
+    
+    classified_ids = db.session.query(ClassificationResult.data_id).filter(ClassificationResult.data_type == 'scraper')
+    pending_rows = CleanDataScraper.query.filter(
+        CleanDataScraper.dataset_id == dataset_id,
+        ~CleanDataScraper.id.in_(classified_ids)
+    ).all()
+    if not pending_rows:
+        return 0
+    
+    items, row_indexes = near_duplicate_index.select_representatives(
+        [('scraper', clean_row.id, clean_row.cleaned_content) for clean_row in pending_rows]
+    )
+    vectors = get_document_vectors(items, registry.word2vec_model, registry.word2vec_version)
+    classifications = classify_contents(vectors, registry.naive_bayes_models)
+    
+    raw_ids = []
+    for item_index, clean_row in enumerate(pending_rows):
+        row_index = row_indexes[item_index]
+        for model_name, (predictions, probabilities) in classifications.items():
+            db.session.add(ClassificationResult(
+                data_type='scraper',
+                data_id=clean_row.id,
+                model_name=model_name,
+                model_version=registry.naive_bayes_versions.get(model_name),
+                embedding_version=registry.word2vec_version,
+                prediction=predictions[row_index],
+                probability_radikal=float(probabilities[row_index][1]),
+                probability_non_radikal=float(probabilities[row_index][0]),
+                classified_by=classified_by
+            ))
+        raw_ids.append(clean_row.raw_data_scraper_id)
+    
+    for start in range(0, len(raw_ids), MAPPING_CHUNK_SIZE):
+        RawDataScraper.query.filter(RawDataScraper.id.in_(raw_ids[start:start + MAPPING_CHUNK_SIZE])).update(
+            {'status': 'classified'}, synchronize_session=False
+        )
+    return len(pending_rows)
+
+def submit_scraping_job(job, delay=None, poll_count=None):
+    """
+    Jadwalkan handler scraping untuk job. poll_count adalah generasi polling yang diharapkan
+    handler (lihat _poll_scraping_run). Jika backend menolak submit, job langsung ditandai
+    gagal agar tidak menggantung di status pending/running.
+    """
+    from background_jobs import background_job_runner
+    
+    args = () if poll_count is None else (poll_count,)
+    try:
+        return background_job_runner.submit(SCRAPING_JOB_NAME, job.id, *args, delay=delay)
+    except Exception as e:
+        _fail_scraping_job(job, f'Gagal menjadwalkan scraping: {str(e)}')
+        raise
+
+def run_scraping_job(job_id, poll_count=None):
+    """
+    Handler background job scraping Apify. Setiap eksekusi hanya melakukan satu langkah
+    singkat: memulai actor (pending) atau mengecek status run sekali (running). Selama run
+    belum selesai handler menjadwalkan dirinya lagi setelah SCRAPING_POLL_INTERVAL detik,
+    sehingga banyak scraping paralel tidak menahan thread web maupun slot worker.
+    """
+    from models import db, ScrapingJob
+    
+    job = db.session.get(ScrapingJob, job_id)
+    if job is None or job.status not in ('pending', 'running'):
+        logger.warning(f"Scraping job {job_id} tidak ditemukan atau sudah selesai")
+        return None
+    
+    if job.status == 'pending':
+        return _start_scraping_run(job)
+    return _poll_scraping_run(job, poll_count)
+
+def resume_scraping_jobs():
+    """
+    Jadwalkan ulang job yang belum selesai, mis. setelah proses web dengan backend thread
+    di-restart. Klaim atomik di handler mencegah job yang masih berjalan diproses dua kali.
+    """
+    from models import ScrapingJob
+    
+    jobs = ScrapingJob.query.filter(ScrapingJob.status.in_(('pending', 'running'))).all()
+    for job in jobs:
+        try:
+            submit_scraping_job(job)
+        except Exception as e:
+            logger.error(f"Gagal melanjutkan scraping job {job.id}: {str(e)}")
+    return len(jobs)
+
+def normalize_watermark_keyword(keyword):
+    return (keyword or '').strip().lower()
+
+def get_scraping_watermark(platform, keyword, dataset_id):
+    """Watermark (post terbaru yang sudah tersimpan) untuk kombinasi platform + keyword + dataset"""
+    from models import ScrapingWatermark
+    
+    if not dataset_id:
+        return None
+    return ScrapingWatermark.query.filter_by(
+        platform=platform.lower(), keyword=normalize_watermark_keyword(keyword), dataset_id=dataset_id
+    ).first()
+
+def advance_scraping_watermark(job):
+    """
+    Gabungkan rentang yang diambil lengkap oleh job (covered_from s.d. post terbaru) ke watermark
+    setelah hasilnya tersimpan di dataset (column mapping). Rentang yang bersambung digabung;
+    rentang yang lebih baru dan terpisah menggantikan watermark (celah di antaranya belum pernah
+    diambil); rentang lama yang terpisah diabaikan. Watermark tidak pernah mundur; job tanpa
+    dataset atau tanpa timestamp diabaikan.
+    """
+    from models import db, ScrapingWatermark
+    
+    if not job.dataset_id or job.newest_item_at is None:
+        return None
+    
+    run_from = job.covered_from or job.newest_item_at
+    watermark = get_scraping_watermark(job.platform, job.keyword, job.dataset_id)
+    if watermark is None:
+        watermark = ScrapingWatermark(
+            platform=job.platform.lower(),
+            keyword=normalize_watermark_keyword(job.keyword),
+            dataset_id=job.dataset_id
+        )
+        db.session.add(watermark)
+    else:
+        # Watermark lama tanpa covered_from hanya menjamin post terbarunya sendiri
+        covered_from = watermark.covered_from or watermark.last_item_at
+        if run_from > watermark.last_item_at:
+            pass  # Lebih baru dan terpisah: diganti
+        elif job.newest_item_at < covered_from:
+            return watermark  # Backfill lama yang terpisah
+        else:
+            run_from = min(run_from, covered_from)
+            if job.newest_item_at <= watermark.last_item_at:
+                # Rentang lama diperluas ke belakang; post terbaru tetap milik watermark
+                if run_from != watermark.covered_from:
+                    watermark.covered_from = run_from
+                    db.session.commit()
+                return watermark
+    
+    watermark.covered_from = run_from
+    watermark.last_item_id = job.newest_item_id
+    watermark.last_item_at = job.newest_item_at
+    watermark.last_run_id = job.run_id
+    db.session.commit()
+    logger.info(f"Watermark {job.platform}:{job.keyword} dataset {job.dataset_id} maju ke {job.newest_item_at} (sejak {run_from})")
+    return watermark
+
+def watermark_covers_window(watermark, date_from, date_to):
+    """
+    Apakah rentang job boleh dipersempit ke post setelah watermark: rentang terbuka (tanpa
+    date_from, mis. scraping terjadwal) atau date_from di dalam rentang yang sudah tersimpan
+    lengkap, dan date_to tidak berakhir sebelum watermark (backfill diambil penuh).
+    """
+    if watermark is None:
+        return False
+    if date_to and date_to < watermark.last_item_at.strftime('%Y-%m-%d'):
+        return False
+    if not date_from:
+        return True
+    return watermark.covered_from is not None and _parse_job_date(date_from) >= watermark.covered_from
+
+def get_run_covered_from(job, fetch_stats):
+    """
+    Awal rentang waktu yang diambil lengkap oleh run (bersama post terbarunya menjadi rentang
+    watermark), dari statistik iter_new_apify_items. None jika tidak ada post bertimestamp.
+    """
+    from utils import APIFY_NEWEST_FIRST_PLATFORMS
+    
+    if fetch_stats.get('item_at') is None:
+        return None
+    if fetch_stats.get('reached_since'):
+        # Paging berhenti di post yang sudah tersimpan: bersambung dengan watermark
+        return job.since_item_at
+    if job.max_results and fetch_stats.get('fetched', 0) >= job.max_results:
+        # Hasil terpotong max_results: bila urut terbaru dulu, semua sejak post tertua yang diambil
+        # lengkap; urutan lain tidak menjamin apa pun selain post terbaru itu sendiri
+        if job.platform.lower() in APIFY_NEWEST_FIRST_PLATFORMS:
+            return fetch_stats.get('oldest_at')
+        return fetch_stats['item_at']
+    
+    covered_from = _parse_job_date(job.date_from) if job.date_from else None
+    if job.since_item_at is not None and (covered_from is None or job.since_item_at > covered_from):
+        covered_from = job.since_item_at
+    return covered_from if covered_from is not None else fetch_stats.get('oldest_at')
+
+def _parse_job_date(value):
+    return datetime.strptime(value, '%Y-%m-%d')
+
+def _start_scraping_run(job):
+    from models import db, ScrapingJob
+    from utils import start_apify_actor, get_apify_error_message
+    
+    # Klaim job secara atomik agar actor tidak dijalankan dua kali (mis. redelivery Celery)
+    claimed = ScrapingJob.query.filter_by(id=job.id, status='pending').update(
+        {'status': 'running', 'started_at': datetime.utcnow()}, synchronize_session=False
+    )
+    db.session.commit()
+    if not claimed:
+        return None
+    db.session.refresh(job)
+    
+    # Scraping inkremental: hanya ambil post setelah watermark dataset tujuan bila awal rentang
+    # sudah tersimpan lengkap. Rentang yang dimulai lebih awal (atau berakhir sebelum watermark)
+    # diambil penuh; data yang sudah ada dilewati pengecekan duplikat content_hash.
+    watermark = get_scraping_watermark(job.platform, job.keyword, job.dataset_id)
+    if watermark_covers_window(watermark, job.date_from, job.date_to):
+        job.since_item_id = watermark.last_item_id
+        job.since_item_at = watermark.last_item_at
+        db.session.commit()
+    
+    try:
+        run_id, initial_status = start_apify_actor(
+            job.platform, job.keyword, job.date_from, job.date_to, job.max_results, job.params,
+            since_at=job.since_item_at
+        )
+    except Exception as e:
+        return _fail_scraping_job(job, get_apify_error_message(str(e), job.platform))
+    
+    logger.info(f"Scraping job {job.id}: Apify run {run_id} dimulai dengan status {initial_status}")
+    job.run_id = run_id
+    job.apify_status = initial_status
+    db.session.commit()
+    
+    _schedule_next_poll(job)
+    return job.to_dict()
+
+def _poll_scraping_run(job, poll_count=None):
+    from flask import current_app
+    from models import db, ScrapingJob
+    from utils import check_apify_run_status, get_apify_failure_message
+    
+    # Setiap polling membawa generasi poll_count yang dijadwalkan polling sebelumnya dan diklaim
+    # terhadap nilai itu, sehingga pesan yang dikirim ulang (mis. redelivery Celery dengan
+    # task_acks_late setelah worker mati) tidak membuat rantai polling kedua. Tanpa generasi
+    # (resume setelah restart) dipakai nilai saat ini.
+    if poll_count is None:
+        poll_count = job.poll_count or 0
+    claimed = ScrapingJob.query.filter_by(id=job.id, status='running', poll_count=poll_count).update(
+        {'poll_count': poll_count + 1, 'last_polled_at': datetime.utcnow()}, synchronize_session=False
+    )
+    db.session.commit()
+    if not claimed:
+        return None
+    db.session.refresh(job)
+    
+    if not job.run_id:
+        return _fail_scraping_job(job, 'Run Apify tidak tercatat. Silakan lakukan scraping ulang.')
+    
+    max_wait = current_app.config.get('SCRAPING_MAX_WAIT', DEFAULT_MAX_WAIT)
+    timed_out = (datetime.utcnow() - (job.started_at or job.created_at)).total_seconds() > max_wait
+    
+    try:
+        status_data = check_apify_run_status(job.run_id)
+    except Exception as e:
+        # Gangguan sementara saat cek status: coba lagi pada polling berikutnya
+        logger.warning(f"Scraping job {job.id}: gagal mengecek status run {job.run_id}: {str(e)}")
+        if timed_out:
+            return _fail_scraping_job(job, get_apify_failure_message('timeout'))
+        _schedule_next_poll(job)
+        return job.to_dict()
+    
+    status = status_data.get('status')
+    if status != job.apify_status:
+        logger.info(f"Scraping job {job.id}: Apify run {job.run_id} status {status}")
+    job.apify_status = status
+    
+    if status == 'SUCCEEDED':
+        return _finish_scraping_job(job)
+    elif status == 'FAILED':
+        return _fail_scraping_job(job, get_apify_failure_message(f"failed: {status_data.get('statusMessage', 'Unknown error')}"), apify_status=status)
+    elif status in ('ABORTED', 'TIMED-OUT'):
+        return _fail_scraping_job(job, get_apify_failure_message(status.lower()), apify_status=status)
+    elif timed_out:
+        return _fail_scraping_job(job, get_apify_failure_message('timeout'), apify_status=status)
+    
+    db.session.commit()
+    _schedule_next_poll(job)
+    return job.to_dict()
+
+def _finish_scraping_job(job):
+    from flask import current_app
+    from models import db, ScrapingJob
+    from utils import iter_apify_run_results, iter_new_apify_items, iter_processed_apify_results, get_apify_error_message
+    
+    # Klaim pengambilan hasil: hanya satu eksekusi yang menulis file hasil
+    temp_id = str(uuid.uuid4())
+    claimed = ScrapingJob.query.filter_by(id=job.id, status='running', temp_id=None).update(
+        {'temp_id': temp_id, 'apify_status': job.apify_status}, synchronize_session=False
+    )
+    db.session.commit()
+    if not claimed:
+        return None
+    db.session.refresh(job)
+    
+    newest = {}
+    fetch_started_at = datetime.utcnow()
+    # Item mentah ikut dikompres ke memori dalam satu kali stream untuk mapping ulang nanti;
+    # run terjadwal langsung disimpan ke dataset tanpa mapping sehingga tidak diarsipkan
+    raw_items_buffer = io.BytesIO()
+    archive = None
+    if current_app.config.get('SCRAPING_STORE_RAW_ITEMS', True) and not job.scheduled_scrape_id:
+        archive = gzip.GzipFile(fileobj=raw_items_buffer, mode='wb', compresslevel=RAW_ITEMS_COMPRESS_LEVEL, mtime=0)
+    try:
+        # Dataset di-stream per halaman dan diproses sebagai generator langsung ke file sementara;
+        # post yang sudah melewati watermark dibuang (dan paging berhenti bila hasil urut terbaru)
+        raw_results = iter_new_apify_items(
+            iter_apify_run_results(job.run_id, max_items=job.max_results or None),
+            job.platform, job.since_item_at, job.since_item_id, newest
+        )
+        if archive is not None:
+            raw_results = iter_archived_items(raw_results, archive)
+        
+        # Metadata dibaca endpoint status job; baris dibaca process_scraping_column_mapping
+        items_count = write_scraping_temp_file(temp_id, {
+            'run_id': job.run_id,
+            'platform': job.platform,
+            'keywords': job.keyword,
+            'start_date': job.date_from,
+            'end_date': job.date_to,
+            'dataset_id': job.dataset_id,
+            'dataset_name': job.dataset_name
+        }, iter_processed_apify_results(raw_results, job.platform, job.max_results))
+        if not items_count and job.since_item_at is None and not job.scheduled_scrape_id:
+            raise Exception("Tidak ada data yang berhasil di-scrape. Coba dengan keyword yang berbeda atau periksa konfigurasi Apify.")
+    except Exception as e:
+        remove_scraping_temp_file(temp_id)
+        return _fail_scraping_job(job, get_apify_error_message(str(e), job.platform), temp_id=None)
+    finally:
+        if archive is not None:
+            archive.close()
+    
+    if not items_count:
+        # Tidak ada post baru sejak watermark: job selesai tanpa data untuk di-mapping
+        remove_scraping_temp_file(temp_id)
+        job.temp_id = None
+    elif archive is not None:
+        job.raw_items = raw_items_buffer.getvalue()
+        job.raw_items_size = len(job.raw_items)
+    job.newest_item_id = newest.get('item_id')
+    job.newest_item_at = newest.get('item_at')
+    job.covered_from = get_run_covered_from(job, newest)
+    job.items_count = items_count
+    job.timings = {
+        'apify_run': _elapsed(job.started_at or job.created_at, fetch_started_at),
+        'fetch': _elapsed(fetch_started_at)
+    }
+    
+    if job.scheduled_scrape_id:
+        return _process_scheduled_run(job)
+    
+    job.status = 'completed'
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
+    logger.info(f"Scraping job {job.id}: {job.items_count} data dari run {job.run_id} siap untuk mapping")
+    return job.to_dict()
+
+def _process_scheduled_run(job):
+    """
+    Lanjutan job scraping terjadwal: hasil langsung disimpan ke dataset tujuan dengan mapping
+    standar (content/username/url), watermark dimajukan, lalu opsional dibersihkan dan
+    diklasifikasi. Waktu tiap tahap dan jumlah data dicatat di job.
+    """
+    from models import db, Dataset, RawData, RawDataScraper
+    from utils import generate_activity_log
+    from scheduler import cleanup_scheduler
+    
+    definition = job.scheduled_scrape
+    temp_id = job.temp_id
+    timings = dict(job.timings or {})
+    try:
+        dataset = db.session.get(Dataset, job.dataset_id) if job.dataset_id else None
+        if dataset is None:
+            raise Exception('Dataset tujuan scraping terjadwal tidak ditemukan')
+        
+        stage_started_at = datetime.utcnow()
+        rows = iter_scraping_temp_rows(temp_id) if job.items_count else []
+        job.records_added = save_scraped_rows(
+            rows, dataset, job.platform, job.keyword, stage_started_at.date(), job.created_by,
+            'content', 'username', 'url'
+        )
+        dataset.total_records = RawData.query.filter_by(dataset_id=dataset.id).count() + RawDataScraper.query.filter_by(dataset_id=dataset.id).count()
+        timings['save'] = _elapsed(stage_started_at)
+        job.timings = dict(timings)
+        db.session.commit()
+        remove_scraping_temp_file(temp_id)
+        advance_scraping_watermark(job)
+        
+        if definition is not None and (definition.auto_clean or definition.auto_classify) and job.records_added:
+            stage_started_at = datetime.utcnow()
+            job.cleaned_count = clean_scraped_dataset_rows(dataset.id, job.created_by)
+            timings['clean'] = _elapsed(stage_started_at)
+            job.timings = dict(timings)
+            db.session.commit()
+            
+            if definition.auto_classify:
+                stage_started_at = datetime.utcnow()
+                job.classified_count = classify_scraped_dataset_rows(dataset.id, job.created_by)
+                timings['classify'] = _elapsed(stage_started_at)
+                job.timings = dict(timings)
+                db.session.commit()
+    except Exception as e:
+        remove_scraping_temp_file(temp_id)
+        return _fail_scraping_job(job, f'Gagal memproses hasil scraping terjadwal: {str(e)}', timings=timings)
+    
+    job.status = 'completed'
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
+    logger.info(f"Scraping terjadwal {job.scheduled_scrape_id} (job {job.id}): {job.items_count} data diambil, {job.records_added} disimpan, timings {timings}")
+    
+    if job.records_added:
+        cleanup_scheduler.update_statistics()
+        generate_activity_log(
+            action='scraping',
+            description=f'Scraping terjadwal menyimpan {job.records_added} data dari {job.platform}',
+            user_id=job.created_by,
+            details={
+                'platform': job.platform,
+                'records_added': job.records_added,
+                'run_id': job.run_id,
+                'keyword': job.keyword,
+                'scheduled_scrape_id': job.scheduled_scrape_id
+            },
+            icon='fa-search',
+            color='info'
+        )
+    return job.to_dict()
+
+def _elapsed(started_at, finished_at=None):
+    return round(((finished_at or datetime.utcnow()) - started_at).total_seconds(), 3)
+
+def _schedule_next_poll(job):
+    from flask import current_app
+    
+    submit_scraping_job(job, delay=current_app.config.get('SCRAPING_POLL_INTERVAL', DEFAULT_POLL_INTERVAL),
+                        poll_count=job.poll_count or 0)
+
+def _fail_scraping_job(job, error_message, **fields):
+    from models import db
+    
+    db.session.rollback()
+    for name, value in fields.items():
+        setattr(job, name, value)
+    job.status = 'failed'
+    job.error_message = error_message
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
+    logger.error(f"Scraping job {job.id} gagal: {error_message}")
+    return job.to_dict()
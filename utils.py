@@ -8,11 +8,13 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import pickle
+import hashlib
+import itertools
 import os
-import time
 import pytz
 from flask import flash, redirect, url_for
 from flask_login import current_user
+from apify_api import apify_api
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -84,105 +86,205 @@ def active_user_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# Pola pembersihan teks dikompilasi sekali di level modul.
+# Kelas karakter URL setara dengan pola lama
+# http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+
+# karena rentang $-_ sudah mencakup angka, huruf besar, @ . & + * ( ) , dan %XX.
+_URL_PATTERN = re.compile(r'https?://[!$-_a-z]+')
+_EMOJI_CHARS = (u"\U0001F600-\U0001F64F"  # emoticons
+                u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+                u"\U0001F680-\U0001F6FF"  # transport & map symbols
+                u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+                u"\U00002702-\U000027B0"
+                u"\U000024C2-\U0001F251")
+# Mention, hashtag dan emoji dihapus dalam satu pass (kelas karakternya tidak beririsan)
+_TAG_OR_EMOJI_PATTERN = re.compile(r'[@#][A-Za-z0-9_]+|[' + _EMOJI_CHARS + ']+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+# Karakter yang pasti diubah oleh clean_text; teks tanpa karakter ini (dan sudah lowercase) sudah bersih
+_NOT_CLEAN_PATTERN = re.compile('[' + re.escape(string.punctuation) + _EMOJI_CHARS + ']')
+
 def clean_text(text):
     """
     Membersihkan teks dari karakter yang tidak diinginkan
     """
-    if not text or pd.isna(text):
+    if isinstance(text, str):
+        if not text:
+            return ""
+    elif not text or pd.isna(text):
         return ""
-    
-    # Convert to string
-    text = str(text)
+    else:
+        # Convert to string
+        text = str(text)
     
     # Remove URLs
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    if 'http' in text:
+        text = _URL_PATTERN.sub('', text)
     
-    # Remove mentions (@username)
-    text = re.sub(r'@[A-Za-z0-9_]+', '', text)
-    
-    # Remove hashtags (#hashtag)
-    text = re.sub(r'#[A-Za-z0-9_]+', '', text)
-    
-    # Remove emojis
-    emoji_pattern = re.compile("["
-                               u"\U0001F600-\U0001F64F"  # emoticons
-                               u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                               u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                               u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                               u"\U00002702-\U000027B0"
-                               u"\U000024C2-\U0001F251"
-                               "]+", flags=re.UNICODE)
-    text = emoji_pattern.sub(r'', text)
+    # Remove mentions (@username), hashtags (#hashtag) and emojis
+    text = _TAG_OR_EMOJI_PATTERN.sub('', text)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove punctuation
-    text = text.translate(str.maketrans('', '', string.punctuation))
+    text = _WHITESPACE_PATTERN.sub(' ', text)
     
-    # Convert to lowercase
-    text = text.lower().strip()
-    
-    return text
+    # Remove punctuation, convert to lowercase
+    return text.translate(_PUNCTUATION_TABLE).lower().strip()
+
+def clean_texts(texts):
+    """
+    Membersihkan sekumpulan teks, hasil sama dengan clean_text per item
+    """
+    return [clean_text(text) for text in texts]
+
+def is_clean_text(text):
+    """
+    Cek apakah teks sudah berupa keluaran clean_text (tanpa tanda baca/emoji dan sudah lowercase),
+    sehingga tokenisasi bisa melewati pembersihan ulang
+    """
+    return isinstance(text, str) and text == text.lower() and not _NOT_CLEAN_PATTERN.search(text)
 
 def check_content_duplicate(content, dataset_id=None):
     """
     Memeriksa apakah konten sudah ada dalam database untuk mencegah duplikasi
     """
     try:
-        from models import RawData, RawDataScraper
-        
         if not content or not str(content).strip():
             return False
         
-        # Normalisasi konten untuk perbandingan yang lebih akurat
-        normalized_content = str(content).strip()
-        
-        # Cek duplikasi di RawData berdasarkan konten yang sama persis
-        if dataset_id:
-            existing_upload = RawData.query.filter_by(
-                dataset_id=dataset_id,
-                content=normalized_content
-            ).first()
-            existing_scraper = RawDataScraper.query.filter_by(
-                dataset_id=dataset_id,
-                content=normalized_content
-            ).first()
-        else:
-            existing_upload = RawData.query.filter_by(
-                content=normalized_content
-            ).first()
-            existing_scraper = RawDataScraper.query.filter_by(
-                content=normalized_content
-            ).first()
-        
-        return existing_upload is not None or existing_scraper is not None
+        return check_content_duplicates([content], dataset_id=dataset_id)[0]
         
     except Exception as e:
         return False
 
-def check_cleaned_content_duplicate(cleaned_content):
+def get_existing_content_hashes(model, content_hashes, chunk_size=1000, **filters):
     """
-    Memeriksa apakah konten yang sudah dibersihkan sudah ada dalam database
-    untuk mencegah duplikasi di tabel clean data
+    Ambil content_hash yang sudah ada di tabel raw (RawData/RawDataScraper) dengan satu
+    query WHERE content_hash IN (...) per chunk, memakai index (dataset_id, content_hash).
+    filters diteruskan ke filter_by (mis. dataset_id, platform, keyword).
     """
-    try:
-        from models import CleanDataUpload, CleanDataScraper
+    content_hashes = list({content_hash for content_hash in content_hashes if content_hash})
+    existing = set()
+    
+    for start in range(0, len(content_hashes), chunk_size):
+        chunk = content_hashes[start:start + chunk_size]
+        rows = model.query.with_entities(model.content_hash).filter_by(**filters).filter(
+            model.content_hash.in_(chunk)
+        ).distinct()
+        existing.update(row.content_hash for row in rows)
+    
+    return existing
+
+def check_content_duplicates(contents, dataset_id=None, models=None, chunk_size=1000, **filters):
+    """
+    Versi batch check_content_duplicate: return list boolean sejajar dengan contents.
+    Sebuah konten dianggap duplikat jika sudah ada di database (sesuai filter) atau
+    sudah muncul lebih awal di batch yang sama. Konten kosong tidak pernah duplikat.
+    """
+    from models import RawData, RawDataScraper, compute_content_hash
+    
+    if models is None:
+        models = (RawData, RawDataScraper)
+    if dataset_id:
+        filters['dataset_id'] = dataset_id
+    
+    content_hashes = [compute_content_hash(content) if content else None for content in contents]
+    
+    existing = set()
+    for model in models:
+        existing |= get_existing_content_hashes(model, content_hashes, chunk_size, **filters)
+    
+    duplicates = []
+    for content_hash in content_hashes:
+        if content_hash is None:
+            duplicates.append(False)
+            continue
+        duplicates.append(content_hash in existing)
+        existing.add(content_hash)
+    
+    return duplicates
+
+class CleanedContentDeduper:
+    """
+    Cek duplikasi cleaned_content untuk satu proses pembersihan massal.
+    
+    Hash konten yang sudah ada di clean_data_upload/clean_data_scraper (global atau
+    per dataset) diambil lewat index cleaned_content_hash dengan query IN per chunk
+    (prefetch), lalu is_duplicate cukup memeriksa set di memori. Hash baris yang lolos
+    ikut dicatat sehingga duplikat di dalam batch yang sama juga terdeteksi.
+    
+    Set dibatasi max_hashes: jika prefetch berikutnya melewati batas, semua hash dibuang.
+    Baris yang sudah diterima harus sudah ditambahkan ke session, sehingga autoflush
+    sebelum query IN membuatnya ikut ditemukan lagi. Memori tetap terbatas untuk
+    tabel berjuta-juta baris.
+    """
+    
+    MAX_HASHES = 100000
+    
+    def __init__(self, dataset_id=None, chunk_size=1000, max_hashes=None):
+        self.dataset_id = dataset_id
+        self.chunk_size = chunk_size
+        self.max_hashes = max_hashes or self.MAX_HASHES
+        self._checked = set()
+        self._existing = set()
+    
+    def prefetch(self, cleaned_contents):
+        """Ambil hash yang sudah ada di database untuk cleaned_contents yang belum dicek"""
+        from models import CleanDataUpload, CleanDataScraper, RawDataScraper, compute_content_hash
+        
+        content_hashes = {compute_content_hash(cleaned_content) for cleaned_content in cleaned_contents}
+        content_hashes = list(content_hashes - self._checked - {None})
+        if len(self._checked) + len(content_hashes) > self.max_hashes:
+            # Buang hash batch sebelumnya; yang masih relevan diambil ulang oleh query di bawah
+            self._checked.clear()
+            self._existing.clear()
+        
+        for start in range(0, len(content_hashes), self.chunk_size):
+            chunk = content_hashes[start:start + self.chunk_size]
+            
+            upload_query = CleanDataUpload.query.with_entities(CleanDataUpload.cleaned_content_hash).filter(
+                CleanDataUpload.cleaned_content_hash.in_(chunk)
+            )
+            scraper_query = CleanDataScraper.query.with_entities(CleanDataScraper.cleaned_content_hash).filter(
+                CleanDataScraper.cleaned_content_hash.in_(chunk)
+            )
+            if self.dataset_id is not None:
+                upload_query = upload_query.filter(CleanDataUpload.dataset_id == self.dataset_id)
+                scraper_query = scraper_query.join(
+                    RawDataScraper, CleanDataScraper.raw_data_scraper_id == RawDataScraper.id
+                ).filter(RawDataScraper.dataset_id == self.dataset_id)
+            
+            for query in (upload_query, scraper_query):
+                self._existing.update(row.cleaned_content_hash for row in query.distinct())
         
-        if not cleaned_content:
+        self._checked.update(content_hashes)
+    
+    def is_duplicate(self, cleaned_content):
+        """
+        True jika konten sudah ada di database atau sudah diterima sebelumnya di batch ini.
+        Konten yang belum di-prefetch dicek dengan satu query.
+        """
+        from models import compute_content_hash
+        
+        content_hash = compute_content_hash(cleaned_content)
+        if content_hash is None:
             return False
         
-        # Cek duplikasi di CleanDataUpload
-        existing_clean_upload = CleanDataUpload.query.filter(
-            CleanDataUpload.cleaned_content == cleaned_content
-        ).first()
+        if content_hash not in self._checked:
+            self.prefetch([cleaned_content])
         
-        # Cek duplikasi di CleanDataScraper
-        existing_clean_scraper = CleanDataScraper.query.filter(
-            CleanDataScraper.cleaned_content == cleaned_content
-        ).first()
+        if content_hash in self._existing:
+            return True
         
-        return existing_clean_upload is not None or existing_clean_scraper is not None
+        self._existing.add(content_hash)
+        return False
+
+def check_cleaned_content_duplicate(cleaned_content):
+    """
+    Memeriksa apakah konten yang sudah dibersihkan sudah ada dalam database
+    untuk mencegah duplikasi di tabel clean data
+    """
+    try:
+        return CleanedContentDeduper().is_duplicate(cleaned_content)
         
     except Exception as e:
         return False
@@ -193,35 +295,17 @@ def check_cleaned_content_duplicate_by_dataset(cleaned_content, dataset_id):
     untuk dataset tertentu untuk mencegah duplikasi di tabel clean data
     """
     try:
-        from models import CleanDataUpload, CleanDataScraper, RawDataScraper
-        
-        if not cleaned_content:
-            return False
-        
-        # Cek duplikasi di CleanDataUpload untuk dataset tertentu
-        existing_clean_upload = CleanDataUpload.query.filter_by(
-            dataset_id=dataset_id,
-            cleaned_content=cleaned_content
-        ).first()
-        
-        # Cek duplikasi di CleanDataScraper untuk dataset tertentu
-        existing_clean_scraper = CleanDataScraper.query.join(
-            RawDataScraper, CleanDataScraper.raw_data_scraper_id == RawDataScraper.id
-        ).filter(
-            RawDataScraper.dataset_id == dataset_id,
-            CleanDataScraper.cleaned_content == cleaned_content
-        ).first()
-        
-        return existing_clean_upload is not None or existing_clean_scraper is not None
+        return CleanedContentDeduper(dataset_id=dataset_id).is_duplicate(cleaned_content)
         
     except Exception as e:
         return False
 
 def preprocess_for_word2vec(text):
     """
-    Preprocessing khusus untuk Word2Vec
+    Preprocessing khusus untuk Word2Vec. Teks yang sudah bersih (mis. cleaned_content)
+    tidak dibersihkan ulang.
     """
-    cleaned_text = clean_text(text)
+    cleaned_text = text if is_clean_text(text) else clean_text(text)
     
     # Split into words
     words = cleaned_text.split()
@@ -238,27 +322,112 @@ def vectorize_text(text, word2vec_model, vector_size=100):
     if not text or not word2vec_model:
         return np.zeros(vector_size)
     
-    words = preprocess_for_word2vec(text)
+    return vectorize_texts([text], word2vec_model, vector_size)[0]
+
+def vectorize_texts(texts, word2vec_model, vector_size=100):
+    """
+    Mengkonversi sekumpulan teks menjadi matriks vektor [N, vector_size]
+    menggunakan Word2Vec (model penuh, KeyedVectors, atau CompactKeyedVectors). Token dipetakan ke indeks baris melalui
+    key_to_index sekali jalan, lalu rata-rata per dokumen dihitung dengan
+    np.add.reduceat atas satu blok embedding yang dikumpulkan.
+    """
+    texts = list(texts)
     
-    if not words:
-        return np.zeros(vector_size)
+    if not texts or not word2vec_model:
+        return np.zeros((len(texts), vector_size))
     
-    # Get word vectors
-    word_vectors = []
-    for word in words:
-        try:
-            if word in word2vec_model.wv:
-                word_vectors.append(word2vec_model.wv[word])
-        except KeyError:
+    # Word2Vec menyimpan vektor di .wv, KeyedVectors langsung di objeknya
+    keyed_vectors = getattr(word2vec_model, 'wv', word2vec_model)
+    key_to_index = keyed_vectors.key_to_index
+    vector_size = getattr(keyed_vectors, 'vector_size', vector_size)
+    
+    # Kumpulkan indeks token semua dokumen dalam satu array datar
+    token_indices = []
+    doc_lengths = np.zeros(len(texts), dtype=np.int64)
+    for i, text in enumerate(texts):
+        if not text:
             continue
+        indices = [key_to_index[word] for word in preprocess_for_word2vec(text) if word in key_to_index]
+        doc_lengths[i] = len(indices)
+        token_indices.extend(indices)
     
-    if not word_vectors:
-        return np.zeros(vector_size)
+    doc_vectors = np.zeros((len(texts), vector_size), dtype=np.float32)
+    
+    if not token_indices:
+        return doc_vectors
+    
+    # Ambil semua embedding sekaligus lalu jumlahkan per segmen dokumen
+    token_indices = np.asarray(token_indices, dtype=np.int64)
+    if isinstance(keyed_vectors, CompactKeyedVectors):
+        gathered = keyed_vectors.get_vectors(token_indices)
+    else:
+        gathered = keyed_vectors.vectors[token_indices]
+    has_words = doc_lengths > 0
+    offsets = np.concatenate(([0], np.cumsum(doc_lengths)[:-1]))[has_words]
+    sums = np.add.reduceat(gathered, offsets, axis=0)
+    doc_vectors[has_words] = sums / doc_lengths[has_words, None]
+    
+    return doc_vectors
+
+def get_document_vectors(items, word2vec_model, embedding_version, chunk_size=1000):
+    """
+    Ambil vektor dokumen [N, vector_size] untuk item (data_type, data_id, cleaned_content)
+    dari tabel document_vectors. Hanya baris yang belum ada atau basi (versi embedding
+    atau isi berubah) yang di-vectorize ulang lalu disimpan. Commit dilakukan oleh pemanggil.
+    """
+    from models import db, DocumentVector
+    
+    items = list(items)
+    texts = [content for _, _, content in items]
+    
+    if not items or not word2vec_model or not embedding_version:
+        return vectorize_texts(texts, word2vec_model)
+    
+    keyed_vectors = getattr(word2vec_model, 'wv', word2vec_model)
+    vector_size = keyed_vectors.vector_size
+    content_hashes = [hashlib.sha1((content or '').encode('utf-8')).hexdigest() for content in texts]
+    
+    # Ambil vektor tersimpan dengan satu query IN per chunk
+    stored = {}
+    for data_type in set(data_type for data_type, _, _ in items):
+        data_ids = list(set(data_id for item_type, data_id, _ in items if item_type == data_type))
+        for start in range(0, len(data_ids), chunk_size):
+            rows = DocumentVector.query.filter(
+                DocumentVector.data_type == data_type,
+                DocumentVector.data_id.in_(data_ids[start:start + chunk_size])
+            ).all()
+            for row in rows:
+                stored[(row.data_type, row.data_id)] = row
+    
+    doc_vectors = np.zeros((len(items), vector_size), dtype=np.float32)
+    missing = []
+    for i, (data_type, data_id, _) in enumerate(items):
+        row = stored.get((data_type, data_id))
+        if (row is not None and row.embedding_version == embedding_version
+                and row.content_hash == content_hashes[i]
+                and len(row.vector) == vector_size * 4):
+            doc_vectors[i] = np.frombuffer(row.vector, dtype=np.float32)
+        else:
+            missing.append(i)
     
-    # Average the word vectors
-    text_vector = np.mean(word_vectors, axis=0)
+    if not missing:
+        return doc_vectors
     
-    return text_vector
+    # Vectorize hanya baris yang belum ada atau basi, lalu simpan
+    fresh_vectors = vectorize_texts([texts[i] for i in missing], word2vec_model)
+    for i, vector in zip(missing, fresh_vectors):
+        doc_vectors[i] = vector
+        data_type, data_id, _ = items[i]
+        row = stored.get((data_type, data_id))
+        if row is None:
+            row = DocumentVector(data_type=data_type, data_id=data_id)
+            db.session.add(row)
+            stored[(data_type, data_id)] = row
+        row.embedding_version = embedding_version
+        row.content_hash = content_hashes[i]
+        row.vector = vector.astype(np.float32).tobytes()
+    
+    return doc_vectors
 
 def classify_content(text_vector, naive_bayes_model):
     """
@@ -296,9 +465,166 @@ def classify_content(text_vector, naive_bayes_model):
     except Exception as e:
         return 'non-radikal', [0.0, 1.0]  # [prob_radikal, prob_non_radikal]
 
+def classify_contents(text_vectors, naive_bayes_models):
+    """
+    Klasifikasi batch matriks vektor [N, vector_size] dengan semua model Naive Bayes.
+    Setiap model dijalankan sekali untuk seluruh matriks, label diturunkan dari
+    predict_proba. Mengembalikan dict {model_name: (predictions, probabilities)}
+    dengan predictions berupa list label dan probabilities berupa array [N, 2].
+    """
+    text_vectors = np.asarray(text_vectors)
+    if text_vectors.ndim == 1:
+        text_vectors = text_vectors.reshape(1, -1)
+    
+    n_rows = text_vectors.shape[0]
+    
+    # Vektor nol (tidak ada kata yang dikenal) selalu dianggap non-radikal
+    has_words = np.any(text_vectors, axis=1) if text_vectors.size else np.zeros(n_rows, dtype=bool)
+    
+    results = {}
+    for model_name, model in naive_bayes_models.items():
+        if model is None:
+            continue
+        
+        # Fallback sama dengan classify_content: [0.0, 1.0]
+        probabilities = np.tile(np.array([0.0, 1.0]), (n_rows, 1))
+        predictions = ['non-radikal'] * n_rows
+        
+        if has_words.any():
+            try:
+                model_probabilities = model.predict_proba(text_vectors[has_words])
+                
+                # Model returns 'Non-Radikal' or 'Radikal' directly
+                is_radikal = np.asarray(model.classes_).astype(str)[model_probabilities.argmax(axis=1)] == 'Radikal'
+                
+                probabilities[has_words] = model_probabilities
+                for row_index, radikal in zip(np.flatnonzero(has_words), is_radikal):
+                    if radikal:
+                        predictions[row_index] = 'radikal'
+            except Exception as e:
+                pass
+        
+        results[model_name] = (predictions, probabilities)
+    
+    return results
+
+def export_word2vec_keyed_vectors(model_path, keyed_vectors_path):
+    """
+    Ekspor KeyedVectors dari model Word2Vec penuh ke file .kv dengan matriks
+    vektor disimpan terpisah (.npy) agar bisa dibuka dengan mmap
+    """
+    from gensim.models import Word2Vec
+    
+    model = Word2Vec.load(model_path)
+    
+    # Tulis ke nama sementara lalu rename, agar worker lain tidak membaca file setengah jadi
+    tmp_path = f"{keyed_vectors_path}.tmp-{os.getpid()}"
+    model.wv.save(tmp_path, separately=['vectors'])
+    os.replace(f"{tmp_path}.vectors.npy", f"{keyed_vectors_path}.vectors.npy")
+    os.replace(tmp_path, keyed_vectors_path)
+    
+    return keyed_vectors_path
+
+class CompactKeyedVectors:
+    """
+    Embedding ringkas khusus inferensi: indeks vocabulary + matriks float16
+    atau int8 dengan skala per baris, dibuka langsung dari file .npy (mmap)
+    """
+    def __init__(self, index_to_key, vectors, scales=None):
+        self.index_to_key = index_to_key
+        self.key_to_index = {key: index for index, key in enumerate(index_to_key)}
+        self.vectors = vectors
+        self.scales = scales
+        self.vector_size = vectors.shape[1]
+    
+    def __len__(self):
+        return len(self.index_to_key)
+    
+    def __contains__(self, key):
+        return key in self.key_to_index
+    
+    def __getitem__(self, key):
+        return self.get_vectors(np.array([self.key_to_index[key]]))[0]
+    
+    def get_vectors(self, indices):
+        """Ambil baris embedding sebagai float32 (dequantize jika int8)"""
+        rows = self.vectors[indices].astype(np.float32)
+        if self.scales is not None:
+            rows *= self.scales[indices, None]
+        return rows
+
+def export_compact_embeddings(model_path, output_dir, quantization='float16'):
+    """
+    Ekspor model Word2Vec ke format ringkas untuk inferensi:
+    vocab.json, vectors.npy (float16/int8), scales.npy (hanya int8) dan meta.json
+    """
+    if quantization not in ('float16', 'int8'):
+        raise ValueError(f"Quantization tidak didukung: {quantization}")
+    
+    from gensim.models import KeyedVectors, Word2Vec
+    
+    # Terima model Word2Vec penuh maupun KeyedVectors hasil ekspor
+    try:
+        keyed_vectors = Word2Vec.load(model_path).wv
+    except Exception:
+        keyed_vectors = KeyedVectors.load(model_path)
+    
+    vectors = np.asarray(keyed_vectors.vectors, dtype=np.float32)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    if quantization == 'int8':
+        # Skala per baris agar nilai absolut terbesar dipetakan ke 127
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+        np.save(os.path.join(output_dir, 'scales.npy'), scales.astype(np.float32))
+    else:
+        quantized = vectors.astype(np.float16)
+        scales_path = os.path.join(output_dir, 'scales.npy')
+        if os.path.exists(scales_path):
+            os.remove(scales_path)
+    
+    np.save(os.path.join(output_dir, 'vectors.npy'), quantized)
+    
+    with open(os.path.join(output_dir, 'vocab.json'), 'w', encoding='utf-8') as f:
+        json.dump(list(keyed_vectors.index_to_key), f, ensure_ascii=False)
+    
+    meta = {
+        'source': os.path.basename(model_path),
+        'quantization': quantization,
+        'vocab_size': len(keyed_vectors.index_to_key),
+        'vector_size': int(vectors.shape[1]),
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    with open(os.path.join(output_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    
+    return meta
+
+def load_compact_embeddings(compact_dir, mmap=True):
+    """
+    Load embedding ringkas hasil export_compact_embeddings
+    """
+    with open(os.path.join(compact_dir, 'vocab.json'), 'r', encoding='utf-8') as f:
+        index_to_key = json.load(f)
+    
+    mmap_mode = 'r' if mmap else None
+    vectors = np.load(os.path.join(compact_dir, 'vectors.npy'), mmap_mode=mmap_mode)
+    
+    scales = None
+    scales_path = os.path.join(compact_dir, 'scales.npy')
+    if vectors.dtype == np.int8 and os.path.exists(scales_path):
+        scales = np.load(scales_path)
+    
+    return CompactKeyedVectors(index_to_key, vectors, scales)
+
 def load_word2vec_model():
     """
     Load Word2Vec model from configured path
+    
+    Dengan WORD2VEC_MMAP aktif, KeyedVectors diekspor sekali ke
+    WORD2VEC_KEYED_VECTORS_PATH lalu dibuka dengan mmap='r' sehingga
+    seluruh worker berbagi halaman embedding lewat page cache OS.
     """
     if not GENSIM_AVAILABLE:
         return None
@@ -310,11 +636,30 @@ def load_word2vec_model():
         # Get model path from config
         model_path = current_app.config.get('WORD2VEC_MODEL_PATH')
         
+        # Format ringkas (float16/int8) untuk deployment khusus inferensi
+        compact_path = current_app.config.get('WORD2VEC_COMPACT_PATH')
+        if compact_path and os.path.exists(os.path.join(compact_path, 'vectors.npy')):
+            return load_compact_embeddings(compact_path)
+        
         if not model_path:
             return None
             
         if not os.path.exists(model_path):
             return None
+        
+        if current_app.config.get('WORD2VEC_MMAP'):
+            keyed_vectors_path = current_app.config.get('WORD2VEC_KEYED_VECTORS_PATH') or f"{os.path.splitext(model_path)[0]}.kv"
+            try:
+                # Ekspor ulang jika belum ada atau model sumber lebih baru
+                if (not os.path.exists(keyed_vectors_path)
+                        or os.path.getmtime(keyed_vectors_path) < os.path.getmtime(model_path)):
+                    export_word2vec_keyed_vectors(model_path, keyed_vectors_path)
+                
+                from gensim.models import KeyedVectors
+                return KeyedVectors.load(keyed_vectors_path, mmap='r')
+            except Exception as e:
+                # Fallback ke load penuh jika ekspor/mmap gagal (mis. folder read-only)
+                pass
             
         from gensim.models import Word2Vec
         model = Word2Vec.load(model_path)
@@ -323,43 +668,131 @@ def load_word2vec_model():
     except Exception as e:
         return None
 
-def load_naive_bayes_models():
-    """Load all three Naive Bayes models"""
-    models = {}
+def get_model_file_version(source_path, name=None):
+    """
+    Versi file model berdasarkan nama, ukuran dan waktu modifikasi.
+    Berubah setiap kali file model diganti.
+    """
+    if not source_path or not os.path.exists(source_path):
+        return None
+    
+    name = name or os.path.basename(source_path)
+    stat = os.stat(source_path)
+    fingerprint = hashlib.sha1(f"{name}:{stat.st_size}:{int(stat.st_mtime)}".encode('utf-8')).hexdigest()[:12]
+    return f"{name[:50]}-{fingerprint}"
+
+def get_word2vec_model_version():
+    """
+    Versi model Word2Vec aktif (format ringkas jika dikonfigurasi, selain itu file .model)
+    """
     try:
         from flask import current_app
         
-        # Get model paths from config
-        model_paths = {
-            'model1': current_app.config.get('NAIVE_BAYES_MODEL1_PATH'),
-            'model2': current_app.config.get('NAIVE_BAYES_MODEL2_PATH'),
-            'model3': current_app.config.get('NAIVE_BAYES_MODEL3_PATH')
-        }
+        compact_path = current_app.config.get('WORD2VEC_COMPACT_PATH')
+        if compact_path and os.path.exists(os.path.join(compact_path, 'vectors.npy')):
+            return get_model_file_version(os.path.join(compact_path, 'vectors.npy'),
+                                          os.path.basename(os.path.normpath(compact_path)))
+        
+        return get_model_file_version(current_app.config.get('WORD2VEC_MODEL_PATH'))
+        
+    except Exception as e:
+        return None
+
+def get_naive_bayes_model_versions():
+    """
+    Versi ketiga model Naive Bayes, {model_name: version}
+    """
+    try:
+        from flask import current_app
         
+        return {
+            model_name: get_model_file_version(current_app.config.get(f'NAIVE_BAYES_{model_name.upper()}_PATH'))
+            for model_name in ('model1', 'model2', 'model3')
+        }
+    
+    except Exception as e:
+        return {}
+
+def get_naive_bayes_model_paths():
+    """Path ketiga model Naive Bayes dari config"""
+    from flask import current_app
+    
+    return {
+        'model1': current_app.config.get('NAIVE_BAYES_MODEL1_PATH'),
+        'model2': current_app.config.get('NAIVE_BAYES_MODEL2_PATH'),
+        'model3': current_app.config.get('NAIVE_BAYES_MODEL3_PATH')
+    }
+
+def load_naive_bayes_model(model_path):
+    """Load satu model Naive Bayes, None jika file tidak ada atau gagal dibaca"""
+    if not model_path or not os.path.exists(model_path):
+        return None
+    try:
+        with open(model_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        return None
+
+def load_naive_bayes_models():
+    """Load all three Naive Bayes models"""
+    models = {}
+    try:
         # Load each model
-        for model_name, model_path in model_paths.items():
-            if model_path and os.path.exists(model_path):
-                try:
-                    with open(model_path, 'rb') as f:
-                        models[model_name] = pickle.load(f)
-                except Exception as e:
-                    pass
+        for model_name, model_path in get_naive_bayes_model_paths().items():
+            model = load_naive_bayes_model(model_path)
+            if model is not None:
+                models[model_name] = model
             
         return models
     except Exception as e:
         return {}
 
-# Function removed - replaced with scrape_with_apify for proper API integration
+# Function removed - replaced by background Apify scraping jobs (scraping_jobs.py)
 # def scrape_social_media(platform, keyword, scrape_date):
-#     This function has been deprecated in favor of scrape_with_apify
+#     This function has been deprecated in favor of the scraping jobs
 
-def generate_sample_data(platform, keyword):
+# Ornamen khas media sosial untuk sample data "noisy" (benchmark pembersihan teks)
+SAMPLE_NOISE_MENTIONS = ['@admin_info', '@berita_terkini', '@warga62', '@partner', '@official_id']
+SAMPLE_NOISE_HASHTAGS = ['#viral', '#trending', '#fyp', '#beritaterkini', '#indonesia']
+SAMPLE_NOISE_EMOJIS = ['😀', '😂', '🔥', '🙏', '😡', '🇮🇩', '✨', '👉', '💯', '😭']
+SAMPLE_NOISE_FILLERS = ['wkwk', 'bgt', 'gaes', 'yg', 'gak', 'udah', 'sih', 'dong', 'lho', 'bener']
+
+def add_social_media_noise(content, rng):
     """
-    Generate sample data untuk testing dan fallback dengan data yang lebih realistis
+    Tambahkan URL, mention, hashtag, emoji, kata slang dan tanda baca acak ke konten
+    """
+    parts = []
+    if rng.random() < 0.3:
+        parts.append(f"RT {rng.choice(SAMPLE_NOISE_MENTIONS)}:")
+    parts.append(content)
+    for _ in range(rng.randint(0, 3)):
+        parts.append(rng.choice(SAMPLE_NOISE_FILLERS))
+    if rng.random() < 0.5:
+        parts.append(rng.choice(SAMPLE_NOISE_MENTIONS))
+    for _ in range(rng.randint(0, 3)):
+        parts.append(rng.choice(SAMPLE_NOISE_HASHTAGS))
+    if rng.random() < 0.6:
+        parts.append(rng.choice(SAMPLE_NOISE_EMOJIS) * rng.randint(1, 3))
+    if rng.random() < 0.4:
+        parts.append(f"https://t.co/{rng.randint(10 ** 9, 10 ** 10 - 1):x}")
+    if rng.random() < 0.3:
+        parts.append(rng.choice(['!!!', '???', '...', '!?']))
+    
+    text = ' '.join(parts)
+    if rng.random() < 0.1:
+        text = text.upper()
+    return text
+
+def generate_sample_data(platform, keyword, num_posts=None, seed=None, noisy=False):
+    """
+    Generate sample data untuk testing dan fallback dengan data yang lebih realistis.
+    seed membuat hasil dapat direproduksi, noisy menambahkan URL/mention/hashtag/emoji ke konten.
     """
     import random
     from datetime import datetime, timedelta
     
+    rng = random.Random(seed) if seed is not None else random
+    
     # Template konten yang lebih beragam berdasarkan platform
     if platform.lower() == 'twitter':
         sample_contents = [
@@ -430,50 +863,55 @@ def generate_sample_data(platform, keyword):
         base_url = f'https://{platform}.com/post'
     
     sample_data = []
-    num_posts = random.randint(5, 12)  # Lebih banyak data sample
+    if num_posts is None:
+        num_posts = rng.randint(5, 12)  # Lebih banyak data sample
     
     for i in range(num_posts):
         # Generate random timestamp dalam 7 hari terakhir
-        days_ago = random.randint(0, 7)
-        hours_ago = random.randint(0, 23)
-        minutes_ago = random.randint(0, 59)
+        days_ago = rng.randint(0, 7)
+        hours_ago = rng.randint(0, 23)
+        minutes_ago = rng.randint(0, 59)
         
         post_time = datetime.now() - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
         
         # Generate engagement metrics yang realistis
         if platform.lower() == 'twitter':
             engagement = {
-                'retweets': random.randint(0, 500),
-                'likes': random.randint(0, 1000),
-                'replies': random.randint(0, 100),
-                'quotes': random.randint(0, 50)
+                'retweets': rng.randint(0, 500),
+                'likes': rng.randint(0, 1000),
+                'replies': rng.randint(0, 100),
+                'quotes': rng.randint(0, 50)
             }
         elif platform.lower() == 'facebook':
             engagement = {
-                'likes': random.randint(0, 200),
-                'comments': random.randint(0, 50),
-                'shares': random.randint(0, 30)
+                'likes': rng.randint(0, 200),
+                'comments': rng.randint(0, 50),
+                'shares': rng.randint(0, 30)
             }
         elif platform.lower() == 'instagram':
             engagement = {
-                'likes': random.randint(0, 800),
-                'comments': random.randint(0, 100),
-                'saves': random.randint(0, 50)
+                'likes': rng.randint(0, 800),
+                'comments': rng.randint(0, 100),
+                'saves': rng.randint(0, 50)
             }
         elif platform.lower() == 'tiktok':
             engagement = {
-                'likes': random.randint(0, 2000),
-                'comments': random.randint(0, 200),
-                'shares': random.randint(0, 100),
-                'views': random.randint(1000, 50000)
+                'likes': rng.randint(0, 2000),
+                'comments': rng.randint(0, 200),
+                'shares': rng.randint(0, 100),
+                'views': rng.randint(1000, 50000)
             }
         else:
-            engagement = {'likes': random.randint(0, 100)}
+            engagement = {'likes': rng.randint(0, 100)}
+        
+        content = rng.choice(sample_contents)
+        if noisy:
+            content = add_social_media_noise(content, rng)
         
         post_data = {
-            'username': random.choice(usernames),
-            'content': random.choice(sample_contents),
-            'url': f'{base_url}/{random.randint(100000, 999999)}',
+            'username': rng.choice(usernames),
+            'content': content,
+            'url': f'{base_url}/{rng.randint(100000, 999999)}',
             'created_at': post_time.strftime('%Y-%m-%d %H:%M:%S'),
             'platform': platform.lower(),
             **engagement  # Add engagement metrics
@@ -482,18 +920,18 @@ def generate_sample_data(platform, keyword):
         # Add platform-specific fields
         if platform.lower() == 'twitter':
             post_data.update({
-                'tweet_id': str(random.randint(1000000000000000000, 9999999999999999999)),
-                'language': random.choice(['id', 'en', 'ms']),
-                'source': random.choice(['Twitter Web App', 'Twitter for Android', 'Twitter for iPhone'])
+                'tweet_id': str(rng.randint(1000000000000000000, 9999999999999999999)),
+                'language': rng.choice(['id', 'en', 'ms']),
+                'source': rng.choice(['Twitter Web App', 'Twitter for Android', 'Twitter for iPhone'])
             })
         elif platform.lower() == 'instagram':
             post_data.update({
-                'post_type': random.choice(['photo', 'video', 'carousel', 'reel']),
+                'post_type': rng.choice(['photo', 'video', 'carousel', 'reel']),
                 'hashtags': [f'#{keyword}', '#trending', '#viral']
             })
         elif platform.lower() == 'tiktok':
             post_data.update({
-                'video_duration': random.randint(15, 180),
+                'video_duration': rng.randint(15, 180),
                 'music': f'Original sound - {post_data["username"]}'
             })
         
@@ -502,39 +940,42 @@ def generate_sample_data(platform, keyword):
     return sample_data
 
 # Removed obsolete platform-specific scraping functions
-# These functions have been replaced by the unified scrape_with_apify function
-# which handles all platforms through proper Apify API integration
+# These functions have been replaced by the background scraping jobs (scraping_jobs.py)
+# which handle all platforms through proper Apify API integration
 
 
 # Apify API Integration Functions
+APIFY_FINAL_STATUSES = ('SUCCEEDED', 'FAILED', 'ABORTED', 'TIMED-OUT')
+
+# Raw item fields holding the post ID / publish time per platform (first non-empty wins)
+APIFY_ITEM_ID_FIELDS = {
+    'twitter': ('id',),
+    'facebook': ('postId', 'id'),
+    'instagram': ('id', 'shortCode'),
+    'tiktok': ('id',)
+}
+APIFY_ITEM_TIME_FIELDS = {
+    'twitter': ('createdAt',),
+    'facebook': ('time', 'timestamp'),
+    'instagram': ('timestamp', 'taken_at_timestamp', 'date'),
+    'tiktok': ('createTimeISO', 'createTime', 'timestamp')
+}
+# Actors whose results are sorted newest first, so paging can stop at the first already-seen post
+APIFY_NEWEST_FIRST_PLATFORMS = ('twitter',)
+
+
 def get_apify_config():
     """
-    Get Apify configuration from environment variables with validation
-    """
-    config = {
-        'api_token': os.getenv('APIFY_API_TOKEN'),
-        'base_url': os.getenv('APIFY_BASE_URL', 'https://api.apify.com/v2'),
-        'actors': {
-            'twitter': os.getenv('APIFY_TWITTER_ACTOR', 'kaitoeasyapi/twitter-x-data-tweet-scraper-pay-per-result-cheapest'),
-            'facebook': os.getenv('APIFY_FACEBOOK_ACTOR', 'apify/facebook-scraper'),
-            'instagram': os.getenv('APIFY_INSTAGRAM_ACTOR', 'apify/instagram-scraper'),
-            'tiktok': os.getenv('APIFY_TIKTOK_ACTOR', 'clockworks/free-tiktok-scraper')
-        },
-        'timeout': int(os.getenv('APIFY_TIMEOUT', '30')),  # Default 30 seconds
-        'max_retries': int(os.getenv('APIFY_MAX_RETRIES', '3')),  # Default 3 retries
-        'retry_delay': int(os.getenv('APIFY_RETRY_DELAY', '5'))  # Default 5 seconds delay
-    }
-    
-    # Validate configuration
-    if not config['api_token']:
-        raise Exception("APIFY_API_TOKEN tidak dikonfigurasi. Silakan set environment variable APIFY_API_TOKEN.")
-    
-    return config
+    Get cached Apify configuration (read from environment variables and validated once)
+    """
+    return apify_api.config
 
 
-def start_apify_actor(platform, keyword, date_from=None, date_to=None, max_results=25, instagram_params=None):
+def start_apify_actor(platform, keyword, date_from=None, date_to=None, max_results=25, instagram_params=None, since_at=None):
     """
-    Start Apify actor for specific platform with improved error handling and retry mechanism
+    Start Apify actor for specific platform with improved error handling.
+    Timeouts, connection errors and rate limits are retried by the shared Apify client.
+    since_at (scraping watermark) narrows the query to posts newer than the last saved one.
     """
     config = get_apify_config()
     
@@ -543,78 +984,53 @@ def start_apify_actor(platform, keyword, date_from=None, date_to=None, max_resul
         raise Exception(f"Actor tidak dikonfigurasi untuk platform: {platform}. Silakan hubungi administrator untuk mengatur konfigurasi actor.")
     
     # Prepare input based on platform
-    input_data = prepare_actor_input(platform, keyword, date_from, date_to, max_results, instagram_params)
+    input_data = prepare_actor_input(platform, keyword, date_from, date_to, max_results, instagram_params, since_at)
     
-    # Start actor run with retry mechanism
-    url = f"{config['base_url']}/acts/{actor_id.replace('/', '~')}/runs"
-    headers = {
-        'Authorization': f"Bearer {config['api_token']}",
-        'Content-Type': 'application/json'
-    }
+    try:
+        response = apify_api.post(
+            f"acts/{actor_id.replace('/', '~')}/runs",
+            json=input_data,
+            headers={'Content-Type': 'application/json'}
+        )
+    except requests.exceptions.Timeout:
+        raise Exception(f"Gagal memulai scraping setelah {config['max_retries']} percobaan. Error terakhir: Timeout saat menghubungi Apify API")
+    except requests.exceptions.ConnectionError:
+        raise Exception(f"Gagal memulai scraping setelah {config['max_retries']} percobaan. Error terakhir: Gagal terhubung ke Apify API")
     
-    last_error = None
-    for attempt in range(config['max_retries']):
-        try:
-            response = requests.post(
-                url, 
-                json=input_data, 
-                headers=headers, 
-                timeout=config['timeout']
-            )
-            
-            if response.status_code == 201:
-                run_data = response.json()['data']
-                return run_data['id'], run_data['status']
-            else:
-                error_text = response.text
-                
-                # Handle specific Apify errors with user-friendly messages
-                if "actor-is-not-rented" in error_text.lower():
-                    raise Exception("Apify Actor tidak tersedia. Free trial telah berakhir dan memerlukan subscription berbayar. Silakan hubungi administrator untuk mengaktifkan akun Apify berbayar.")
-                elif "insufficient-credit" in error_text.lower() or "not enough credit" in error_text.lower():
-                    raise Exception("Kredit Apify tidak mencukupi. Silakan hubungi administrator untuk menambah kredit Apify.")
-                elif "invalid-token" in error_text.lower() or "unauthorized" in error_text.lower():
-                    raise Exception("Token Apify tidak valid atau tidak memiliki akses. Silakan hubungi administrator untuk memeriksa konfigurasi API.")
-                elif "actor-not-found" in error_text.lower():
-                    raise Exception(f"Actor Apify untuk platform {platform} tidak ditemukan. Silakan hubungi administrator untuk memeriksa konfigurasi actor.")
-                elif "rate limit" in error_text.lower():
-                    if attempt < config['max_retries'] - 1:
-                        time.sleep(config['retry_delay'] * (attempt + 1))  # Exponential backoff
-                        continue
-                    else:
-                        raise Exception("Rate limit Apify tercapai. Silakan tunggu beberapa menit sebelum mencoba lagi.")
-                else:
-                    raise Exception(f"Gagal memulai scraping (HTTP {response.status_code}): {error_text}. Silakan coba lagi atau hubungi administrator jika masalah berlanjut.")
-                    
-        except requests.exceptions.Timeout:
-            last_error = f"Timeout saat menghubungi Apify API (attempt {attempt + 1}/{config['max_retries']})"
-            if attempt < config['max_retries'] - 1:
-                time.sleep(config['retry_delay'])
-                continue
-        except requests.exceptions.ConnectionError:
-            last_error = f"Gagal terhubung ke Apify API (attempt {attempt + 1}/{config['max_retries']})"
-            if attempt < config['max_retries'] - 1:
-                time.sleep(config['retry_delay'])
-                continue
-        except Exception as e:
-            # Don't retry for configuration errors
-            if "tidak dikonfigurasi" in str(e) or "tidak tersedia" in str(e) or "tidak mencukupi" in str(e):
-                raise e
-            last_error = str(e)
-            if attempt < config['max_retries'] - 1:
-                time.sleep(config['retry_delay'])
-                continue
+    if response.status_code == 201:
+        run_data = response.json()['data']
+        return run_data['id'], run_data['status']
     
-    # If we get here, all retries failed
-    raise Exception(f"Gagal memulai scraping setelah {config['max_retries']} percobaan. Error terakhir: {last_error}")
+    error_text = response.text
+    
+    # Handle specific Apify errors with user-friendly messages
+    if "actor-is-not-rented" in error_text.lower():
+        raise Exception("Apify Actor tidak tersedia. Free trial telah berakhir dan memerlukan subscription berbayar. Silakan hubungi administrator untuk mengaktifkan akun Apify berbayar.")
+    elif "insufficient-credit" in error_text.lower() or "not enough credit" in error_text.lower():
+        raise Exception("Kredit Apify tidak mencukupi. Silakan hubungi administrator untuk menambah kredit Apify.")
+    elif "invalid-token" in error_text.lower() or "unauthorized" in error_text.lower():
+        raise Exception("Token Apify tidak valid atau tidak memiliki akses. Silakan hubungi administrator untuk memeriksa konfigurasi API.")
+    elif "actor-not-found" in error_text.lower():
+        raise Exception(f"Actor Apify untuk platform {platform} tidak ditemukan. Silakan hubungi administrator untuk memeriksa konfigurasi actor.")
+    elif response.status_code == 429 or "rate limit" in error_text.lower():
+        raise Exception("Rate limit Apify tercapai. Silakan tunggu beberapa menit sebelum mencoba lagi.")
+    else:
+        raise Exception(f"Gagal memulai scraping (HTTP {response.status_code}): {error_text}. Silakan coba lagi atau hubungi administrator jika masalah berlanjut.")
 
 
-def prepare_actor_input(platform, keyword, date_from=None, date_to=None, max_results=25, instagram_params=None):
+def prepare_actor_input(platform, keyword, date_from=None, date_to=None, max_results=25, instagram_params=None, since_at=None):
     """
     Prepare input data for different platform actors
     Sesuaikan parameter dengan kebutuhan masing-masing actor Apify
+    since_at: watermark (datetime UTC) - hanya minta post sejak tanggal tersebut
     """
     
+    if since_at is not None:
+        # Operator since:/onlyPostsNewerThan berbasis tanggal; sisa hari yang sama disaring iter_new_apify_items
+        since_date = since_at.strftime('%Y-%m-%d')
+        if not date_from or since_date > date_from:
+            date_from = since_date
+    
     if platform.lower() == 'twitter':
         # Format input untuk kaitoeasyapi/twitter-x-data-tweet-scraper-pay-per-result-cheapest
         # Berdasarkan dokumentasi resmi Apify, gunakan searchTerms dengan format yang benar
@@ -688,6 +1104,10 @@ def prepare_actor_input(platform, keyword, date_from=None, date_to=None, max_res
                 base_params["searchLimit"] = instagram_params.get('searchLimit', max_results)
             if instagram_params.get('resultsLimit'):
                 base_params["resultsLimit"] = instagram_params.get('resultsLimit', max_results)
+        
+        # Scraping inkremental: lewati post yang lebih lama dari watermark
+        if since_at is not None:
+            base_params["onlyPostsNewerThan"] = date_from
             
         return base_params
         
@@ -718,15 +1138,8 @@ def check_apify_run_status(run_id):
     """
     Check the status of an Apify actor run with improved error handling
     """
-    config = get_apify_config()
-    
-    url = f"{config['base_url']}/actor-runs/{run_id}"
-    headers = {
-        'Authorization': f"Bearer {config['api_token']}"
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=config['timeout'])
+        response = apify_api.get(f"actor-runs/{run_id}")
         
         if response.status_code == 200:
             return response.json()['data']
@@ -745,81 +1158,172 @@ def get_apify_run_results(run_id):
     """
     Get results from completed Apify actor run with improved error handling
     """
+    results = list(iter_apify_run_results(run_id))
+    if not results:
+        raise Exception("Tidak ada data yang berhasil di-scrape. Coba dengan keyword atau parameter yang berbeda.")
+    return results
+
+
+def iter_apify_run_results(run_id, max_items=None, page_size=None):
+    """
+    Stream items of a completed Apify run page by page using the dataset offset/limit API,
+    so only one page is held in memory at a time
+    """
     config = get_apify_config()
+    page_size = page_size or config['page_size']
+    offset = 0
     
-    url = f"{config['base_url']}/actor-runs/{run_id}/dataset/items"
-    headers = {
-        'Authorization': f"Bearer {config['api_token']}"
-    }
-    
-    try:
-        response = requests.get(url, headers=headers, timeout=config['timeout'] * 2)  # Longer timeout for results
+    while max_items is None or offset < max_items:
+        limit = page_size if max_items is None else min(page_size, max_items - offset)
+        try:
+            response = apify_api.get(
+                f"actor-runs/{run_id}/dataset/items",
+                params={'offset': offset, 'limit': limit},
+                timeout=config['timeout'] * 2  # Longer timeout for results
+            )
+        except requests.exceptions.Timeout:
+            raise Exception("Timeout saat mengambil hasil scraping. Data mungkin terlalu besar, silakan coba dengan max_results yang lebih kecil.")
+        except requests.exceptions.ConnectionError:
+            raise Exception("Gagal terhubung ke Apify API untuk mengambil hasil. Periksa koneksi internet Anda.")
         
-        if response.status_code == 200:
-            results = response.json()
-            if not results:
-                raise Exception("Tidak ada data yang berhasil di-scrape. Coba dengan keyword atau parameter yang berbeda.")
-            return results
-        elif response.status_code == 404:
+        if response.status_code == 404:
             raise Exception(f"Data hasil scraping untuk run ID {run_id} tidak ditemukan.")
-        else:
+        elif response.status_code != 200:
             raise Exception(f"Gagal mendapatkan hasil scraping (HTTP {response.status_code}): {response.text}")
-            
-    except requests.exceptions.Timeout:
-        raise Exception("Timeout saat mengambil hasil scraping. Data mungkin terlalu besar, silakan coba dengan max_results yang lebih kecil.")
-    except requests.exceptions.ConnectionError:
-        raise Exception("Gagal terhubung ke Apify API untuk mengambil hasil. Periksa koneksi internet Anda.")
+        
+        items = response.json()
+        yield from items
+        offset += len(items)
+        
+        # A short page is the last one; the total header (if sent) saves one extra request
+        total = response.headers.get('X-Apify-Pagination-Total')
+        if len(items) < limit or (total is not None and total.isdigit() and offset >= int(total)):
+            break
 
 
-def wait_for_apify_completion(run_id, max_wait_time=300, check_interval=10):
+def parse_apify_item_time(value):
     """
-    Wait for Apify actor run to complete with better progress tracking
+    Parse an Apify post timestamp (ISO 8601, Twitter createdAt format or unix seconds/milliseconds)
+    into a naive UTC datetime; None when the value is empty or unrecognized
     """
-    start_time = time.time()
-    last_status = None
+    if value in (None, ''):
+        return None
     
-    while time.time() - start_time < max_wait_time:
+    try:
+        if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+            timestamp = float(value)
+            if timestamp > 1e12:  # Milliseconds
+                timestamp /= 1000
+            return datetime.utcfromtimestamp(timestamp)
+        
+        value = str(value).strip()
         try:
-            status_data = check_apify_run_status(run_id)
-            status = status_data['status']
-            
-            # Log status changes
-            if status != last_status:
-                print(f"Apify run {run_id} status: {status}")
-                last_status = status
-            
-            if status == 'SUCCEEDED':
-                return True, 'completed'
-            elif status == 'FAILED':
-                # Get failure reason if available
-                failure_reason = status_data.get('statusMessage', 'Unknown error')
-                return False, f'failed: {failure_reason}'
-            elif status in ['ABORTED', 'TIMED-OUT']:
-                return False, status.lower()
-            
-            time.sleep(check_interval)
-            
-        except Exception as e:
-            # If we can't check status, wait a bit and try again
-            print(f"Error checking status: {e}")
-            time.sleep(check_interval)
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            parsed = datetime.strptime(value, '%a %b %d %H:%M:%S %z %Y')  # Twitter: "Wed Oct 18 10:00:00 +0000 2026"
+    except (ValueError, OverflowError, OSError):
+        return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(pytz.utc).replace(tzinfo=None)
+    return parsed
+
+
+def get_apify_item_watermark(item, platform):
+    """
+    Return (item_id, published_at) of a raw Apify item for scraping watermarks
+    """
+    platform = platform.lower()
+    
+    item_id = None
+    for field in APIFY_ITEM_ID_FIELDS.get(platform, ('id',)):
+        if item.get(field):
+            item_id = str(item[field])
+            break
+    
+    published_at = None
+    for field in APIFY_ITEM_TIME_FIELDS.get(platform, ('created_at', 'timestamp', 'time', 'createTime', 'date')):
+        published_at = parse_apify_item_time(item.get(field))
+        if published_at is not None:
+            break
+    
+    return item_id, published_at
+
+
+def iter_new_apify_items(raw_results, platform, since_at=None, since_item_id=None, newest=None):
+    """
+    Filter raw Apify items down to posts newer than the watermark (since_at/since_item_id).
+    For actors sorted newest first the generator stops at the first already-seen post, so the
+    paged dataset download (iter_apify_run_results) stops too. Items without a timestamp are kept.
+    If newest (dict) is given it is filled with the item_id/item_at of the newest post yielded,
+    oldest_at of the oldest one, fetched (raw items read) and reached_since (paging stopped at the
+    watermark) so the caller can tell which time range the run covered completely.
+    """
+    stop_at_seen = platform.lower() in APIFY_NEWEST_FIRST_PLATFORMS
+    if newest is None:
+        newest = {}
+    newest['fetched'] = 0
     
-    return False, 'timeout'
+    for item in raw_results:
+        newest['fetched'] += 1
+        item_id, published_at = get_apify_item_watermark(item, platform)
+        
+        seen = (since_item_id is not None and item_id == since_item_id) or (
+            since_at is not None and published_at is not None and published_at < since_at
+        )
+        if seen:
+            if stop_at_seen:
+                newest['reached_since'] = True
+                return
+            continue
+        
+        if published_at is not None:
+            if newest.get('item_at') is None or published_at > newest['item_at']:
+                newest['item_id'] = item_id
+                newest['item_at'] = published_at
+            if newest.get('oldest_at') is None or published_at < newest['oldest_at']:
+                newest['oldest_at'] = published_at
+        yield item
 
 
 def get_apify_run_progress(run_id):
     """
     Get detailed progress information from Apify actor run
-    Returns progress percentage, status, and other metrics
+    Returns progress percentage, status, and other metrics.
+    Cached per run_id for a few seconds so concurrent pollers share one upstream call;
+    finished runs do not change and are cached longer.
     """
     try:
-        config = get_apify_config()
-        
+        ttl = get_apify_config()['progress_cache_ttl']
+    except Exception:
+        return _fetch_apify_run_progress(run_id)  # Reports the configuration error
+    
+    def load():
+        progress_info = _fetch_apify_run_progress(run_id)
+        if progress_info['status'] == 'ERROR':
+            return progress_info, 0
+        if progress_info['status'] in APIFY_FINAL_STATUSES:
+            return progress_info, ttl * 60
+        return progress_info, None
+    
+    # Callers add their own fields, so hand out a copy of the cached dict
+    return dict(apify_api.get_cached(f'run-progress:{run_id}', load, ttl))
+
+
+def get_apify_dataset_info(run_id):
+    """
+    Get the metadata (itemCount etc.) of a run's default dataset without downloading its items
+    """
+    response = apify_api.get(f"actor-runs/{run_id}/dataset")
+    if response.status_code != 200:
+        raise Exception(f"Failed to get run dataset info: {response.text}")
+    return response.json()['data']
+
+
+def _fetch_apify_run_progress(run_id):
+    try:
         # Get run status
-        status_url = f"{config['base_url']}/actor-runs/{run_id}"
-        headers = {'Authorization': f"Bearer {config['api_token']}"}
-        
-        response = requests.get(status_url, headers=headers)
+        response = apify_api.get(f"actor-runs/{run_id}")
         
         if response.status_code == 200:
             run_data = response.json()['data']
@@ -840,6 +1344,14 @@ def get_apify_run_progress(run_id):
                 'finished_at': finished_at
             }
             
+            # Item count from the dataset metadata instead of downloading the items
+            item_count = None
+            if status in ('RUNNING', 'SUCCEEDED'):
+                try:
+                    item_count = get_apify_dataset_info(run_id).get('itemCount')
+                except Exception:
+                    pass
+            
             if status == 'RUNNING' and started_at:
                 # Calculate progress based on elapsed time
                 start_time = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
@@ -856,25 +1368,23 @@ def get_apify_run_progress(run_id):
                 progress_info.update({
                     'progress_percentage': progress_percentage,
                     'estimated_time_remaining': remaining_time,
-                    'elapsed_time': elapsed_seconds
+                    'elapsed_time': elapsed_seconds,
+                    'items_processed': item_count or 0
                 })
                 
             elif status == 'SUCCEEDED':
                 progress_info['progress_percentage'] = 100
                 
-                # Try to get actual results count
-                try:
-                    results_url = f"{config['base_url']}/actor-runs/{run_id}/dataset/items"
-                    results_response = requests.get(results_url, headers=headers)
-                    if results_response.status_code == 200:
-                        results = results_response.json()
-                        progress_info['items_processed'] = len(results)
-                        progress_info['total_items_estimate'] = len(results)
-                except:
-                    pass
+                if item_count is not None:
+                    progress_info['items_processed'] = item_count
+                    progress_info['total_items_estimate'] = item_count
                     
             elif status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
                 progress_info['progress_percentage'] = 0
+            
+            # Run statistics reported by Apify (e.g. runTimeSecs)
+            if run_data.get('stats', {}).get('runTimeSecs') is not None and 'elapsed_time' not in progress_info:
+                progress_info['elapsed_time'] = run_data['stats']['runTimeSecs']
                 
             return progress_info
             
@@ -890,74 +1400,162 @@ def get_apify_run_progress(run_id):
         }
 
 
-def scrape_with_apify(platform, keyword, date_from=None, date_to=None, max_results=25, instagram_params=None):
+def get_apify_failure_message(final_status):
     """
-    Main function to scrape data using Apify API with comprehensive error handling
+    User-friendly message for an Apify run that did not succeed
+    (final_status: 'failed: <reason>', 'timeout', 'aborted' or 'timed-out')
     """
-    try:
-        print(f"Starting Apify scraping for {platform} with keyword: {keyword}")
-        
-        # Start the actor
-        run_id, initial_status = start_apify_actor(platform, keyword, date_from, date_to, max_results, instagram_params)
-        print(f"Apify actor started with run ID: {run_id}, initial status: {initial_status}")
-        
-        # Wait for completion
-        print("Waiting for scraping to complete...")
-        success, final_status = wait_for_apify_completion(run_id)
-        print(f"Scraping completed with status: {final_status}")
-        
-        if success:
-            # Get results
-            print("Retrieving scraping results...")
-            raw_results = get_apify_run_results(run_id)
-            print(f"Retrieved {len(raw_results)} raw results")
-            
-            if raw_results and len(raw_results) > 0:
-                print("Processing results...")
-                # Process results based on platform
-                processed_results = process_apify_results(raw_results, platform, max_results)
-                print(f"Processed {len(processed_results)} results")
-                
-                return processed_results, run_id
-            else:
-                raise Exception("Tidak ada data yang berhasil di-scrape. Coba dengan keyword yang berbeda atau periksa konfigurasi Apify.")
-        else:
-            print(f"Scraping failed: {final_status}")
-            
-            # Provide specific error messages based on failure type
-            if "failed:" in final_status:
-                raise Exception(f"Scraping gagal: {final_status.replace('failed:', '').strip()}")
-            elif final_status == 'timeout':
-                raise Exception("Scraping timeout. Proses memakan waktu terlalu lama. Coba dengan max_results yang lebih kecil atau keyword yang lebih spesifik.")
-            elif final_status == 'aborted':
-                raise Exception("Scraping dibatalkan oleh sistem Apify. Silakan coba lagi.")
-            else:
-                raise Exception(f"Scraping gagal dengan status: {final_status}")
-            
-    except Exception as e:
-        print(f"Scraping error: {e}")
-        
-        # Enhanced error handling with specific Apify error messages
-        error_message = str(e)
-        
-        # Check for specific Apify errors and provide user-friendly messages
-        if "tidak dikonfigurasi" in error_message.lower():
-            raise Exception("Konfigurasi Apify belum lengkap. Silakan hubungi administrator untuk mengatur konfigurasi Apify.")
-        elif "actor-is-not-rented" in error_message.lower():
-            raise Exception("Apify Actor tidak tersedia. Free trial telah berakhir dan memerlukan subscription berbayar. Silakan hubungi administrator untuk mengaktifkan akun Apify berbayar.")
-        elif "insufficient-credit" in error_message.lower() or "not enough credit" in error_message.lower():
-            raise Exception("Kredit Apify tidak mencukupi. Silakan hubungi administrator untuk menambah kredit Apify.")
-        elif "invalid-token" in error_message.lower() or "unauthorized" in error_message.lower():
-            raise Exception("Token Apify tidak valid atau tidak memiliki akses. Silakan hubungi administrator untuk memeriksa konfigurasi API.")
-        elif "actor not configured" in error_message.lower():
-            raise Exception(f"Platform {platform} belum dikonfigurasi untuk scraping. Silakan hubungi administrator.")
-        elif "timeout" in error_message.lower():
-            raise Exception("Koneksi ke Apify API timeout. Periksa koneksi internet Anda atau coba lagi nanti.")
-        elif "connection" in error_message.lower():
-            raise Exception("Gagal terhubung ke Apify API. Periksa koneksi internet Anda.")
-        else:
-            # Provide more user-friendly error message
-            raise Exception(f"Terjadi kesalahan saat scraping: {error_message}")
+    if "failed:" in final_status:
+        return f"Scraping gagal: {final_status.replace('failed:', '').strip()}"
+    elif final_status == 'timeout':
+        return "Scraping timeout. Proses memakan waktu terlalu lama. Coba dengan max_results yang lebih kecil atau keyword yang lebih spesifik."
+    elif final_status == 'aborted':
+        return "Scraping dibatalkan oleh sistem Apify. Silakan coba lagi."
+    else:
+        return f"Scraping gagal dengan status: {final_status}"
+
+
+def get_apify_error_message(error_message, platform):
+    """
+    Map an Apify/scraping error to a user-friendly message
+    """
+    # Check for specific Apify errors and provide user-friendly messages
+    if "tidak dikonfigurasi" in error_message.lower():
+        return "Konfigurasi Apify belum lengkap. Silakan hubungi administrator untuk mengatur konfigurasi Apify."
+    elif "actor-is-not-rented" in error_message.lower():
+        return "Apify Actor tidak tersedia. Free trial telah berakhir dan memerlukan subscription berbayar. Silakan hubungi administrator untuk mengaktifkan akun Apify berbayar."
+    elif "insufficient-credit" in error_message.lower() or "not enough credit" in error_message.lower():
+        return "Kredit Apify tidak mencukupi. Silakan hubungi administrator untuk menambah kredit Apify."
+    elif "invalid-token" in error_message.lower() or "unauthorized" in error_message.lower():
+        return "Token Apify tidak valid atau tidak memiliki akses. Silakan hubungi administrator untuk memeriksa konfigurasi API."
+    elif "actor not configured" in error_message.lower():
+        return f"Platform {platform} belum dikonfigurasi untuk scraping. Silakan hubungi administrator."
+    elif "timeout" in error_message.lower():
+        return "Koneksi ke Apify API timeout. Periksa koneksi internet Anda atau coba lagi nanti."
+    elif "connection" in error_message.lower():
+        return "Gagal terhubung ke Apify API. Periksa koneksi internet Anda."
+    else:
+        # Provide more user-friendly error message
+        return f"Terjadi kesalahan saat scraping: {error_message}"
+
+
+# Declarative field map per platform for normalizing Apify items. Core fields (username, content,
+# url, created_at) take the first non-empty scalar among the paths ('a.b' reads a nested dict);
+# 'fields' copies a path under a new column name, 'metrics' copies fields that are not None,
+# optionally under a display alias, and 'url_from_id' builds a URL when the item has none.
+APIFY_RESULT_FIELD_MAP = {
+    'twitter': {
+        'username': ('author.userName', 'author.name', 'userName', 'user', 'screen_name', 'name'),
+        'content': ('text',),
+        'url': ('url',),
+        'created_at': ('createdAt',),
+        'url_from_id': ('id', 'https://twitter.com/i/web/status/{}'),
+        'fields': (('tweet_id', 'id'), ('tweet_url', 'url'), ('profile_picture', 'author.profilePicture')),
+        'metrics': (('retweetCount', 'retweets'), ('replyCount', 'replies'), ('likeCount', 'likes'),
+                    ('quoteCount', 'quotes'), ('viewCount', 'views'), ('bookmarkCount', 'bookmarks'),
+                    ('source', None), ('lang', 'language'), ('isReply', None), ('isQuote', None), ('isPinned', None))
+    },
+    'facebook': {
+        'username': ('authorName', 'author', 'user'),
+        'content': ('text', 'message'),
+        'url': ('url', 'link'),
+        'created_at': ('time', 'timestamp'),
+        'metrics': (('likes', None), ('comments', None), ('shares', None), ('reactions', None))
+    },
+    'instagram': {
+        'username': ('ownerUsername', 'username', 'owner'),
+        'content': ('caption', 'text', 'description'),
+        'url': ('url', 'shortcode', 'permalink'),
+        'created_at': ('timestamp', 'taken_at_timestamp', 'date'),
+        'metrics': (('likesCount', 'likes'), ('commentsCount', 'comments'), ('videoViewCount', 'views'))
+    },
+    'tiktok': {
+        'username': ('authorMeta.name', 'authorMeta.uniqueId', 'author', 'username', 'uniqueId'),
+        'content': ('text', 'desc', 'description'),
+        'url': ('webVideoUrl', 'videoUrl', 'url'),
+        'created_at': ('createTime', 'createTimeISO', 'timestamp'),
+        'metrics': (('diggCount', 'likes'), ('shareCount', 'shares'), ('commentCount', 'comments'), ('playCount', 'views'))
+    },
+    # Other platforms: common field names across actors
+    None: {
+        'username': ('username', 'user.userName', 'user.name', 'user.username', 'user',
+                     'author.userName', 'author.name', 'author.username', 'author', 'userName', 'ownerUsername',
+                     'authorMeta.userName', 'authorMeta.name', 'authorMeta.username', 'screen_name', 'name'),
+        'content': ('text', 'content', 'caption', 'full_text', 'description', 'message', 'body'),
+        'url': ('url', 'link', 'permalink', 'webVideoUrl', 'shortcode', 'post_url'),
+        'created_at': ('created_at', 'timestamp', 'time', 'createTime', 'date', 'published_at')
+    }
+}
+APIFY_RESULT_CORE_FIELDS = ('username', 'content', 'url', 'created_at')
+
+
+def _compile_apify_path(path):
+    """Getter untuk satu path field ('a' atau 'a.b' untuk dict bersarang), None jika tidak ada"""
+    if '.' not in path:
+        return lambda item: item.get(path)
+    
+    parent, child = path.split('.', 1)
+    
+    def get_nested(item):
+        value = item.get(parent)
+        return value.get(child) if isinstance(value, dict) else None
+    return get_nested
+
+
+def _compile_apify_first(paths):
+    """Getter nilai skalar tidak kosong pertama dari beberapa path sebagai string ('' jika tidak ada)"""
+    getters = tuple(_compile_apify_path(path) for path in paths)
+    
+    def get_first(item):
+        for getter in getters:
+            value = getter(item)
+            if value and not isinstance(value, (dict, list)):
+                return value if isinstance(value, str) else str(value)
+        return ''
+    return get_first
+
+
+def _compile_apify_normalizer(spec):
+    """
+    Susun fungsi normalisasi satu item Apify dari field map platform. Semua getter dibuat
+    sekali di sini sehingga per item hanya ada lookup dict dan satu dict hasil.
+    """
+    core_getters = tuple(_compile_apify_first(spec[field]) for field in APIFY_RESULT_CORE_FIELDS)
+    get_username, get_content, get_url, get_created_at = core_getters
+    field_getters = tuple((name, _compile_apify_path(path)) for name, path in spec.get('fields', ()))
+    metrics = spec.get('metrics', ())
+    url_from_id = spec.get('url_from_id')
+    
+    def normalize(item, platform):
+        url = get_url(item)
+        if not url and url_from_id:
+            item_id = item.get(url_from_id[0])
+            if item_id:
+                url = url_from_id[1].format(item_id)
+        
+        record = {
+            'platform': platform,
+            'username': get_username(item),
+            'content': get_content(item),
+            'url': url,
+            'created_at': get_created_at(item)
+        }
+        for name, getter in field_getters:
+            value = getter(item)
+            record[name] = '' if value is None else value
+        for api_field, alias in metrics:
+            value = item.get(api_field)
+            if value is not None:
+                record[api_field] = value
+                if alias:
+                    record[alias] = value
+        # Simpan semua data mentah untuk manual mapping
+        record['raw_data'] = item
+        return record
+    return normalize
+
+
+APIFY_RESULT_NORMALIZERS = {platform: _compile_apify_normalizer(spec) for platform, spec in APIFY_RESULT_FIELD_MAP.items()}
 
 
 def process_apify_results(raw_results, platform, max_results=None):
@@ -965,292 +1563,27 @@ def process_apify_results(raw_results, platform, max_results=None):
     Process raw Apify results - tampilkan semua data untuk manual mapping
     User akan melakukan manual mapping untuk username, content text, dan URL
     """
-    processed_data = []
-    
+    return list(iter_processed_apify_results(raw_results, platform, max_results))
+
+
+def iter_processed_apify_results(raw_results, platform, max_results=None):
+    """
+    Versi generator process_apify_results: raw_results boleh berupa iterator (mis. halaman
+    dataset Apify yang di-stream) dan setiap item diproses lalu di-yield satu per satu.
+    Field diambil lewat normalizer platform dari APIFY_RESULT_FIELD_MAP; username, content,
+    url dan created_at berisi nilai pertama yang ditemukan sebagai default mapping.
+    """
     # Batasi jumlah hasil jika max_results diberikan
-    if max_results and len(raw_results) > max_results:
-        raw_results = raw_results[:max_results]
+    if max_results:
+        raw_results = itertools.islice(raw_results, max_results)
     
+    normalize = APIFY_RESULT_NORMALIZERS.get(platform.lower(), APIFY_RESULT_NORMALIZERS[None])
     for item in raw_results:
         try:
-            # Tampilkan semua data yang dikembalikan dari Apify
-            # User akan melakukan manual mapping nanti
-            processed_item = {
-                'platform': platform,
-                'raw_data': item,  # Simpan semua data mentah
-                # Coba ekstrak field umum yang mungkin ada
-                'possible_username_fields': [],
-                'possible_content_fields': [],
-                'possible_url_fields': [],
-                'possible_date_fields': []
-            }
-            
-            # Platform-specific field mapping berdasarkan struktur Apify
-            if platform.lower() == 'twitter':
-                # Twitter fields berdasarkan dashboard Apify:
-                # Tweet ID: id, Tweet URL: url, Content: text, Created At: createdAt
-                # profilePicture: author.profilePicture, Retweets: retweetCount, dll.
-                
-                # Core Twitter fields
-                processed_item['tweet_id'] = item.get('id', '')
-                processed_item['tweet_url'] = item.get('url', '')
-                processed_item['content'] = item.get('text', '')
-                processed_item['created_at'] = item.get('createdAt', '')
-                
-                # Author information
-                if 'author' in item and isinstance(item['author'], dict):
-                    author = item['author']
-                    processed_item['username'] = author.get('userName', author.get('name', ''))
-                    processed_item['profile_picture'] = author.get('profilePicture', '')
-                    processed_item['possible_username_fields'].append(f"author.userName: {author.get('userName', '')}")
-                    processed_item['possible_username_fields'].append(f"author.name: {author.get('name', '')}")
-                else:
-                    # Fallback untuk username
-                    twitter_username_keys = ['userName', 'user', 'screen_name', 'name']
-                    for key in twitter_username_keys:
-                        if key in item and item[key]:
-                            processed_item['username'] = item[key]
-                            processed_item['possible_username_fields'].append(f"{key}: {item[key]}")
-                            break
-                
-                # Content fields untuk Twitter
-                if processed_item['content']:
-                    content_preview = str(processed_item['content'])[:100] + '...' if len(str(processed_item['content'])) > 100 else str(processed_item['content'])
-                    processed_item['possible_content_fields'].append(f"text: {content_preview}")
-                
-                # URL fields untuk Twitter
-                if processed_item['tweet_url']:
-                    processed_item['url'] = processed_item['tweet_url']
-                    processed_item['possible_url_fields'].append(f"url: {processed_item['tweet_url']}")
-                elif processed_item['tweet_id']:
-                    # Construct Twitter URL from ID if direct URL not available
-                    twitter_url = f"https://twitter.com/i/web/status/{processed_item['tweet_id']}"
-                    processed_item['url'] = twitter_url
-                    processed_item['possible_url_fields'].append(f"constructed_url: {twitter_url}")
-                
-                # Date fields untuk Twitter
-                if processed_item['created_at']:
-                    processed_item['possible_date_fields'].append(f"createdAt: {processed_item['created_at']}")
-                
-                # Engagement metrics
-                engagement_fields = {
-                    'retweetCount': 'retweets',
-                    'replyCount': 'replies', 
-                    'likeCount': 'likes',
-                    'quoteCount': 'quotes',
-                    'viewCount': 'views',
-                    'bookmarkCount': 'bookmarks'
-                }
-                for api_field, display_field in engagement_fields.items():
-                    if api_field in item and item[api_field] is not None:
-                        processed_item[api_field] = item[api_field]
-                        processed_item[display_field] = item[api_field]
-                
-                # Twitter metadata
-                metadata_fields = ['source', 'lang', 'isReply', 'isQuote', 'isPinned']
-                for field in metadata_fields:
-                    if field in item and item[field] is not None:
-                        processed_item[field] = item[field]
-                
-                # Set language display
-                if 'lang' in processed_item:
-                    processed_item['language'] = processed_item['lang']
-                        
-            elif platform.lower() == 'facebook':
-                # Facebook-specific field mapping
-                # Facebook Scraper biasanya mengembalikan: text, url, time, authorName, etc.
-                
-                # Core Facebook fields
-                processed_item['content'] = item.get('text', item.get('message', ''))
-                processed_item['url'] = item.get('url', item.get('link', ''))
-                processed_item['created_at'] = item.get('time', item.get('timestamp', ''))
-                
-                # Author information
-                processed_item['username'] = item.get('authorName', item.get('author', item.get('user', '')))
-                
-                # Content fields untuk Facebook
-                if processed_item['content']:
-                    content_preview = str(processed_item['content'])[:100] + '...' if len(str(processed_item['content'])) > 100 else str(processed_item['content'])
-                    processed_item['possible_content_fields'].append(f"text: {content_preview}")
-                
-                # URL fields untuk Facebook
-                if processed_item['url']:
-                    processed_item['possible_url_fields'].append(f"url: {processed_item['url']}")
-                
-                # Username fields untuk Facebook
-                if processed_item['username']:
-                    processed_item['possible_username_fields'].append(f"authorName: {processed_item['username']}")
-                
-                # Date fields untuk Facebook
-                if processed_item['created_at']:
-                    processed_item['possible_date_fields'].append(f"time: {processed_item['created_at']}")
-                
-                # Engagement metrics untuk Facebook
-                engagement_fields = {
-                    'likes': 'likes',
-                    'comments': 'comments',
-                    'shares': 'shares',
-                    'reactions': 'reactions'
-                }
-                for api_field, display_field in engagement_fields.items():
-                    if api_field in item and item[api_field] is not None:
-                        processed_item[api_field] = item[api_field]
-                        processed_item[display_field] = item[api_field]
-                        
-            elif platform.lower() == 'instagram':
-                # Instagram-specific field mapping
-                # Instagram Scraper biasanya mengembalikan: caption, url, timestamp, ownerUsername, etc.
-                
-                # Core Instagram fields
-                processed_item['content'] = item.get('caption', item.get('text', item.get('description', '')))
-                processed_item['url'] = item.get('url', item.get('shortcode', item.get('permalink', '')))
-                processed_item['created_at'] = item.get('timestamp', item.get('taken_at_timestamp', item.get('date', '')))
-                
-                # Author information - Instagram biasanya menggunakan ownerUsername
-                processed_item['username'] = item.get('ownerUsername', item.get('username', item.get('owner', '')))
-                
-                # Content fields untuk Instagram
-                if processed_item['content']:
-                    content_preview = str(processed_item['content'])[:100] + '...' if len(str(processed_item['content'])) > 100 else str(processed_item['content'])
-                    processed_item['possible_content_fields'].append(f"caption: {content_preview}")
-                
-                # URL fields untuk Instagram
-                if processed_item['url']:
-                    processed_item['possible_url_fields'].append(f"url: {processed_item['url']}")
-                
-                # Username fields untuk Instagram
-                if processed_item['username']:
-                    processed_item['possible_username_fields'].append(f"ownerUsername: {processed_item['username']}")
-                
-                # Date fields untuk Instagram
-                if processed_item['created_at']:
-                    processed_item['possible_date_fields'].append(f"timestamp: {processed_item['created_at']}")
-                
-                # Engagement metrics untuk Instagram
-                engagement_fields = {
-                    'likesCount': 'likes',
-                    'commentsCount': 'comments',
-                    'videoViewCount': 'views'
-                }
-                for api_field, display_field in engagement_fields.items():
-                    if api_field in item and item[api_field] is not None:
-                        processed_item[api_field] = item[api_field]
-                        processed_item[display_field] = item[api_field]
-                        
-            elif platform.lower() == 'tiktok':
-                # TikTok-specific field mapping
-                # TikTok Scraper biasanya mengembalikan: text, webVideoUrl, createTime, authorMeta, etc.
-                
-                # Core TikTok fields
-                processed_item['content'] = item.get('text', item.get('desc', item.get('description', '')))
-                processed_item['url'] = item.get('webVideoUrl', item.get('videoUrl', item.get('url', '')))
-                processed_item['created_at'] = item.get('createTime', item.get('createTimeISO', item.get('timestamp', '')))
-                
-                # Author information - TikTok biasanya menggunakan authorMeta
-                if 'authorMeta' in item and isinstance(item['authorMeta'], dict):
-                    author_meta = item['authorMeta']
-                    processed_item['username'] = author_meta.get('name', author_meta.get('uniqueId', ''))
-                    processed_item['possible_username_fields'].append(f"authorMeta.name: {author_meta.get('name', '')}")
-                    processed_item['possible_username_fields'].append(f"authorMeta.uniqueId: {author_meta.get('uniqueId', '')}")
-                else:
-                    # Fallback untuk username
-                    processed_item['username'] = item.get('author', item.get('username', item.get('uniqueId', '')))
-                
-                # Content fields untuk TikTok
-                if processed_item['content']:
-                    content_preview = str(processed_item['content'])[:100] + '...' if len(str(processed_item['content'])) > 100 else str(processed_item['content'])
-                    processed_item['possible_content_fields'].append(f"text: {content_preview}")
-                
-                # URL fields untuk TikTok
-                if processed_item['url']:
-                    processed_item['possible_url_fields'].append(f"webVideoUrl: {processed_item['url']}")
-                
-                # Username fields untuk TikTok
-                if processed_item['username']:
-                    processed_item['possible_username_fields'].append(f"authorMeta.name: {processed_item['username']}")
-                
-                # Date fields untuk TikTok
-                if processed_item['created_at']:
-                    processed_item['possible_date_fields'].append(f"createTime: {processed_item['created_at']}")
-                
-                # Engagement metrics untuk TikTok
-                engagement_fields = {
-                    'diggCount': 'likes',
-                    'shareCount': 'shares',
-                    'commentCount': 'comments',
-                    'playCount': 'views'
-                }
-                for api_field, display_field in engagement_fields.items():
-                    if api_field in item and item[api_field] is not None:
-                        processed_item[api_field] = item[api_field]
-                        processed_item[display_field] = item[api_field]
-                
-            else:
-                # Generic field identification untuk platform lain
-                username_keys = ['username', 'user', 'author', 'userName', 'ownerUsername', 'authorMeta', 'screen_name', 'name']
-                for key in username_keys:
-                    if key in item and item[key]:
-                        if isinstance(item[key], dict):
-                            # Jika nested object, cari di dalamnya
-                            for nested_key in ['userName', 'name', 'username']:
-                                if nested_key in item[key] and item[key][nested_key]:
-                                    processed_item['possible_username_fields'].append(f"{key}.{nested_key}: {item[key][nested_key]}")
-                        else:
-                            processed_item['possible_username_fields'].append(f"{key}: {item[key]}")
-                
-                # Identifikasi field yang mungkin berisi content/text
-                content_keys = ['text', 'content', 'caption', 'full_text', 'description', 'message', 'body']
-                for key in content_keys:
-                    if key in item and item[key]:
-                        content_preview = str(item[key])[:100] + '...' if len(str(item[key])) > 100 else str(item[key])
-                        processed_item['possible_content_fields'].append(f"{key}: {content_preview}")
-                
-                # Identifikasi field yang mungkin berisi URL
-                url_keys = ['url', 'link', 'permalink', 'webVideoUrl', 'shortcode', 'post_url']
-                for key in url_keys:
-                    if key in item and item[key]:
-                        processed_item['possible_url_fields'].append(f"{key}: {item[key]}")
-                
-                # Identifikasi field yang mungkin berisi tanggal
-                date_keys = ['created_at', 'timestamp', 'time', 'createTime', 'date', 'published_at']
-                for key in date_keys:
-                    if key in item and item[key]:
-                        processed_item['possible_date_fields'].append(f"{key}: {item[key]}")
-            
-            # Tambahkan field standar untuk kompatibilitas dengan sistem yang ada
-            # Gunakan field pertama yang ditemukan sebagai default
-            processed_item['username'] = ''
-            processed_item['content'] = ''
-            processed_item['url'] = ''
-            processed_item['created_at'] = ''
-            
-            # Coba set default values dari field yang teridentifikasi
-            if processed_item['possible_username_fields']:
-                first_username = processed_item['possible_username_fields'][0].split(': ', 1)[1]
-                processed_item['username'] = first_username
-            
-            if processed_item['possible_content_fields']:
-                first_content = processed_item['possible_content_fields'][0].split(': ', 1)[1]
-                processed_item['content'] = first_content.replace('...', '')  # Hapus truncation
-                # Ambil content penuh dari raw data
-                content_key = processed_item['possible_content_fields'][0].split(': ', 1)[0]
-                if content_key in item:
-                    processed_item['content'] = str(item[content_key])
-            
-            if processed_item['possible_url_fields']:
-                first_url = processed_item['possible_url_fields'][0].split(': ', 1)[1]
-                processed_item['url'] = first_url
-            
-            if processed_item['possible_date_fields']:
-                first_date = processed_item['possible_date_fields'][0].split(': ', 1)[1]
-                processed_item['created_at'] = first_date
-            
-            processed_data.append(processed_item)
-            
+            yield normalize(item, platform)
         except Exception as e:
-            pass
             # Tetap simpan item meskipun ada error
-            processed_data.append({
+            yield {
                 'platform': platform,
                 'raw_data': item,
                 'error': str(e),
@@ -1258,10 +1591,7 @@ def process_apify_results(raw_results, platform, max_results=None):
                 'content': '',
                 'url': '',
                 'created_at': ''
-            })
-            continue
-    
-    return processed_data
+            }
 
 
 # Fungsi scraper lama telah diganti dengan implementasi yang lebih baik di atas